@@ -0,0 +1,87 @@
+"""Micro-benchmark: token-exchange key generation cost per algorithm.
+
+Times private key generation (including PKCS8 PEM serialization, as done by
+``govctl.generators.keys``) and the runtime sign/verify cost of each key
+type. Run from the govctl/ directory:
+
+    python benchmarks/keygen.py [--rounds N]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, padding, rsa
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from govctl.core.models import KEY_ALGORITHM_TO_JWS, KeyAlgorithm  # noqa: E402
+from govctl.generators.keys import generate_private_key  # noqa: E402
+
+PAYLOAD = b"header.payload" * 16
+
+
+def _sign(key, data: bytes) -> bytes:
+    if isinstance(key, rsa.RSAPrivateKey):
+        return key.sign(data, padding.PKCS1v15(), hashes.SHA256())
+    if isinstance(key, ec.EllipticCurvePrivateKey):
+        return key.sign(data, ec.ECDSA(hashes.SHA256()))
+    return key.sign(data)
+
+
+def _verify(public_key, signature: bytes, data: bytes) -> None:
+    if isinstance(public_key, rsa.RSAPublicKey):
+        public_key.verify(signature, data, padding.PKCS1v15(), hashes.SHA256())
+    elif isinstance(public_key, ec.EllipticCurvePublicKey):
+        public_key.verify(signature, data, ec.ECDSA(hashes.SHA256()))
+    elif isinstance(public_key, ed25519.Ed25519PublicKey):
+        public_key.verify(signature, data)
+
+
+def _median_ms(fn, rounds: int) -> float:
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=20, help="Samples per timing")
+    args = parser.parse_args()
+
+    rows = []
+    for algorithm in KeyAlgorithm:
+        keygen_ms = _median_ms(lambda: generate_private_key(algorithm), args.rounds)
+
+        key = serialization.load_pem_private_key(
+            generate_private_key(algorithm).encode(), password=None
+        )
+        signature = _sign(key, PAYLOAD)
+        public_key = key.public_key()
+        sign_ms = _median_ms(lambda: _sign(key, PAYLOAD), args.rounds * 10)
+        verify_ms = _median_ms(
+            lambda: _verify(public_key, signature, PAYLOAD), args.rounds * 10
+        )
+        rows.append((algorithm, keygen_ms, sign_ms, verify_ms))
+
+    baseline = rows[0][1]
+    print(
+        f"{'algorithm':<10} {'jws':<6} {'keygen ms':>10} {'vs rsa-2048':>12} "
+        f"{'sign ms':>9} {'verify ms':>10}"
+    )
+    for algorithm, keygen_ms, sign_ms, verify_ms in rows:
+        print(
+            f"{algorithm.value:<10} {KEY_ALGORITHM_TO_JWS[algorithm]:<6} "
+            f"{keygen_ms:>10.3f} {keygen_ms / baseline:>11.3f}x "
+            f"{sign_ms:>9.4f} {verify_ms:>10.4f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
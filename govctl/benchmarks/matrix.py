@@ -0,0 +1,320 @@
+"""Benchmark suite: every generator across the full configuration matrix.
+
+For each cloud x auth x database x key-management combination, times the
+phases of a run separately:
+
+- keygen: token-exchange key generation (Keycloak only)
+- build: building the values, secrets and bootstrap data
+- emit: YAML emission of that data
+- init: end-to-end ``govctl init --no-interactive`` via click's CliRunner
+  (which has no key-management option, so it uses the default provider).
+  Keycloak runs use an ec-p256 key so that RSA keygen time, which varies
+  widely from run to run, does not drown out the rest of the command.
+
+Medians are compared against a JSON baseline, and the run fails when any
+combination's build, emit or init time regresses past the threshold. Keygen
+is reported but not gated, as key generation time is inherently random. Run
+from the govctl/ directory:
+
+    python benchmarks/matrix.py --save-baseline   # record benchmarks/baseline.json
+    python benchmarks/matrix.py                   # compare against it
+
+The committed baseline.json is compared against in CI; re-record it with
+``--save-baseline`` when a change deliberately alters these timings. A
+missing baseline fails the run.
+"""
+
+import argparse
+import gc
+import io
+import itertools
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+import yaml
+from click.testing import CliRunner
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from govctl.cli.commands.init import init_cmd  # noqa: E402
+from govctl.core.models import (  # noqa: E402
+    AuthProvider,
+    CloudProvider,
+    DatabaseMode,
+    KeyManagementProvider,
+    PlatformConfig,
+)
+from govctl.generators.auth0_bootstrap import (  # noqa: E402
+    generate_auth0_bootstrap_data,
+)
+from govctl.generators.entra_bootstrap import (  # noqa: E402
+    generate_entra_bootstrap_data,
+)
+from govctl.generators.keycloak_bootstrap import (  # noqa: E402
+    generate_keycloak_bootstrap_data,
+)
+from govctl.generators.keys import generate_private_key  # noqa: E402
+from govctl.generators.secrets import _generate_secrets_section  # noqa: E402
+from govctl.generators.values import sections_for  # noqa: E402
+from govctl.utils.yaml import (  # noqa: E402
+    _CommentDumper,
+    write_yaml_sections,
+    write_yaml_with_header,
+)
+
+DEFAULT_BASELINE = Path(__file__).resolve().parent / "baseline.json"
+
+# Phases compared against the baseline
+GATED_PHASES = (
+    "values_build",
+    "values_emit",
+    "secrets_build",
+    "secrets_emit",
+    "bootstrap_build",
+    "bootstrap_emit",
+    "init",
+)
+
+BOOTSTRAP_DATA: dict[AuthProvider, Callable[[PlatformConfig], dict[str, Any]]] = {
+    AuthProvider.AUTH0: generate_auth0_bootstrap_data,
+    AuthProvider.ENTRA: generate_entra_bootstrap_data,
+    AuthProvider.KEYCLOAK: generate_keycloak_bootstrap_data,
+}
+
+
+def _median_ms(fn: Callable[[], Any], rounds: int) -> float:
+    fn()  # warm-up
+    samples = []
+    # Like timeit, keep garbage collection pauses out of the samples
+    gc.disable()
+    try:
+        for _ in range(rounds):
+            start = time.perf_counter()
+            fn()
+            samples.append((time.perf_counter() - start) * 1000)
+    finally:
+        gc.enable()
+    return statistics.median(samples)
+
+
+def _combo_name(config: PlatformConfig) -> str:
+    return (
+        f"{config.cloud_provider.value}/{config.auth_provider.value}/"
+        f"{config.database_mode.value}/{config.key_management_provider.value}"
+    )
+
+
+def _run_init(config: PlatformConfig, output_dir: str) -> None:
+    result = CliRunner().invoke(
+        init_cmd,
+        [
+            "--no-interactive",
+            "--cloud",
+            config.cloud_provider.value,
+            "--domain",
+            config.domain,
+            "--environment",
+            config.environment,
+            "--auth",
+            config.auth_provider.value,
+            "--database",
+            config.database_mode.value,
+            "--output",
+            output_dir,
+            *(
+                ["--key-algorithm", "ec-p256"]
+                if config.auth_provider == AuthProvider.KEYCLOAK
+                else []
+            ),
+        ],
+    )
+    if result.exit_code != 0:
+        raise RuntimeError(f"govctl init failed: {result.output}") from (
+            result.exception
+        )
+
+
+def _bench_combo(
+    config: PlatformConfig, rounds: int, output_dir: str
+) -> dict[str, float]:
+    timings: dict[str, float] = {}
+
+    # A ready-made key lets the secrets build phase run without keygen
+    existing = None
+    if config.auth_provider == AuthProvider.KEYCLOAK:
+        algorithm = config.keycloak.token_exchange_key_algorithm
+        timings["keygen"] = _median_ms(lambda: generate_private_key(algorithm), rounds)
+        existing = {
+            "auth": {
+                "keycloak": {
+                    "values": {
+                        "tokenExchangePrivateKey": generate_private_key(algorithm)
+                    }
+                }
+            }
+        }
+    else:
+        timings["keygen"] = 0.0
+
+    sections = _build_sections(config)
+    timings["values_build"] = _median_ms(lambda: _build_sections(config), rounds)
+    timings["values_emit"] = _median_ms(
+        lambda: write_yaml_sections(sections, io.StringIO()), rounds
+    )
+
+    secrets = {"global": {"secrets": _generate_secrets_section(config, existing)}}
+    timings["secrets_build"] = _median_ms(
+        lambda: _generate_secrets_section(config, existing), rounds
+    )
+    timings["secrets_emit"] = _median_ms(
+        lambda: write_yaml_with_header(
+            secrets, "secrets", config, io.StringIO(), dumper=_CommentDumper
+        ),
+        rounds,
+    )
+
+    build_bootstrap = BOOTSTRAP_DATA[config.auth_provider]
+    bootstrap = build_bootstrap(config)
+    timings["bootstrap_build"] = _median_ms(lambda: build_bootstrap(config), rounds)
+    timings["bootstrap_emit"] = _median_ms(
+        lambda: write_yaml_with_header(bootstrap, "bootstrap", config, io.StringIO()),
+        rounds,
+    )
+
+    timings["init"] = _median_ms(lambda: _run_init(config, output_dir), rounds)
+    return timings
+
+
+def _build_sections(
+    config: PlatformConfig,
+) -> list[tuple[str, str, str, dict[str, Any]]]:
+    """(key, title, description, data) of each values.yaml section, uncached."""
+    return [
+        (section.key, section.title, section.description, section.generate(config))
+        for section in sections_for(config)
+    ]
+
+
+def _regressions(
+    current: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    threshold: float,
+    min_delta_ms: float,
+) -> list[str]:
+    """Describe every gated phase slower than baseline by more than the threshold.
+
+    Differences below ``min_delta_ms`` are ignored, as sub-millisecond phases
+    are dominated by timer noise.
+    """
+    regressions = []
+    for combo, timings in current.items():
+        for phase in GATED_PHASES:
+            base = baseline.get(combo, {}).get(phase)
+            if base is None:
+                continue
+            now = timings[phase]
+            if now > base * (1 + threshold) and now - base > min_delta_ms:
+                regressions.append(
+                    f"{combo} {phase}: {now:.2f} ms vs {base:.2f} ms baseline "
+                    f"(+{(now / base - 1) * 100 if base else float('inf'):.0f}%)"
+                )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=7, help="Samples per timing")
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        default=DEFAULT_BASELINE,
+        help=f"Baseline JSON file (default: {DEFAULT_BASELINE.name})",
+    )
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="Write this run's timings to the baseline file instead of comparing",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.5,
+        help="Allowed slowdown as a fraction of the baseline (default: 0.5)",
+    )
+    parser.add_argument(
+        "--min-delta-ms",
+        type=float,
+        default=1.0,
+        help="Ignore slowdowns smaller than this many ms (default: 1.0)",
+    )
+    args = parser.parse_args()
+
+    configs = [
+        PlatformConfig(
+            cloud_provider=cloud,
+            domain="governance.example.com",
+            environment="staging",
+            auth_provider=auth,
+            database_mode=database,
+            key_management_provider=key_management,
+        )
+        for cloud, auth, database, key_management in itertools.product(
+            CloudProvider, AuthProvider, DatabaseMode, KeyManagementProvider
+        )
+    ]
+
+    current: dict[str, dict[str, float]] = {}
+    with tempfile.TemporaryDirectory() as output_dir:
+        for config in configs:
+            current[_combo_name(config)] = _bench_combo(config, args.rounds, output_dir)
+
+    phases = ["keygen", *GATED_PHASES]
+    print(f"{'combination':<36}" + "".join(f"{phase:>16}" for phase in phases))
+    for combo, timings in current.items():
+        print(f"{combo:<36}" + "".join(f"{timings[phase]:>16.2f}" for phase in phases))
+    print(
+        f"{'total (ms)':<36}"
+        + "".join(
+            f"{sum(timings[phase] for timings in current.values()):>16.2f}"
+            for phase in phases
+        )
+    )
+
+    if args.save_baseline:
+        args.baseline.write_text(
+            json.dumps(
+                {
+                    "python": platform.python_version(),
+                    "libyaml": yaml.__with_libyaml__,
+                    "rounds": args.rounds,
+                    "timings": current,
+                },
+                indent=2,
+            )
+            + "\n"
+        )
+        print(f"\nBaseline written to {args.baseline}")
+        return
+
+    if not args.baseline.exists():
+        # A gate without a baseline would pass every run
+        sys.exit(f"\nNo baseline at {args.baseline}; run with --save-baseline first")
+
+    baseline = json.loads(args.baseline.read_text())["timings"]
+    regressions = _regressions(current, baseline, args.threshold, args.min_delta_ms)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) past {args.threshold:.0%}:")
+        for regression in regressions:
+            print(f"  {regression}")
+        sys.exit(1)
+    print(f"\nNo regressions past {args.threshold:.0%} against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
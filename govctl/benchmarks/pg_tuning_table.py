@@ -0,0 +1,61 @@
+"""PostgreSQL tuning table: the derived settings per sizing tier.
+
+Prints the postgresql.conf settings that ``core/pg_tuning.py`` derives for
+the bundled primary of each sizing tier (and of an unsized configuration),
+with and without PgBouncer. The expected settings, the memory and connection
+budgets and the generated values are checked by ``tests/test_pg_tuning.py``.
+Run from the govctl/ directory:
+
+    python benchmarks/pg_tuning_table.py
+"""
+
+import dataclasses
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from govctl.core.models import (  # noqa: E402
+    AuthProvider,
+    CloudProvider,
+    PlatformConfig,
+    SizingConfig,
+    SizingTier,
+)
+from govctl.core.pg_tuning import postgresql_tuning  # noqa: E402
+
+BASE = PlatformConfig(
+    cloud_provider=CloudProvider.GCP,
+    domain="governance.example.com",
+    environment="staging",
+    auth_provider=AuthProvider.KEYCLOAK,
+)
+
+SHOWN = (
+    "max_connections",
+    "shared_buffers",
+    "effective_cache_size",
+    "work_mem",
+    "maintenance_work_mem",
+    "max_wal_size",
+)
+
+
+def main() -> None:
+    header = f"{'tier':<8}{'pooler':<8}" + "".join(f"{n:>{len(n) + 2}}" for n in SHOWN)
+    print(header)
+    print("-" * len(header))
+    for tier in (None, *SizingTier):
+        for pooled in (False, True):
+            config = dataclasses.replace(
+                BASE, enable_pgbouncer=pooled, sizing=SizingConfig(tier=tier)
+            )
+            settings = postgresql_tuning(config).settings()
+            print(
+                f"{tier.value if tier else '-':<8}{'yes' if pooled else 'no':<8}"
+                + "".join(f"{settings[n]:>{len(n) + 2}}" for n in SHOWN)
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Sizing table: what each named tier derives.
+
+Prints the replicas, HPA bounds and per-pod resources that each named tier
+derives for every service (and the bundled PostgreSQL primary). The expected
+table and the sizing invariants are checked by ``tests/test_sizing.py``. Run
+from the govctl/ directory:
+
+    python benchmarks/sizing_table.py
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from govctl.core.sizing import (  # noqa: E402
+    POSTGRESQL_RESOURCES,
+    SERVICE_RULES,
+    TIER_LOADS,
+    postgresql_storage_gb,
+    size_service,
+)
+
+
+def main() -> None:
+    header = (
+        f"{'tier':<8}{'service':<20}{'replicas':>9}{'max':>5}  "
+        f"{'requests':<16}{'limits':<16}"
+    )
+    print(header)
+    print("-" * len(header))
+    for tier, load in TIER_LOADS.items():
+        for service in SERVICE_RULES:
+            sizing = size_service(service, load)
+            r = sizing.resources
+            print(
+                f"{tier.value:<8}{service:<20}{sizing.replicas:>9}"
+                f"{sizing.max_replicas:>5}  "
+                f"{r.cpu_request + '/' + r.memory_request:<16}"
+                f"{r.cpu_limit + '/' + r.memory_limit:<16}"
+            )
+        r = POSTGRESQL_RESOURCES[tier]
+        print(
+            f"{tier.value:<8}{'postgresql':<20}{1:>9}{'-':>5}  "
+            f"{r.cpu_request + '/' + r.memory_request:<16}"
+            f"{r.cpu_limit + '/' + r.memory_limit:<16}"
+            f"{postgresql_storage_gb(load)}Gi"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""Micro-benchmark: YAML emission backends.
+
+For every combination of cloud, auth, database, and key management provider,
+times emitting the values and bootstrap files with libyaml's C emitter
+against the pure-Python emitter, and emitting secrets files with
+``# REQUIRED:`` comments written during emission against the previous
+approach of dumping ``__REQUIRED__`` marker strings and rewriting them in a
+second regex pass. That both paths give byte-identical output is checked by
+``tests/test_yaml_emit.py``. Run from the govctl/ directory:
+
+    python benchmarks/yaml_emit.py [--rounds N]
+"""
+
+import argparse
+import itertools
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from govctl.core.models import (  # noqa: E402
+    AuthProvider,
+    CloudProvider,
+    DatabaseMode,
+    KeyManagementProvider,
+    PlatformConfig,
+)
+from govctl.generators.values import (  # noqa: E402
+    fragment_cache_clear,
+    generate_values,
+)
+from govctl.generators.outputs import generate_bootstrap  # noqa: E402
+from govctl.generators.secrets import _generate_secrets_section  # noqa: E402
+from govctl.utils import yaml as yaml_utils  # noqa: E402
+
+
+def _configs() -> list[PlatformConfig]:
+    return [
+        PlatformConfig(
+            cloud_provider=cloud,
+            domain="governance.example.com",
+            environment="staging",
+            auth_provider=auth,
+            database_mode=database,
+            key_management_provider=key_management,
+        )
+        for cloud, auth, database, key_management in itertools.product(
+            CloudProvider, AuthProvider, DatabaseMode, KeyManagementProvider
+        )
+    ]
+
+
+def _render_with(dumper: type, config: PlatformConfig) -> list[str]:
+    """Render values and bootstrap files with the given default dumper."""
+    fast_dumper = yaml_utils._FastDumper
+    yaml_utils._FastDumper = dumper
+    # Cached fragments would have been emitted by the other dumper
+    fragment_cache_clear()
+    try:
+        return [generate_values(config), generate_bootstrap(config) or ""]
+    finally:
+        yaml_utils._FastDumper = fast_dumper
+
+
+def _to_legacy_markers(data: Any) -> Any:
+    if isinstance(data, dict):
+        return {key: _to_legacy_markers(value) for key, value in data.items()}
+    if isinstance(data, yaml_utils._RequiredStr):
+        return f"__REQUIRED__{data}"
+    return data
+
+
+def _legacy_secrets(data: dict[str, Any]) -> str:
+    """Secrets emission as done before: dump marker strings, then regex them."""
+    yaml_str = yaml_utils.dump_yaml(
+        _to_legacy_markers(data), dumper=yaml_utils._CommentDumper
+    )
+    return re.sub(
+        r"(?<=: )'?__REQUIRED__(.+?)'?$",
+        r"''  # REQUIRED: \1",
+        yaml_str,
+        flags=re.M,
+    )
+
+
+def _comment_secrets(data: dict[str, Any]) -> str:
+    return yaml_utils.dump_yaml(data, dumper=yaml_utils._CommentDumper)
+
+
+def _median_ms(fn, rounds: int) -> float:
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=20, help="Samples per timing")
+    args = parser.parse_args()
+
+    configs = _configs()
+    secrets_data = [
+        {"global": {"secrets": _generate_secrets_section(config)}} for config in configs
+    ]
+
+    print(f"libyaml available: {yaml.__with_libyaml__}")
+    timings = [
+        (
+            "values+bootstrap (python)",
+            lambda: [_render_with(yaml_utils._CommentDumper, c) for c in configs],
+        ),
+        (
+            "values+bootstrap (default)",
+            lambda: [_render_with(yaml_utils._FastDumper, c) for c in configs],
+        ),
+        ("secrets (regex pass)", lambda: [_legacy_secrets(d) for d in secrets_data]),
+        (
+            "secrets (emitter comments)",
+            lambda: [_comment_secrets(d) for d in secrets_data],
+        ),
+    ]
+    print(f"{'path':<28} {'ms / matrix':>12}")
+    for label, fn in timings:
+        print(f"{label:<28} {_median_ms(fn, args.rounds):>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
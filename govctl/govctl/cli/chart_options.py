@@ -0,0 +1,66 @@
+"""Options shared by the commands that read the charts and helm -f files."""
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable
+
+import click
+
+if TYPE_CHECKING:
+    from govctl.core.charts import Chart
+
+
+def chart_options(command: Callable[..., Any]) -> Callable[..., Any]:
+    """Add ``--values/-f`` (as ``values_files``) and ``--chart`` to a command."""
+    command = click.option(
+        "--chart",
+        type=click.Path(exists=True),
+        default=None,
+        help="Umbrella chart directory or .tgz "
+        "(default: charts/governance-platform in this or a parent directory)",
+    )(command)
+    return click.option(
+        "--values",
+        "-f",
+        "values_files",
+        multiple=True,
+        required=True,
+        type=click.Path(exists=True, dir_okay=False, allow_dash=True),
+        help="Values file, as passed to helm -f (repeatable; later files win)",
+    )(command)
+
+
+def load_release(
+    values_files: tuple[str, ...], chart: str | None
+) -> tuple["Chart", list[dict[str, Any]]]:
+    """Load the umbrella chart and the parsed values files.
+
+    Raises:
+        click.UsageError: If the chart cannot be found or a file cannot be read.
+        click.ClickException: If the chart cannot be loaded.
+    """
+    import yaml
+
+    from govctl.core.charts import find_umbrella_chart, load_chart
+
+    chart_path = Path(chart) if chart else find_umbrella_chart(Path.cwd())
+    if chart_path is None:
+        raise click.UsageError(
+            "No charts/governance-platform found here or in a parent directory; "
+            "pass --chart"
+        )
+
+    layers = []
+    for values_file in values_files:
+        try:
+            with click.open_file(values_file) as f:
+                data = yaml.safe_load(f) or {}
+        except (OSError, yaml.YAMLError) as e:
+            raise click.UsageError(f"Cannot read {values_file}: {e}")
+        if not isinstance(data, dict):
+            raise click.UsageError(f"{values_file} is not a YAML mapping")
+        layers.append(data)
+
+    try:
+        return load_chart(chart_path), layers
+    except (OSError, ValueError) as e:
+        raise click.ClickException(str(e))
@@ -0,0 +1,117 @@
+"""Decrypt command for govctl."""
+
+import os
+import sys
+import time
+from pathlib import Path
+
+import click
+
+# Only click is imported at module level so that `govctl --help` stays fast;
+# cryptography and rich are imported when the command runs.
+
+
+@click.command("decrypt")
+@click.argument("paths", nargs=-1, required=True, type=click.Path(exists=True))
+@click.option(
+    "--key",
+    "-k",
+    "key_path",
+    required=True,
+    type=click.Path(exists=True, dir_okay=False),
+    envvar="GOVCTL_DECRYPT_KEY",
+    help="RSA private key (PEM) matching the --encrypt-to public key",
+)
+@click.option(
+    "--stdout",
+    "to_stdout",
+    is_flag=True,
+    help="Write the decrypted files to stdout as one multi-document YAML stream "
+    "instead of next to the encrypted files",
+)
+@click.pass_context
+def decrypt_cmd(
+    ctx: click.Context, paths: tuple[str, ...], key_path: str, to_stdout: bool
+):
+    """Decrypt secrets files encrypted with --encrypt-to.
+
+    PATHS are .enc files, or directories that are searched for them (e.g. a
+    whole fleet output directory). Each secrets-<env>.yaml.enc is decrypted
+    to secrets-<env>.yaml next to it, readable by the current user only.
+    Files encrypted in the same run share a data key, which is only unwrapped
+    once.
+
+    Examples:
+
+        govctl decrypt output/secrets-staging.yaml.enc -k ops.pem
+
+        # Every environment of a fleet
+        govctl decrypt fleet-output/ -k ops.pem
+
+        # Straight into helm, without writing plaintext to disk
+        govctl decrypt output/secrets-staging.yaml.enc -k ops.pem --stdout | helm upgrade ... -f -
+    """
+    from govctl.utils.envelope import (
+        ENCRYPTED_SUFFIX,
+        Decrypter,
+        EnvelopeError,
+        load_private_key,
+    )
+    from govctl.utils.output import console
+
+    if to_stdout:
+        console.stderr = True
+
+    files: list[Path] = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            files.extend(sorted(path.rglob(f"*{ENCRYPTED_SUFFIX}")))
+        else:
+            files.append(path)
+    if not files:
+        raise click.UsageError(f"No {ENCRYPTED_SUFFIX} files found")
+
+    try:
+        try:
+            private_key = load_private_key(key_path)
+        except TypeError:  # encrypted key
+            password = click.prompt(
+                "Private key password", hide_input=True, err=True
+            ).encode()
+            private_key = load_private_key(key_path, password)
+    except (OSError, EnvelopeError) as e:
+        raise click.BadParameter(str(e), param_hint="--key")
+
+    decrypter = Decrypter(private_key)
+    start = time.perf_counter()
+    failed = 0
+    for path in files:
+        try:
+            with open(path, "rb") as f:
+                plaintext = decrypter.decrypt(f)
+        except (OSError, EnvelopeError) as e:
+            console.print(f"[red]{path}: {e}[/red]")
+            failed += 1
+            continue
+
+        name = path.name.removesuffix(ENCRYPTED_SUFFIX)
+        if to_stdout:
+            sys.stdout.write(f"---\n# Source: {path.parent / name}\n")
+            sys.stdout.flush()
+            sys.stdout.buffer.write(plaintext)
+            continue
+        target = path.with_name(name)
+        fd = os.open(target, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        os.fchmod(fd, 0o600)  # if it already existed
+        with os.fdopen(fd, "wb") as f:
+            f.write(plaintext)
+        console.print(f"  [cyan]{target}[/cyan]")
+    sys.stdout.flush()
+
+    elapsed = time.perf_counter() - start
+    console.print(
+        f"[bold green]Decrypted {len(files) - failed}/{len(files)} file(s) "
+        f"in {elapsed:.2f}s[/bold green]"
+    )
+    if failed:
+        ctx.exit(1)
@@ -0,0 +1,189 @@
+"""Diff command for govctl."""
+
+import time
+from pathlib import Path
+
+import click
+
+# Only click is imported at module level so that `govctl --help` stays fast;
+# the generators and rich are imported when the command runs.
+
+
+@click.command("diff")
+@click.option(
+    "--fleet",
+    "manifest",
+    type=click.Path(exists=True, dir_okay=False),
+    help="Fleet manifest; diffs every environment in <output>/<name>/",
+)
+@click.option(
+    "--cloud",
+    "-c",
+    type=click.Choice(["aws", "azure", "gcp"], case_sensitive=False),
+    help="Cloud provider",
+)
+@click.option("--domain", "-d", help="Domain name (e.g., governance.example.com)")
+@click.option(
+    "--environment",
+    "-e",
+    help="Environment name (e.g., development, staging, production)",
+)
+@click.option(
+    "--auth",
+    "-a",
+    type=click.Choice(["auth0", "entra", "keycloak"], case_sensitive=False),
+    help="Authentication provider",
+)
+@click.option(
+    "--database",
+    "-D",
+    type=click.Choice(["bundled", "external"], case_sensitive=False),
+    help="Database mode (default: external for production, bundled otherwise)",
+)
+@click.option(
+    "--key-algorithm",
+    "-k",
+    type=click.Choice(
+        ["rsa-2048", "rsa-3072", "ec-p256", "ed25519"], case_sensitive=False
+    ),
+    help="Token-exchange signing key algorithm (Keycloak only, default: rsa-2048)",
+)
+@click.option(
+    "--pgbouncer/--no-pgbouncer", default=None, help="PgBouncer pooler (default: no)"
+)
+@click.option(
+    "--pg-read-replicas",
+    type=click.IntRange(min=0),
+    help="PostgreSQL read replicas (default: 0)",
+)
+@click.option(
+    "--ingress-rate-limits/--no-ingress-rate-limits",
+    default=None,
+    help="Per-client-IP ingress rate limits (default: no)",
+)
+@click.option(
+    "--size",
+    type=click.Choice(["small", "medium", "large"], case_sensitive=False),
+    help="Sizing tier (default: chart defaults)",
+)
+@click.option(
+    "--expected-rps", type=click.IntRange(min=0), help="Expected requests per second"
+)
+@click.option(
+    "--concurrent-users", type=click.IntRange(min=0), help="Expected concurrent users"
+)
+@click.option(
+    "--artifact-volume-gb",
+    type=click.IntRange(min=0),
+    help="Expected artifact volume in GB",
+)
+@click.option(
+    "--image-lock",
+    type=click.Path(exists=True, dir_okay=False),
+    help="Image lock file the files were generated with",
+)
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(file_okay=False),
+    default="output",
+    help="Directory the files were generated into (default: output)",
+)
+@click.pass_context
+def diff_cmd(
+    ctx: click.Context,
+    manifest: str | None,
+    cloud: str | None,
+    domain: str | None,
+    environment: str | None,
+    auth: str | None,
+    database: str | None,
+    key_algorithm: str | None,
+    pgbouncer: bool | None,
+    pg_read_replicas: int | None,
+    ingress_rate_limits: bool | None,
+    size: str | None,
+    expected_rps: int | None,
+    concurrent_users: int | None,
+    artifact_volume_gb: int | None,
+    image_lock: str | None,
+    output: str,
+):
+    """Compare generated values files with what this govctl would generate.
+
+    Regenerates values-<env>.yaml in memory and compares it with the file on
+    disk key by key, so key order, comments and formatting do not count as
+    changes. Prints one line per changed path. Exits with 1 if any file
+    differs and 2 if a file could not be compared, like diff(1).
+
+    Examples:
+
+        # One environment, generated with govctl init into ./output
+        govctl diff -c gcp -d governance.example.com -e staging -a keycloak
+
+        # Every environment of a fleet, generated into ./fleet-output/<name>/
+        govctl diff --fleet fleet.yaml -o ./fleet-output
+    """
+    from govctl.cli.display import show_diff_summary, show_values_diff
+    from govctl.core.image_lock import image_lock_fields, load_image_lock
+    from govctl.core.manifest import config_from_dict, load_manifest
+    from govctl.generators.values_diff import diff_fleet, diff_values, values_path
+
+    options = {
+        "cloud_provider": cloud,
+        "domain": domain,
+        "environment": environment,
+        "auth_provider": auth,
+        "database_mode": database,
+        "token_exchange_key_algorithm": key_algorithm,
+        "enable_pgbouncer": pgbouncer,
+        "postgresql_read_replicas": pg_read_replicas,
+        "ingress_rate_limits": ingress_rate_limits,
+        "sizing_tier": size,
+        "expected_rps": expected_rps,
+        "concurrent_users": concurrent_users,
+        "artifact_volume_gb": artifact_volume_gb,
+    }
+    options = {name: value for name, value in options.items() if value is not None}
+
+    locked = {}
+    if image_lock:
+        try:
+            locked = image_lock_fields(load_image_lock(image_lock))
+        except (OSError, ValueError) as e:
+            raise click.BadParameter(str(e), param_hint="--image-lock")
+
+    start = time.perf_counter()
+    if manifest:
+        if options:
+            raise click.UsageError(
+                "--fleet cannot be combined with configuration options"
+            )
+        try:
+            entries = load_manifest(manifest)
+        except (ValueError, OSError) as e:
+            raise click.UsageError(f"Invalid manifest {manifest}: {e}")
+        for entry in entries:
+            entry.data = {**locked, **entry.data}
+        results = []
+        for result in diff_fleet(entries, Path(output)):
+            show_values_diff(result)
+            results.append(result)
+    else:
+        if not all([cloud, domain, environment, auth]):
+            raise click.UsageError(
+                "--cloud, --domain, --environment and --auth are required "
+                "without --fleet"
+            )
+        try:
+            config = config_from_dict({**options, **locked})
+        except ValueError as e:
+            raise click.UsageError(str(e))
+        results = [diff_values(config, values_path(config, Path(output)))]
+        show_values_diff(results[0])
+    show_diff_summary(results, time.perf_counter() - start)
+
+    if not all(result.ok for result in results):
+        ctx.exit(2)
+    if any(result.changes for result in results):
+        ctx.exit(1)
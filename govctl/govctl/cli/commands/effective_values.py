@@ -0,0 +1,98 @@
+"""Effective-values command for govctl."""
+
+import sys
+from pathlib import Path
+
+import click
+
+from govctl.cli.chart_options import chart_options, load_release
+
+# Only click is imported at module level so that `govctl --help` stays fast;
+# PyYAML, rich and the chart loader are imported when the command runs.
+
+
+@click.command("effective-values")
+@chart_options
+@click.option(
+    "--subchart",
+    "-s",
+    "subcharts",
+    multiple=True,
+    help="Only show these charts (repeatable; the umbrella chart by its name)",
+)
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(allow_dash=True),
+    default="-",
+    help="Directory to write <chart>.yaml files to, or - for stdout (default)",
+)
+def effective_values_cmd(
+    values_files: tuple[str, ...],
+    chart: str | None,
+    subcharts: tuple[str, ...],
+    output: str,
+):
+    """Show the values each chart of a release is rendered with.
+
+    Merges the values files over the umbrella and subchart defaults the way
+    Helm does, including `global` propagation and subchart conditions, without
+    running Helm. Parsed chart defaults are cached on disk.
+
+    Examples:
+
+        # Effective values of every enabled chart, on stdout
+        govctl effective-values -f output/values.yaml -f output/secrets.yaml
+
+        # Only the auth service, from a specific chart checkout
+        govctl effective-values -f values.yaml --chart ../deployment/charts/governance-platform -s auth-service
+
+        # One file per chart
+        govctl effective-values -f values.yaml -f secrets.yaml -o ./effective
+    """
+    from govctl.core.charts import effective_values
+    from govctl.utils.output import console
+    from govctl.utils.yaml import _NoAliasDumper, write_yaml
+
+    to_stdout = output == "-"
+    if to_stdout:
+        # Keep stdout for the generated YAML
+        console.stderr = True
+
+    umbrella, layers = load_release(values_files, chart)
+    try:
+        result = effective_values(umbrella, layers)
+    except ValueError as e:
+        raise click.ClickException(str(e))
+
+    unknown = sorted(set(subcharts) - set(result.charts))
+    if unknown:
+        raise click.UsageError(
+            f"Unknown or disabled chart(s): {', '.join(unknown)} "
+            f"(enabled: {', '.join(result.charts)})"
+        )
+
+    for warning in result.warnings:
+        console.print(f"[yellow]Warning:[/yellow] {warning}")
+    for path in result.unavailable:
+        console.print(
+            f"[yellow]Warning:[/yellow] no chart found for {path}; its defaults "
+            "are not included (run helm dependency build to vendor it)"
+        )
+
+    selected = [name for name in result.charts if not subcharts or name in subcharts]
+    if to_stdout:
+        for name in selected:
+            sys.stdout.write(f"---\n# Chart: {name}\n")
+            write_yaml(result.charts[name], sys.stdout, dumper=_NoAliasDumper)
+        sys.stdout.flush()
+        return
+
+    output_dir = Path(output)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    for name in selected:
+        with open(output_dir / f"{name}.yaml", "w") as f:
+            write_yaml(result.charts[name], f, dumper=_NoAliasDumper)
+        console.print(f"  [cyan]{output_dir / f'{name}.yaml'}[/cyan]")
+    if result.disabled:
+        console.print(f"[dim]Disabled: {', '.join(result.disabled)}[/dim]")
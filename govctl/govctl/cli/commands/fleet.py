@@ -0,0 +1,205 @@
+"""Fleet command for govctl."""
+
+import sys
+import time
+from pathlib import Path
+
+import click
+
+# Only click is imported at module level so that `govctl --help` stays fast;
+# the generators and rich are imported when the command runs.
+
+
+@click.command("fleet")
+@click.argument("manifest", type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(allow_dash=True),
+    default="output",
+    help="Output directory; each environment is written to <output>/<name>/. "
+    "Use - for one multi-document YAML stream on stdout",
+)
+@click.option(
+    "--format",
+    "-F",
+    "output_format",
+    type=click.Choice(["dir", "tar", "zip"], case_sensitive=False),
+    default="dir",
+    help="Write each environment to a directory (default), or every file as one "
+    "tar or zip archive to --output (default: output.tar/output.zip; - for stdout)",
+)
+@click.option(
+    "--workers",
+    "-w",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of worker processes (default: one per CPU core)",
+)
+@click.option(
+    "--incremental",
+    is_flag=True,
+    help="Only regenerate outputs whose inputs changed, keeping existing secrets",
+)
+@click.option(
+    "--master-key",
+    type=click.Path(exists=True, dir_okay=False),
+    envvar="GOVCTL_MASTER_KEY_FILE",
+    help="Derive secrets from this master key file (base64, e.g. from "
+    "`openssl rand -base64 32`) instead of generating random ones",
+)
+@click.option(
+    "--encrypt-to",
+    type=click.Path(exists=True, dir_okay=False),
+    envvar="GOVCTL_ENCRYPT_TO",
+    help="Encrypt secrets files for this RSA public key (PEM), as "
+    "secrets-<env>.yaml.enc; decrypt with `govctl decrypt`",
+)
+@click.option(
+    "--image-lock",
+    type=click.Path(exists=True, dir_okay=False),
+    help="Pin every environment's images to the digests in this image lock "
+    "file (environments may still set their own image_* entries)",
+)
+@click.pass_context
+def fleet_cmd(
+    ctx: click.Context,
+    manifest: str,
+    output: str,
+    output_format: str,
+    workers: int | None,
+    incremental: bool,
+    master_key: str | None,
+    encrypt_to: str | None,
+    image_lock: str | None,
+):
+    """Generate files for every environment in a fleet manifest.
+
+    Runs the same generators as `govctl init --no-interactive` for each
+    environment, in a single process fanned out over a worker pool. Failed
+    environments are reported and skipped; the exit code is non-zero if any
+    environment failed.
+
+    Examples:
+
+        # Regenerate every environment into ./output/<name>/
+        govctl fleet fleet.yaml
+
+        # Limit the worker pool
+        govctl fleet fleet.yaml -w 4 -o ./fleet-output
+
+        # Only rewrite environments whose config changed
+        govctl fleet fleet.yaml --incremental
+
+        # Stream every environment's files to stdout
+        govctl fleet fleet.yaml -o - | gzip > fleet.yaml.gz
+
+        # One reproducible zip archive with a <name>/ directory per environment
+        govctl fleet fleet.yaml -F zip -o fleet.zip
+
+        # Encrypt every secrets file under one data key for a recipient
+        govctl fleet fleet.yaml --encrypt-to ops.pub.pem
+
+        # Rebuild every environment's secrets from one master key
+        govctl fleet fleet.yaml --master-key master.key
+    """
+    from govctl.core.image_lock import image_lock_fields, load_image_lock
+    from govctl.core.manifest import load_manifest
+    from govctl.generators.derived_secrets import load_master_key
+    from govctl.generators.fleet import run_fleet
+    from govctl.utils.output import console
+    from govctl.cli.display import show_fleet_report
+    from govctl.utils.archive import Archive
+    from govctl.utils.envelope import DataKey, EnvelopeError, load_public_key
+
+    output_format = output_format.lower()
+    archive = output_format != "dir"
+    if archive:
+        if incremental:
+            raise click.UsageError("--incremental needs an output directory")
+        if ctx.get_parameter_source("output") == click.core.ParameterSource.DEFAULT:
+            output = f"{output}.{output_format}"
+
+    to_stdout = output == "-"
+    if to_stdout:
+        if incremental:
+            raise click.UsageError("--incremental needs an output directory, not -")
+        # Keep stdout for the generated YAML
+        console.stderr = True
+
+    data_key = None
+    if encrypt_to:
+        if incremental:
+            raise click.UsageError("--incremental cannot be combined with --encrypt-to")
+        if output == "-" and output_format == "dir":
+            raise click.UsageError(
+                "--encrypt-to needs an output directory or archive, not -"
+            )
+        try:
+            data_key = DataKey.create(load_public_key(encrypt_to))
+        except (OSError, EnvelopeError) as e:
+            raise click.BadParameter(str(e), param_hint="--encrypt-to")
+
+    key = None
+    if master_key:
+        try:
+            key = load_master_key(master_key)
+        except (OSError, ValueError) as e:
+            raise click.BadParameter(str(e), param_hint="--master-key")
+
+    try:
+        entries = load_manifest(manifest)
+    except (ValueError, OSError) as e:
+        raise click.UsageError(f"Invalid manifest {manifest}: {e}")
+
+    if image_lock:
+        try:
+            locked = image_lock_fields(load_image_lock(image_lock))
+        except (OSError, ValueError) as e:
+            raise click.BadParameter(str(e), param_hint="--image-lock")
+        for entry in entries:
+            entry.data = {**locked, **entry.data}
+
+    start = time.perf_counter()
+    results = []
+    if archive:
+        # Workers render each environment's files; they are archived here, in
+        # manifest order, as one sequential write
+        with click.open_file(output, "wb") as f, Archive(output_format, f) as sink:
+            for result in run_fleet(
+                entries,
+                None,
+                workers,
+                archive=True,
+                master_key=key,
+                data_key=data_key,
+            ):
+                for file_name, content in (result.contents or {}).items():
+                    sink.add(f"{result.name}/{file_name}", content)
+                    result.files.append(Path(result.name, file_name))
+                # Only keep the timings for the report
+                result.written, result.contents = len(result.files), None
+                results.append(result)
+    else:
+        output_dir = None if to_stdout else Path(output)
+        for result in run_fleet(
+            entries,
+            output_dir,
+            workers,
+            incremental,
+            master_key=key,
+            data_key=data_key,
+        ):
+            if result.output is not None:
+                sys.stdout.write(result.output)
+                # Only keep the timings for the report
+                result.output = None
+            results.append(result)
+        sys.stdout.flush()
+    elapsed = time.perf_counter() - start
+
+    show_fleet_report(results, elapsed)
+
+    if not all(result.ok for result in results):
+        console.print("[red]Some environments failed to generate.[/red]")
+        ctx.exit(1)
@@ -1,21 +1,18 @@
 """Init command for govctl."""
 
+import dataclasses
+import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
-from rich.panel import Panel
-from rich.prompt import Confirm
 
-from govctl.core.models import PlatformConfig, CloudProvider, AuthProvider, DatabaseMode
-from govctl.generators.values import generate_values
-from govctl.generators.secrets import generate_secrets
-from govctl.generators.keycloak_bootstrap import generate_keycloak_bootstrap
-from govctl.generators.entra_bootstrap import generate_entra_bootstrap
-from govctl.generators.auth0_bootstrap import generate_auth0_bootstrap
+# Only click is imported at module level so that `govctl --help` stays fast;
+# rich, cryptography, PyYAML and the generators are imported when the
+# command runs.
 
-from govctl.utils.output import console
-from govctl.cli.prompts import collect_interactive_config
-from govctl.cli.display import show_config_summary, show_next_steps
+if TYPE_CHECKING:
+    from govctl.utils.profiling import Profiler
 
 
 @click.command("init")
@@ -47,12 +44,91 @@ from govctl.cli.display import show_config_summary, show_next_steps
     type=click.Choice(["bundled", "external"], case_sensitive=False),
     help="Database mode (bundled Bitnami PostgreSQL or external managed PostgreSQL)",
 )
+@click.option(
+    "--key-algorithm",
+    "-k",
+    type=click.Choice(
+        ["rsa-2048", "rsa-3072", "ec-p256", "ed25519"], case_sensitive=False
+    ),
+    help="Token-exchange signing key algorithm (Keycloak only, default: rsa-2048)",
+)
+@click.option(
+    "--pgbouncer/--no-pgbouncer",
+    default=None,
+    help="Route every database connection through a PgBouncer pooler (default: no)",
+)
+@click.option(
+    "--pg-read-replicas",
+    type=click.IntRange(min=0),
+    help="Streaming read replicas of the bundled PostgreSQL (default: 0)",
+)
+@click.option(
+    "--ingress-rate-limits",
+    is_flag=True,
+    help="Rate-limit every client IP at the ingresses (needs the controller to "
+    "see real client IPs)",
+)
+@click.option(
+    "--size",
+    type=click.Choice(["small", "medium", "large"], case_sensitive=False),
+    help="Sizing tier: replicas, resources and autoscaling for the tier's "
+    "reference load (default: chart defaults)",
+)
+@click.option(
+    "--expected-rps",
+    type=click.IntRange(min=0),
+    help="Expected requests per second (overrides the tier's reference load)",
+)
+@click.option(
+    "--concurrent-users",
+    type=click.IntRange(min=0),
+    help="Expected concurrent users (overrides the tier's reference load)",
+)
+@click.option(
+    "--artifact-volume-gb",
+    type=click.IntRange(min=0),
+    help="Expected artifact volume in GB (overrides the tier's reference load)",
+)
+@click.option(
+    "--image-lock",
+    type=click.Path(exists=True, dir_okay=False),
+    help="Pin every image to the digest in this image lock file, with pull "
+    "policy IfNotPresent (default: latest tags, pulled on every start)",
+)
 @click.option(
     "--output",
     "-o",
-    type=click.Path(),
+    type=click.Path(allow_dash=True),
     default="output",
-    help="Output directory for generated files",
+    help="Output directory for generated files, or - for a multi-document YAML stream on stdout",
+)
+@click.option(
+    "--format",
+    "-F",
+    "output_format",
+    type=click.Choice(["dir", "tar", "zip"], case_sensitive=False),
+    default="dir",
+    help="Write the files to a directory (default), or as one tar or zip archive "
+    "to --output (default: output.tar/output.zip; - for stdout)",
+)
+@click.option(
+    "--incremental",
+    is_flag=True,
+    help="Only regenerate outputs whose inputs changed, keeping existing secrets",
+)
+@click.option(
+    "--master-key",
+    type=click.Path(exists=True, dir_okay=False),
+    envvar="GOVCTL_MASTER_KEY_FILE",
+    help="Derive secrets from this master key file (base64, e.g. from "
+    "`openssl rand -base64 32`) instead of generating random ones",
+)
+@click.option(
+    "--encrypt-to",
+    type=click.Path(exists=True, dir_okay=False),
+    envvar="GOVCTL_ENCRYPT_TO",
+    help="Encrypt secrets files for this RSA public key (PEM), as "
+    "secrets-<env>.yaml.enc; decrypt with `govctl decrypt`",
 )
 @click.option(
     "--interactive/--no-interactive",
@@ -60,14 +136,47 @@ from govctl.cli.display import show_config_summary, show_next_steps
     default=True,
     help="Run in interactive mode",
 )
+@click.option(
+    "--profile",
+    is_flag=True,
+    help="Show where the run spent its time, per section and output phase",
+)
+@click.option(
+    "--profile-json",
+    type=click.Path(dir_okay=False, writable=True),
+    help="Write the phase timings to this file as JSON",
+)
+@click.option(
+    "--profile-pstats",
+    type=click.Path(dir_okay=False, writable=True),
+    help="Also run cProfile and write its stats to this file (for python -m pstats)",
+)
+@click.pass_context
 def init_cmd(
+    ctx: click.Context,
     cloud: str | None,
     domain: str | None,
     environment: str | None,
     auth: str | None,
     database: str | None,
+    key_algorithm: str | None,
+    pgbouncer: bool | None,
+    pg_read_replicas: int | None,
+    ingress_rate_limits: bool,
+    size: str | None,
+    expected_rps: int | None,
+    concurrent_users: int | None,
+    artifact_volume_gb: int | None,
+    image_lock: str | None,
     output: str,
+    output_format: str,
+    incremental: bool,
+    master_key: str | None,
+    encrypt_to: str | None,
     interactive: bool,
+    profile: bool,
+    profile_json: str | None,
+    profile_pstats: str | None,
 ):
     """Initialize a new Governance Platform deployment.
 
@@ -83,7 +192,105 @@ def init_cmd(
 
         # Output to specific directory
         govctl init -o ./my-deployment
+
+        # Re-run against an existing output directory, keeping its secrets
+        govctl init -o ./my-deployment --incremental
+
+        # Derive the secrets from a master key, so they can be rebuilt later
+        govctl init -I -c gcp -d governance.example.com -e staging -a keycloak --master-key master.key
+
+        # Encrypt the secrets file for a recipient public key
+        govctl init -I -c gcp -d governance.example.com -e staging -a keycloak --encrypt-to ops.pub.pem
+
+        # Stream every file to stdout as one multi-document YAML stream
+        govctl init -I -c gcp -d governance.example.com -e staging -a keycloak -o - > platform.yaml
+
+        # Size replicas, resources and autoscaling for an expected load
+        govctl init -I -c gcp -d governance.example.com -e production -a keycloak --size medium --expected-rps 120
+
+        # Write every file into a reproducible tar archive
+        govctl init -I -c gcp -d governance.example.com -e staging -a keycloak -F tar -o staging.tar
+
+        # Time each section and output phase
+        govctl init -I -c gcp -d governance.example.com -e staging -a keycloak --profile
     """
+    from rich.panel import Panel
+    from rich.prompt import Confirm
+
+    from govctl.core.models import (
+        PlatformConfigBuilder,
+        CloudProvider,
+        AuthProvider,
+        DatabaseMode,
+        KeyAlgorithm,
+        SizingTier,
+    )
+    from govctl.core.chart_index import collecting_problems
+    from govctl.core.image_lock import load_image_lock
+    from govctl.generators.outputs import write_archive, write_outputs, write_stream
+    from govctl.generators.derived_secrets import deriving_secrets, load_master_key
+    from govctl.generators.keys import key_engine
+    from govctl.utils.archive import Archive
+    from govctl.utils.envelope import DataKey, EnvelopeError, load_public_key
+
+    from govctl.utils.output import console
+    from govctl.cli.prompts import collect_interactive_config
+    from govctl.cli.display import (
+        show_chart_problems,
+        show_config_summary,
+        show_next_steps,
+    )
+    from govctl.utils.profiling import phase, profiling
+
+    output_format = output_format.lower()
+    if output_format != "dir":
+        if incremental:
+            raise click.UsageError("--incremental needs an output directory")
+        if ctx.get_parameter_source("output") == click.core.ParameterSource.DEFAULT:
+            output = f"{output}.{output_format}"
+
+    to_stdout = output == "-"
+    if to_stdout:
+        if incremental:
+            raise click.UsageError("--incremental needs an output directory, not -")
+        # Keep stdout for the generated YAML
+        console.stderr = True
+
+    data_key = None
+    if encrypt_to:
+        if incremental:
+            raise click.UsageError("--incremental cannot be combined with --encrypt-to")
+        if output == "-" and output_format == "dir":
+            raise click.UsageError(
+                "--encrypt-to needs an output directory or archive, not -"
+            )
+        try:
+            data_key = DataKey.create(load_public_key(encrypt_to))
+        except (OSError, EnvelopeError) as e:
+            raise click.BadParameter(str(e), param_hint="--encrypt-to")
+
+    if profile or profile_json or profile_pstats:
+        # Profiling covers the rest of the command. Close callbacks run last
+        # registered first, so the report runs after profiling has stopped.
+        ctx.call_on_close(lambda: _report_profile(profiler, profile, profile_json))
+        profiler = ctx.with_resource(
+            profiling(Path(profile_pstats) if profile_pstats else None)
+        )
+
+    lock = None
+    if image_lock:
+        try:
+            lock = load_image_lock(image_lock)
+        except (OSError, ValueError) as e:
+            raise click.BadParameter(str(e), param_hint="--image-lock")
+
+    if master_key:
+        try:
+            key = load_master_key(master_key)
+        except (OSError, ValueError) as e:
+            raise click.BadParameter(str(e), param_hint="--master-key")
+        ctx.with_resource(deriving_secrets(key))
+
     console.print(
         Panel.fit(
             "[bold blue]Governance Platform Configuration[/bold blue]\n"
@@ -94,7 +301,18 @@ def init_cmd(
 
     # Collect configuration
     if interactive:
-        config = collect_interactive_config(cloud, domain, environment, auth, database)
+        with phase("collect config (interactive)"):
+            config = collect_interactive_config(
+                cloud,
+                domain,
+                environment,
+                auth,
+                database,
+                key_algorithm,
+                prefetch_keys=not incremental,
+                pgbouncer=pgbouncer,
+                size=size,
+            )
     else:
         if not all([cloud, domain, environment, auth]):
             raise click.UsageError(
@@ -110,13 +328,50 @@ def init_cmd(
                 else DatabaseMode.BUNDLED
             )
         )
-        config = PlatformConfig(
+        builder = PlatformConfigBuilder(
             cloud_provider=CloudProvider(cloud.lower()),
             domain=domain,
             environment=env_lower,
             auth_provider=AuthProvider(auth.lower()),
             database_mode=db_mode,
         )
+        if key_algorithm:
+            builder.set(
+                "keycloak.token_exchange_key_algorithm",
+                KeyAlgorithm(key_algorithm.lower()),
+            )
+        if pgbouncer:
+            builder.set("enable_pgbouncer", True)
+        if size:
+            builder.set("sizing.tier", SizingTier(size.lower()))
+        config = builder.build()
+        # Start key generation while the summary is rendered. Incremental runs
+        # usually reuse the existing key, so only generate one if needed.
+        if not incremental:
+            key_engine.prefetch_for(config)
+
+    if pg_read_replicas is not None:
+        config = dataclasses.replace(config, postgresql_read_replicas=pg_read_replicas)
+    if ingress_rate_limits:
+        config = dataclasses.replace(config, ingress_rate_limits=True)
+
+    load_figures = {
+        "expected_rps": expected_rps,
+        "concurrent_users": concurrent_users,
+        "artifact_volume_gb": artifact_volume_gb,
+    }
+    load_figures = {k: v for k, v in load_figures.items() if v is not None}
+    if load_figures:
+        config = dataclasses.replace(
+            config, sizing=dataclasses.replace(config.sizing, **load_figures)
+        )
+
+    if lock is not None:
+        try:
+            config = dataclasses.replace(config, images=lock)
+        except ValueError as e:
+            key_engine.shutdown()
+            raise click.BadParameter(str(e), param_hint="--image-lock")
 
     # Show summary
     show_config_summary(config)
@@ -125,42 +380,60 @@ def init_cmd(
         "\n[bold]Generate files with this configuration?[/bold]"
     ):
         console.print("[yellow]Aborted.[/yellow]")
+        key_engine.shutdown()
         return
 
     # Generate files
-    output_path = Path(output)
-    output_path.mkdir(parents=True, exist_ok=True)
-
-    values_content = generate_values(config)
-    secrets_content = generate_secrets(config)
-
-    values_file = output_path / f"values-{config.environment}.yaml"
-    secrets_file = output_path / f"secrets-{config.environment}.yaml"
-
-    values_file.write_text(values_content)
-    secrets_file.write_text(secrets_content)
-
-    bootstrap_file = None
-    if config.auth_provider == AuthProvider.AUTH0:
-        bootstrap_content = generate_auth0_bootstrap(config)
-        bootstrap_file = output_path / f"bootstrap-{config.environment}.yaml"
-        bootstrap_file.write_text(bootstrap_content)
-    elif config.auth_provider == AuthProvider.ENTRA:
-        bootstrap_content = generate_entra_bootstrap(config)
-        bootstrap_file = output_path / f"bootstrap-{config.environment}.yaml"
-        bootstrap_file.write_text(bootstrap_content)
-    elif config.auth_provider == AuthProvider.KEYCLOAK:
-        bootstrap_content = generate_keycloak_bootstrap(config)
-        bootstrap_file = output_path / f"bootstrap-{config.environment}.yaml"
-        bootstrap_file.write_text(bootstrap_content)
+    if output_format != "dir":
+        with collecting_problems() as problems, phase(f"write {output_format}"):
+            with click.open_file(output, "wb") as f, Archive(
+                output_format, f
+            ) as archive:
+                write_archive(config, archive, data_key=data_key)
+        where = "stdout" if to_stdout else output
+        console.print(f"[bold green]Files archived to {where}:[/bold green]")
+        for name in archive.names:
+            console.print(f"  [cyan]{name}[/cyan]")
+        console.print()
+        show_chart_problems(problems)
+        return
+
+    if to_stdout:
+        with collecting_problems() as problems, phase("write stdout"):
+            write_stream(config, sys.stdout)
+        sys.stdout.flush()
+        console.print("[bold green]Files written to stdout.[/bold green]")
+        show_chart_problems(problems)
+        return
+
+    with collecting_problems() as problems:
+        results = write_outputs(
+            config, Path(output), incremental=incremental, data_key=data_key
+        )
+    values_file, secrets_file = results[0][0], results[1][0]
+    bootstrap_file = results[2][0] if len(results) > 2 else None
 
     console.print()
     console.print("[bold green]Files generated successfully![/bold green]")
     console.print()
-    console.print(f"  [cyan]{values_file}[/cyan]")
-    console.print(f"  [cyan]{secrets_file}[/cyan]")
-    if bootstrap_file:
-        console.print(f"  [cyan]{bootstrap_file}[/cyan]")
+    for path, written in results:
+        if written:
+            console.print(f"  [cyan]{path}[/cyan]")
+        else:
+            console.print(f"  [cyan]{path}[/cyan] [dim](unchanged)[/dim]")
     console.print()
+    show_chart_problems(problems)
 
     show_next_steps(config, values_file, secrets_file, bootstrap_file)
+
+
+def _report_profile(profiler: "Profiler", show: bool, json_path: str | None) -> None:
+    """Show and/or save the timings collected by a profiled run."""
+    import json
+
+    from govctl.cli.display import show_profile
+
+    if show:
+        show_profile(profiler)
+    if json_path:
+        Path(json_path).write_text(json.dumps(profiler.to_dict(), indent=2) + "\n")
@@ -0,0 +1,109 @@
+"""Serve command for govctl."""
+
+import signal
+from pathlib import Path
+
+import click
+
+# Only click is imported at module level so that `govctl --help` stays fast;
+# the server and rich are imported when the command runs.
+
+
+@click.command("serve")
+@click.option(
+    "--host",
+    default="127.0.0.1",
+    help="Loopback address to listen on (default: 127.0.0.1)",
+)
+@click.option(
+    "--port",
+    "-p",
+    type=click.IntRange(min=0, max=65535),
+    default=8750,
+    help="TCP port to listen on (default: 8750; 0 picks a free port)",
+)
+@click.option(
+    "--socket",
+    "-s",
+    "socket_path",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="Listen on this unix socket instead of a TCP port",
+)
+@click.option(
+    "--workers",
+    "-w",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Number of worker processes (default: one per CPU core)",
+)
+@click.option("--log-requests", is_flag=True, help="Log every request to stderr")
+def serve_cmd(
+    host: str,
+    port: int,
+    socket_path: str | None,
+    workers: int | None,
+    log_requests: bool,
+):
+    """Run a local HTTP/JSON service that generates deployment files.
+
+    Keeps govctl loaded between requests, so callers that generate many
+    environments (e.g. a provisioning portal) skip process start-up and
+    import time. POST a JSON object of configuration fields, as in a fleet
+    manifest entry, to /generate to get back the generated files; latency
+    counters are at /metrics. Only listens on loopback addresses or a unix
+    socket, as responses contain secrets.
+
+    Examples:
+
+        govctl serve
+        curl -s localhost:8750/generate -d '{"cloud_provider": "gcp", "domain": "governance.example.com", "environment": "staging", "auth_provider": "keycloak"}'
+
+        # On a unix socket, with four worker processes
+        govctl serve -s /run/govctl/govctl.sock -w 4
+        curl -s --unix-socket /run/govctl/govctl.sock localhost/metrics
+    """
+    from govctl.cli.server import (
+        GenerationServer,
+        GenerationService,
+        UnixGenerationServer,
+        is_loopback,
+    )
+    from govctl.generators.fleet import default_workers
+    from govctl.utils.output import console
+
+    if socket_path is None and not is_loopback(host):
+        raise click.UsageError(
+            f"--host must be a loopback address (e.g. 127.0.0.1), not {host}"
+        )
+
+    workers = workers or default_workers()
+    service = GenerationService(workers, log_requests=log_requests)
+    try:
+        if socket_path is not None:
+            server = UnixGenerationServer(Path(socket_path), service)
+            where = f"unix socket {socket_path}"
+        else:
+            server = GenerationServer((host, port), service)
+            where = f"http://{host}:{server.server_address[1]}"
+    except (OSError, ValueError) as e:
+        service.shutdown()
+        raise click.ClickException(str(e))
+
+    def stop(signum: int, frame: object) -> None:
+        raise KeyboardInterrupt
+
+    # Stop the same way on SIGTERM (e.g. from systemd) as on Ctrl+C
+    signal.signal(signal.SIGTERM, stop)
+
+    console.print(
+        f"[bold green]govctl serving on {where}[/bold green] "
+        f"with {workers} worker(s); Ctrl+C to stop"
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Stopping.[/yellow]")
+    finally:
+        server.server_close()
+        service.shutdown()
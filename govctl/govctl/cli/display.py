@@ -1,7 +1,10 @@
 """Display utilities for CLI output."""
 
+import json
 from pathlib import Path
+from typing import TYPE_CHECKING
 
+from rich.markup import escape
 from rich.table import Table
 
 from govctl.core.models import (
@@ -10,8 +13,16 @@ from govctl.core.models import (
     KeyManagementProvider,
     PlatformConfig,
 )
+from govctl.core.sizing import load_tier, resolve_load
+from govctl.utils.envelope import ENCRYPTED_SUFFIX
 from govctl.utils.output import console
 
+if TYPE_CHECKING:
+    from govctl.core.tree_diff import Change
+    from govctl.generators.fleet import FleetResult
+    from govctl.generators.values_diff import DiffResult
+    from govctl.utils.profiling import Profiler
+
 
 def show_config_summary(config: PlatformConfig) -> None:
     """Display a summary of the configuration."""
@@ -29,35 +40,51 @@ def show_config_summary(config: PlatformConfig) -> None:
     table.add_row("Auth Provider", config.auth_provider.value)
     table.add_row("Storage Provider", config.storage_provider)
     table.add_row("Database Mode", config.database_mode.value)
+    if config.enable_pgbouncer:
+        table.add_row("Connection Pooler", "PgBouncer")
+    if config.enable_ingress and config.ingress_rate_limits:
+        table.add_row("Ingress Rate Limits", "per client IP")
+    if config.database_mode == DatabaseMode.BUNDLED and config.postgresql_read_replicas:
+        table.add_row("PostgreSQL Read Replicas", str(config.postgresql_read_replicas))
+    load = resolve_load(config.sizing)
+    if load is not None:
+        table.add_row(
+            "Sizing",
+            f"{load_tier(load).value} ({load.rps} req/s, {load.users} users, "
+            f"{load.artifact_gb} GB artifacts)",
+        )
 
     table.add_row("Key Management", config.key_management_provider.value)
     if config.key_management_provider == KeyManagementProvider.AWS_KMS:
-        if config.aws_kms_region:
-            table.add_row("AWS KMS Region", config.aws_kms_region)
-        if config.aws_kms_endpoint:
-            table.add_row("AWS KMS Endpoint", config.aws_kms_endpoint)
-        if config.aws_kms_alias_prefix:
-            table.add_row("AWS KMS Alias Prefix", config.aws_kms_alias_prefix)
+        if config.aws_kms.region:
+            table.add_row("AWS KMS Region", config.aws_kms.region)
+        if config.aws_kms.endpoint:
+            table.add_row("AWS KMS Endpoint", config.aws_kms.endpoint)
+        if config.aws_kms.alias_prefix:
+            table.add_row("AWS KMS Alias Prefix", config.aws_kms.alias_prefix)
     elif config.key_management_provider == KeyManagementProvider.AZURE_KEY_VAULT:
-        if config.azure_key_vault_url:
-            table.add_row("Key Vault URL", config.azure_key_vault_url)
-        if config.azure_tenant_id:
-            table.add_row("Key Vault Tenant ID", config.azure_tenant_id)
+        if config.azure_key_vault.url:
+            table.add_row("Key Vault URL", config.azure_key_vault.url)
+        if config.azure_key_vault.tenant_id:
+            table.add_row("Key Vault Tenant ID", config.azure_key_vault.tenant_id)
     elif config.key_management_provider == KeyManagementProvider.GCP_KMS:
-        if config.gcp_kms_project_id:
-            table.add_row("GCP KMS Project ID", config.gcp_kms_project_id)
-        if config.gcp_kms_location_id:
-            table.add_row("GCP KMS Location", config.gcp_kms_location_id)
-        if config.gcp_kms_key_ring_id:
-            table.add_row("GCP KMS Key Ring", config.gcp_kms_key_ring_id)
+        if config.gcp_kms.project_id:
+            table.add_row("GCP KMS Project ID", config.gcp_kms.project_id)
+        if config.gcp_kms.location_id:
+            table.add_row("GCP KMS Location", config.gcp_kms.location_id)
+        if config.gcp_kms.key_ring_id:
+            table.add_row("GCP KMS Key Ring", config.gcp_kms.key_ring_id)
 
     if config.auth_provider == AuthProvider.AUTH0:
-        table.add_row("Auth0 Domain", config.auth0_domain)
+        table.add_row("Auth0 Domain", config.auth0.domain)
     elif config.auth_provider == AuthProvider.ENTRA:
-        table.add_row("Entra Tenant ID", config.entra_tenant_id)
+        table.add_row("Entra Tenant ID", config.entra.tenant_id)
     elif config.auth_provider == AuthProvider.KEYCLOAK:
-        table.add_row("Keycloak URL", config.keycloak_url)
-        table.add_row("Keycloak Realm", config.keycloak_realm)
+        table.add_row("Keycloak URL", config.keycloak.url)
+        table.add_row("Keycloak Realm", config.keycloak.realm)
+        table.add_row(
+            "Token Exchange Key", config.keycloak.token_exchange_key_algorithm.value
+        )
 
     # Image registry
     if config.image_registry_url:
@@ -66,6 +93,8 @@ def show_config_summary(config: PlatformConfig) -> None:
         table.add_row("Registry Username", config.image_registry_username)
     if config.image_registry_email:
         table.add_row("Registry Email", config.image_registry_email)
+    if config.images.enabled:
+        table.add_row("Images", "pinned to digests (image lock)")
 
     console.print(table)
 
@@ -81,6 +110,15 @@ def show_next_steps(
 
     console.print("[bold]Next steps:[/bold]")
     console.print()
+    if secrets_file.suffix == ENCRYPTED_SUFFIX:
+        encrypted_file, secrets_file = secrets_file, secrets_file.with_suffix("")
+        console.print(
+            f"  {step}. Decrypt [cyan]{encrypted_file}[/cyan] with the recipient's "
+            f"private key:"
+            f"\n[dim]     govctl decrypt {encrypted_file} -k <private key>[/dim]"
+        )
+        console.print()
+        step += 1
     console.print(
         f"  {step}. Fill in any remaining secrets in [cyan]{secrets_file}[/cyan]"
     )
@@ -127,11 +165,17 @@ def show_next_steps(
         step += 1
 
     if config.database_mode == DatabaseMode.EXTERNAL:
+        # With PgBouncer, only the pooler connects to the managed instance
+        host_key = (
+            "pgbouncer.upstream.host"
+            if config.enable_pgbouncer
+            else "global.postgresql.host"
+        )
         console.print(
             f"  {step}. External PostgreSQL setup — required before deploying:"
         )
         console.print(
-            f"     - Set [cyan]global.postgresql.host[/cyan] in {values_file}"
+            f"     - Set [cyan]{host_key}[/cyan] in {values_file}"
             f'\n     - Create the [cyan]governance[/cyan] and [cyan]"IntegrityServiceDB"[/cyan] databases on the managed instance'
             f"\n     - Keep [cyan]global.secrets.create[/cyan] enabled in {secrets_file} to have Helm create the [cyan]platform-database[/cyan] Secret for you, or disable it and pre-create that Secret manually"
             f"\n     - (For sslMode verify-ca/verify-full) create a Secret or ConfigMap named [cyan]postgres-ca[/cyan] holding the CA bundle at key [cyan]ca.crt[/cyan]"
@@ -150,3 +194,141 @@ def show_next_steps(
     )
     console.print(f"[dim]{helm_cmd}[/dim]")
     console.print()
+
+
+def show_fleet_report(results: list["FleetResult"], elapsed: float) -> None:
+    """Display per-environment timings and failures for a fleet run."""
+    console.print()
+
+    table = Table(title="Fleet Generation", border_style="blue")
+    table.add_column("Environment", style="cyan")
+    table.add_column("Status")
+    table.add_column("Time", justify="right")
+    table.add_column("Details")
+
+    for result in results:
+        if result.ok:
+            status = "[green]ok[/green]"
+            if result.files:
+                details = f"{result.written}/{len(result.files)} files written"
+            else:
+                details = "streamed to stdout"
+            if result.problems:
+                details += (
+                    f", [yellow]{len(result.problems)} chart key problem(s)[/yellow]"
+                )
+        else:
+            status = "[red]failed[/red]"
+            details = f"[red]{result.error}[/red]"
+        table.add_row(result.name, status, f"{result.seconds * 1000:.0f} ms", details)
+
+    console.print(table)
+
+    failed = sum(1 for result in results if not result.ok)
+    console.print(
+        f"\n[bold]{len(results) - failed}/{len(results)}[/bold] environments generated "
+        f"in [bold]{elapsed:.2f}s[/bold]"
+    )
+    console.print()
+
+    # Environments usually share their problems, so list each one once
+    problems: dict[str, int] = {}
+    for result in results:
+        for problem in dict.fromkeys(result.problems):
+            problems[problem] = problems.get(problem, 0) + 1
+    if problems:
+        show_chart_problems(
+            [
+                f"{problem} ({count} environment(s))"
+                for problem, count in problems.items()
+            ]
+        )
+
+
+def show_chart_problems(problems: list[str]) -> None:
+    """Display generated keys that the target charts do not know."""
+    if not problems:
+        return
+    console.print(
+        f"[yellow]Warning:[/yellow] {len(problems)} generated key(s) do not match "
+        "the chart's values.yaml:"
+    )
+    for problem in dict.fromkeys(problems):
+        console.print(f"  [yellow]{problem}[/yellow]")
+    console.print()
+
+
+# Longest value shown in full in a change list
+_MAX_VALUE_WIDTH = 60
+
+
+def _short_value(value: object) -> str:
+    text = json.dumps(value, sort_keys=True, default=str)
+    if len(text) > _MAX_VALUE_WIDTH:
+        text = text[: _MAX_VALUE_WIDTH - 3] + "..."
+    return escape(text)
+
+
+def _change_line(change: "Change") -> str:
+    path = escape(change.path or "(whole file)")
+    if change.kind == "added":
+        return f"[green]+ {path}[/green]: {_short_value(change.new)}"
+    if change.kind == "removed":
+        return f"[red]- {path}[/red]"
+    return (
+        f"[yellow]~ {path}[/yellow]: {_short_value(change.old)} -> "
+        f"{_short_value(change.new)}"
+    )
+
+
+def show_values_diff(result: "DiffResult") -> None:
+    """Display the path-level changes found for one values file."""
+    if not result.ok:
+        console.print(f"[bold]{result.name}[/bold] [red]{escape(result.error)}[/red]")
+        return
+    if not result.changes:
+        return
+    console.print(
+        f"[bold]{result.name}[/bold] [dim]{result.path}[/dim] "
+        f"({len(result.changes)} change(s))"
+    )
+    for change in result.changes:
+        console.print(f"  {_change_line(change)}", highlight=False)
+
+
+def show_diff_summary(results: list["DiffResult"], elapsed: float) -> None:
+    """Display how many values files differ from a fresh generation."""
+    differ = sum(1 for result in results if result.changes)
+    failed = sum(1 for result in results if not result.ok)
+    changes = sum(len(result.changes) for result in results)
+    summary = (
+        f"\n[bold]{differ}/{len(results)}[/bold] values file(s) differ "
+        f"({changes} change(s))"
+    )
+    if failed:
+        summary += f", [red]{failed} could not be compared[/red]"
+    console.print(f"{summary} in [bold]{elapsed:.2f}s[/bold]")
+
+
+def show_profile(profiler: "Profiler") -> None:
+    """Display the phase timings collected by a profiled run."""
+    total = profiler.elapsed
+
+    table = Table(title="Profile", border_style="blue")
+    table.add_column("Phase", style="cyan")
+    table.add_column("Calls", justify="right")
+    table.add_column("Time", justify="right")
+    table.add_column("% of run", justify="right")
+
+    for timing in profiler.timings():
+        table.add_row(
+            "  " * timing.depth + timing.name,
+            str(timing.calls),
+            f"{timing.seconds * 1000:.2f} ms",
+            f"{timing.seconds / total * 100:.1f}%" if total else "-",
+        )
+
+    console.print()
+    console.print(table)
+    console.print(f"\n[bold]Total:[/bold] {total * 1000:.2f} ms")
+    console.print()
@@ -1,11 +1,53 @@
 """Main CLI entry point for govctl."""
 
+import importlib
+
 import click
 
-from govctl.cli.commands import init
 
+class LazyGroup(click.Group):
+    """Click group that imports each subcommand's module only when it is used.
+
+    Subcommands are registered as ``name -> "module:attribute"`` so that
+    `govctl --help` and `govctl --version` do not import every command (and
+    everything those commands import).
+    """
+
+    def __init__(self, *args, lazy_subcommands: dict[str, str] | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_subcommands})
 
-@click.group()
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name in self.lazy_subcommands:
+            return self._load_command(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _load_command(self, cmd_name: str) -> click.Command:
+        module_name, attribute = self.lazy_subcommands[cmd_name].split(":")
+        command = getattr(importlib.import_module(module_name), attribute)
+        if not isinstance(command, click.Command):
+            raise ValueError(
+                f"Lazy subcommand {cmd_name!r} ({module_name}:{attribute}) "
+                "is not a click command"
+            )
+        return command
+
+
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        "init": "govctl.cli.commands.init:init_cmd",
+        "fleet": "govctl.cli.commands.fleet:fleet_cmd",
+        "effective-values": "govctl.cli.commands.effective_values:effective_values_cmd",
+        "render-secrets": "govctl.cli.commands.render_secrets:render_secrets_cmd",
+        "diff": "govctl.cli.commands.diff:diff_cmd",
+        "serve": "govctl.cli.commands.serve:serve_cmd",
+        "decrypt": "govctl.cli.commands.decrypt:decrypt_cmd",
+    },
+)
 @click.version_option()
 def cli():
     """govctl - Governance Platform CLI.
@@ -13,7 +55,3 @@ def cli():
     Generate Helm values and secrets files for deploying the Governance Platform.
     """
     pass
-
-
-# Register commands
-cli.add_command(init.init_cmd, name="init")
@@ -4,11 +4,15 @@ from rich.prompt import Prompt
 
 from govctl.core.models import (
     PlatformConfig,
+    PlatformConfigBuilder,
     CloudProvider,
     AuthProvider,
     DatabaseMode,
+    KeyAlgorithm,
     KeyManagementProvider,
+    SizingTier,
 )
+from govctl.generators.keys import key_engine
 from govctl.utils.naming import generate_domain_code
 from govctl.utils.validate import (
     is_valid_aws_region,
@@ -31,8 +35,16 @@ def collect_interactive_config(
     environment: str | None,
     auth: str | None,
     database: str | None = None,
+    key_algorithm: str | None = None,
+    prefetch_keys: bool = True,
+    pgbouncer: bool | None = None,
+    size: str | None = None,
 ) -> PlatformConfig:
-    """Collect configuration interactively."""
+    """Collect configuration interactively.
+
+    When ``prefetch_keys`` is set, key generation for the token-exchange key
+    starts in the background as soon as the auth provider is known.
+    """
     console.print()
 
     # --- Domain ---
@@ -62,17 +74,25 @@ def collect_interactive_config(
     # --- Database mode ---
     # Default to external for production, bundled otherwise.
     db_default = "external" if env == "production" else "bundled"
+    if not database or pgbouncer is None:
+        console.print()
+        console.print("[bold]Database Configuration:[/bold]")
     if database:
         database_mode = DatabaseMode(database.lower())
     else:
-        console.print()
-        console.print("[bold]Database Configuration:[/bold]")
         db_choice = Prompt.ask(
             "  Database Mode (bundled = Bitnami PostgreSQL in-cluster; external = cloud-managed PostgreSQL)",
             choices=["bundled", "external"],
             default=db_default,
         )
         database_mode = DatabaseMode(db_choice)
+    if pgbouncer is None:
+        pgbouncer_choice = Prompt.ask(
+            "  Route connections through a PgBouncer pooler?",
+            choices=["yes", "no"],
+            default="no",
+        )
+        pgbouncer = pgbouncer_choice == "yes"
 
     # --- Cloud provider ---
     console.print()
@@ -99,17 +119,16 @@ def collect_interactive_config(
                 "[red]Invalid AWS region format. Expected format: us-east-1, eu-west-2, etc.[/red]"
             )
 
-    # Create base config
-    config = PlatformConfig(
+    builder = PlatformConfigBuilder(
         cloud_provider=cloud_provider,
         domain=domain_value,
         environment=env,
-        auth_provider=AuthProvider.KEYCLOAK,  # placeholder, set below
         database_mode=database_mode,
+        enable_pgbouncer=pgbouncer,
     )
 
     if cloud_provider == CloudProvider.AWS:
-        config.cloud_region = aws_region
+        builder.set("cloud_region", aws_region)
 
         # S3 access mode: static keys (default) or IAM role (IRSA / instance profile)
         s3_iam_choice = Prompt.ask(
@@ -117,8 +136,8 @@ def collect_interactive_config(
             choices=["yes", "no"],
             default="no",
         )
-        config.aws_s3_use_iam_role = s3_iam_choice == "yes"
-        if config.aws_s3_use_iam_role:
+        builder.set("aws_s3_use_iam_role", s3_iam_choice == "yes")
+        if s3_iam_choice == "yes":
             console.print(
                 "  [dim]For IRSA, a service account with an eks.amazonaws.com/role-arn "
                 "annotation will be scaffolded (replace YOUR_IAM_ROLE_ARN); drop the "
@@ -140,31 +159,32 @@ def collect_interactive_config(
         choices=["aws_kms", "azure_key_vault", "gcp_kms"],
         default=km_default,
     )
-    config.key_management_provider = KeyManagementProvider(km_choice)
+    km_provider = KeyManagementProvider(km_choice)
+    builder.set("key_management_provider", km_provider)
 
-    if config.key_management_provider == KeyManagementProvider.AWS_KMS:
+    if km_provider == KeyManagementProvider.AWS_KMS:
         while True:
             aws_kms_region = Prompt.ask(
                 "  AWS KMS Region",
-                default=config.cloud_region or "us-east-1",
+                default=builder.get("cloud_region") or "us-east-1",
             )
             if is_valid_aws_region(aws_kms_region):
                 break
             console.print(
                 "[red]Invalid AWS region format. Expected format: us-east-1, eu-west-2, etc.[/red]"
             )
-        config.aws_kms_region = aws_kms_region
+        builder.set("aws_kms.region", aws_kms_region)
         aws_kms_endpoint = Prompt.ask(
             "  AWS KMS Endpoint (optional, for custom endpoints)",
             default="",
         )
-        config.aws_kms_endpoint = aws_kms_endpoint
+        builder.set("aws_kms.endpoint", aws_kms_endpoint)
         aws_kms_alias_prefix = Prompt.ask(
             "  AWS KMS Alias Prefix",
             default="alias/eqtylab/did",
         )
-        config.aws_kms_alias_prefix = aws_kms_alias_prefix
-    elif config.key_management_provider == KeyManagementProvider.AZURE_KEY_VAULT:
+        builder.set("aws_kms.alias_prefix", aws_kms_alias_prefix)
+    elif km_provider == KeyManagementProvider.AZURE_KEY_VAULT:
         while True:
             keyvault_url = Prompt.ask(
                 "  Azure Key Vault URL",
@@ -175,7 +195,7 @@ def collect_interactive_config(
             console.print(
                 "[red]Invalid Key Vault URL. Expected format: https://{vault-name}.vault.azure.net/[/red]"
             )
-        config.azure_key_vault_url = keyvault_url
+        builder.set("azure_key_vault.url", keyvault_url)
         while True:
             kv_tenant_id = Prompt.ask(
                 "  Azure Key Vault Tenant ID",
@@ -186,8 +206,8 @@ def collect_interactive_config(
             console.print(
                 "[red]Invalid UUID format. Expected format: xxxxxxxx-xxxx-xxxx-xxxx-xxxxxxxxxxxx[/red]"
             )
-        config.azure_tenant_id = kv_tenant_id
-    elif config.key_management_provider == KeyManagementProvider.GCP_KMS:
+        builder.set("azure_key_vault.tenant_id", kv_tenant_id)
+    elif km_provider == KeyManagementProvider.GCP_KMS:
         while True:
             gcp_kms_project_id = Prompt.ask(
                 "  GCP Project ID",
@@ -198,7 +218,7 @@ def collect_interactive_config(
             console.print(
                 "[red]Invalid GCP project ID. Must be 6-30 lowercase letters, digits, and hyphens, starting with a letter.[/red]"
             )
-        config.gcp_kms_project_id = gcp_kms_project_id
+        builder.set("gcp_kms.project_id", gcp_kms_project_id)
         while True:
             gcp_kms_location = Prompt.ask(
                 "  GCP KMS Location",
@@ -209,7 +229,7 @@ def collect_interactive_config(
             console.print(
                 "[red]Invalid GCP location. Expected format: us-east1, europe-west4, etc.[/red]"
             )
-        config.gcp_kms_location_id = gcp_kms_location
+        builder.set("gcp_kms.location_id", gcp_kms_location)
         while True:
             gcp_kms_key_ring = Prompt.ask(
                 "  GCP KMS Key Ring ID",
@@ -220,7 +240,7 @@ def collect_interactive_config(
             console.print(
                 "[red]Invalid key ring ID. Use only letters, numbers, hyphens, and underscores.[/red]"
             )
-        config.gcp_kms_key_ring_id = gcp_kms_key_ring
+        builder.set("gcp_kms.key_ring_id", gcp_kms_key_ring)
 
     # --- Auth provider ---
     console.print()
@@ -234,7 +254,24 @@ def collect_interactive_config(
             default="keycloak",
         )
         auth_provider = AuthProvider(auth_choice)
-    config.auth_provider = auth_provider
+    builder.set("auth_provider", auth_provider)
+
+    if auth_provider == AuthProvider.KEYCLOAK:
+        if key_algorithm:
+            key_algorithm_choice = key_algorithm.lower()
+        else:
+            key_algorithm_choice = Prompt.ask(
+                "  Token Exchange Key Algorithm",
+                choices=[a.value for a in KeyAlgorithm],
+                default=KeyAlgorithm.RSA_2048.value,
+            )
+        builder.set(
+            "keycloak.token_exchange_key_algorithm", KeyAlgorithm(key_algorithm_choice)
+        )
+
+    # Generate the token-exchange key (if any) while the remaining prompts run
+    if prefetch_keys:
+        key_engine.prefetch_for(builder.build())
 
     if auth_provider == AuthProvider.AUTH0:
         while True:
@@ -247,7 +284,7 @@ def collect_interactive_config(
             console.print(
                 "[red]Invalid domain format. Expected format: your-tenant.us.auth0.com[/red]"
             )
-        config.auth0_domain = auth0_domain
+        builder.set("auth0.domain", auth0_domain)
         while True:
             auth0_audience = Prompt.ask(
                 "  Auth0 Audience/API Identifier",
@@ -260,7 +297,7 @@ def collect_interactive_config(
             console.print(
                 "[red]Invalid Auth0 audience. Expected format: https://your-tenant.us.auth0.com/api/v2/[/red]"
             )
-        config.auth0_audience = auth0_audience
+        builder.set("auth0.audience", auth0_audience)
     elif auth_provider == AuthProvider.ENTRA:
         while True:
             entra_tenant_id = Prompt.ask(
@@ -272,7 +309,7 @@ def collect_interactive_config(
             console.print(
                 "[red]Invalid UUID format. Expected format: xxxxxxxx-xxxx-xxxx-xxxx-xxxxxxxxxxxx[/red]"
             )
-        config.entra_tenant_id = entra_tenant_id
+        builder.set("entra.tenant_id", entra_tenant_id)
     elif auth_provider == AuthProvider.KEYCLOAK:
         keycloak_default = f"https://{domain_value}/keycloak"
         while True:
@@ -285,7 +322,7 @@ def collect_interactive_config(
             console.print(
                 "[red]Invalid URL format. Expected an HTTPS URL (e.g. https://your-domain.com/keycloak)[/red]"
             )
-        config.keycloak_url = keycloak_url
+        builder.set("keycloak.url", keycloak_url)
         while True:
             keycloak_realm = Prompt.ask(
                 "  Keycloak Realm",
@@ -296,7 +333,21 @@ def collect_interactive_config(
             console.print(
                 "[red]Invalid realm name. Use only letters, numbers, hyphens, and underscores.[/red]"
             )
-        config.keycloak_realm = keycloak_realm
+        builder.set("keycloak.realm", keycloak_realm)
+
+    # --- Capacity sizing ---
+    if size:
+        size_choice = size.lower()
+    else:
+        console.print()
+        console.print("[bold]Capacity Configuration:[/bold]")
+        size_choice = Prompt.ask(
+            "  Sizing Tier (expected load; none = chart default replicas and resources)",
+            choices=["none", *(t.value for t in SizingTier)],
+            default="none",
+        )
+    if size_choice != "none":
+        builder.set("sizing.tier", SizingTier(size_choice))
 
     # --- Image registry ---
     console.print()
@@ -311,11 +362,12 @@ def collect_interactive_config(
         console.print(
             "[red]Invalid domain format. Expected format: ghcr.io, registry.example.com, etc.[/red]"
         )
-    config.image_registry_url = registry_url
-    config.image_registry_username = Prompt.ask(
+    builder.set("image_registry_url", registry_url)
+    registry_username = Prompt.ask(
         "  Registry Username",
         default="",
     )
+    builder.set("image_registry_username", registry_username)
     while True:
         registry_email = Prompt.ask(
             "  Registry Email",
@@ -326,6 +378,6 @@ def collect_interactive_config(
         console.print(
             "[red]Invalid email format. Expected format: user@example.com[/red]"
         )
-    config.image_registry_email = registry_email
+    builder.set("image_registry_email", registry_email)
 
-    return config
+    return builder.build()
@@ -0,0 +1,319 @@
+"""Local HTTP/JSON generation service behind `govctl serve`.
+
+Keeps govctl's modules (and each worker's values section cache and prefetched
+token-exchange keys) warm between requests, so that callers such as a
+provisioning portal pay for generation only, not for starting a process.
+Requests are handled on threads and generation runs on a process pool, the
+same way `govctl fleet` fans out environments.
+
+Endpoints:
+
+- ``POST /generate``: body is a JSON object of PlatformConfig fields, as in a
+  fleet manifest entry. Returns ``{"files": {name: content}, "problems":
+  [...]}``, files in values, secrets, bootstrap order; 400 with ``{"error":
+  ...}`` for an invalid configuration.
+- ``GET /metrics``: request counts by status and latency counters per route.
+- ``GET /healthz``: ``{"status": "ok"}``.
+
+The server only binds to loopback addresses or a unix socket: it hands out
+freshly generated secrets and has no authentication.
+"""
+
+import ipaddress
+import json
+import os
+import socketserver
+import stat
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+# Largest request body accepted; a configuration is a few hundred bytes
+MAX_BODY_BYTES = 1024 * 1024
+
+# Upper bounds of the latency histogram buckets, in milliseconds
+LATENCY_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+# Latencies kept per route for the percentiles in /metrics
+RECENT_LATENCIES = 1024
+
+
+def is_loopback(host: str) -> bool:
+    """Whether ``host`` is localhost or a loopback IP address."""
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def _warm_worker() -> None:
+    """Import the generators once per worker, before the first request."""
+    import govctl.generators.outputs  # noqa: F401
+
+
+def generate(data: dict[str, Any]) -> dict[str, Any]:
+    """Generate every output file for a configuration (runs in a worker).
+
+    Raises:
+        ValueError: If the configuration is invalid.
+    """
+    from govctl.core.chart_index import collecting_problems
+    from govctl.core.manifest import config_from_dict
+    from govctl.generators.keys import key_engine
+    from govctl.generators.outputs import generate_outputs
+
+    config = config_from_dict(data)
+    with collecting_problems() as problems:
+        files = generate_outputs(config)
+    # Have a key ready for the next request with the same algorithm
+    key_engine.prefetch_for(config)
+    return {"files": files, "problems": problems}
+
+
+class _RouteStats:
+    def __init__(self) -> None:
+        self.statuses: dict[int, int] = {}
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.recent: deque[float] = deque(maxlen=RECENT_LATENCIES)
+
+    def record(self, status: int, ms: float) -> None:
+        status = int(status)
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+        bucket = next(
+            (i for i, bound in enumerate(LATENCY_BUCKETS_MS) if ms <= bound),
+            len(LATENCY_BUCKETS_MS),
+        )
+        self.buckets[bucket] += 1
+        self.recent.append(ms)
+
+    def to_dict(self) -> dict[str, Any]:
+        recent = sorted(self.recent)
+
+        def percentile(p: float) -> float | None:
+            if not recent:
+                return None
+            return round(recent[min(len(recent) - 1, int(p * len(recent)))], 3)
+
+        # Cumulative, as in a Prometheus histogram
+        buckets, total = {}, 0
+        for bound, count in zip((*LATENCY_BUCKETS_MS, "+Inf"), self.buckets):
+            total += count
+            buckets[str(bound)] = total
+        return {
+            "requests": self.count,
+            "statuses": {str(status): n for status, n in sorted(self.statuses.items())},
+            "latency_ms": {
+                "total": round(self.total_ms, 3),
+                "mean": round(self.total_ms / self.count, 3) if self.count else None,
+                "max": round(self.max_ms, 3),
+                "p50": percentile(0.50),
+                "p90": percentile(0.90),
+                "p99": percentile(0.99),
+                "buckets": buckets,
+            },
+        }
+
+
+class LatencyCounters:
+    """Thread-safe request counters and latency histograms per route."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._routes: dict[str, _RouteStats] = {}
+        self._started = time.monotonic()
+        self.in_flight = 0
+
+    def start(self) -> None:
+        """Count a request as in flight until it is recorded."""
+        with self._lock:
+            self.in_flight += 1
+
+    def record(self, route: str, status: int, seconds: float) -> None:
+        with self._lock:
+            self.in_flight -= 1
+            self._routes.setdefault(route, _RouteStats()).record(status, seconds * 1000)
+
+    def to_dict(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "uptime_seconds": round(time.monotonic() - self._started, 3),
+                "in_flight": self.in_flight,
+                "routes": {
+                    route: stats.to_dict()
+                    for route, stats in sorted(self._routes.items())
+                },
+            }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep connections alive between requests
+    server: "GenerationServer"
+    body_read = False
+
+    def address_string(self) -> str:
+        # Unix socket clients have no (host, port) address
+        if isinstance(self.client_address, tuple):
+            return str(self.client_address[0])
+        return "unix"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if self.server.service.log_requests:
+            super().log_message(format, *args)
+
+    def do_GET(self) -> None:
+        self._dispatch("GET")
+
+    def do_POST(self) -> None:
+        self._dispatch("POST")
+
+    def _dispatch(self, method: str) -> None:
+        service = self.server.service
+        start = time.perf_counter()
+        route = self.path.split("?", 1)[0]
+        service.counters.start()
+        status = HTTPStatus.INTERNAL_SERVER_ERROR
+        self.body_read = False
+        try:
+            status, body = self._handle(method, route)
+            if not self.body_read and not self._has_no_body():
+                # An unread body (of any length or framing) would be taken
+                # for the next request on this connection
+                self.close_connection = True
+            self._send(status, body)
+        finally:
+            if route not in service.ROUTES:
+                route = "(other)"
+            service.counters.record(route, status, time.perf_counter() - start)
+
+    def _handle(self, method: str, route: str) -> tuple[int, dict[str, Any]]:
+        service = self.server.service
+        expected = service.ROUTES.get(route)
+        if expected is None:
+            return HTTPStatus.NOT_FOUND, {"error": f"No such endpoint: {route}"}
+        if method != expected:
+            return HTTPStatus.METHOD_NOT_ALLOWED, {"error": f"Use {expected} {route}"}
+        if route == "/healthz":
+            return HTTPStatus.OK, {"status": "ok"}
+        if route == "/metrics":
+            return HTTPStatus.OK, service.counters.to_dict()
+
+        if "Transfer-Encoding" in self.headers:
+            # Left unread, and the connection closed (see _dispatch)
+            return HTTPStatus.LENGTH_REQUIRED, {
+                "error": "Transfer-Encoding not supported; send Content-Length"
+            }
+        if len(self.headers.get_all("Content-Length", [])) > 1:
+            return HTTPStatus.BAD_REQUEST, {"error": "Multiple Content-Length headers"}
+        length = self.headers.get("Content-Length")
+        if length is None or not length.isdigit():
+            return HTTPStatus.LENGTH_REQUIRED, {"error": "Content-Length required"}
+        if int(length) > MAX_BODY_BYTES:
+            return HTTPStatus.REQUEST_ENTITY_TOO_LARGE, {
+                "error": f"Request body larger than {MAX_BODY_BYTES} bytes"
+            }
+        body, self.body_read = self.rfile.read(int(length)), True
+        try:
+            data = json.loads(body)
+        except ValueError as e:
+            return HTTPStatus.BAD_REQUEST, {"error": f"Invalid JSON: {e}"}
+        if not isinstance(data, dict):
+            return HTTPStatus.BAD_REQUEST, {"error": "Expected a JSON object"}
+
+        try:
+            return HTTPStatus.OK, service.executor.submit(generate, data).result()
+        except ValueError as e:
+            return HTTPStatus.BAD_REQUEST, {"error": str(e)}
+        except BrokenProcessPool:
+            return HTTPStatus.SERVICE_UNAVAILABLE, {"error": "Worker pool failed"}
+        except Exception as e:
+            return HTTPStatus.INTERNAL_SERVER_ERROR, {
+                "error": f"{type(e).__name__}: {e}"
+            }
+
+    def _has_no_body(self) -> bool:
+        """Whether the request's headers rule out a body."""
+        lengths = self.headers.get_all("Content-Length", [])
+        return "Transfer-Encoding" not in self.headers and all(
+            length.strip() == "0" for length in lengths
+        )
+
+    def _send(self, status: int, body: dict[str, Any]) -> None:
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        if self.close_connection:
+            self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+class GenerationService:
+    """State shared by the request handlers: worker pool and counters."""
+
+    # Endpoint -> allowed method
+    ROUTES = {"/generate": "POST", "/metrics": "GET", "/healthz": "GET"}
+
+    def __init__(self, workers: int, log_requests: bool = False):
+        self.executor = ProcessPoolExecutor(
+            max_workers=workers, initializer=_warm_worker
+        )
+        self.counters = LatencyCounters()
+        self.log_requests = log_requests
+        # Start every worker now rather than on the first requests
+        for future in [self.executor.submit(_warm_worker) for _ in range(workers)]:
+            future.result()
+
+    def shutdown(self) -> None:
+        self.executor.shutdown(cancel_futures=True)
+
+
+class GenerationServer(ThreadingHTTPServer):
+    """HTTP server on a loopback address."""
+
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], service: GenerationService):
+        if not is_loopback(address[0]):
+            raise ValueError(f"Refusing to listen on non-loopback address {address[0]}")
+        self.service = service
+        super().__init__(address, _Handler)
+
+
+class UnixGenerationServer(socketserver.ThreadingUnixStreamServer):
+    """HTTP server on a unix socket, only accessible to the current user."""
+
+    daemon_threads = True
+
+    def __init__(self, path: Path, service: GenerationService):
+        self.service = service
+        # Replace a socket left behind by a previous run, but nothing else
+        if path.exists() or path.is_symlink():
+            if not stat.S_ISSOCK(path.lstat().st_mode):
+                raise ValueError(f"{path} exists and is not a socket")
+            path.unlink()
+        super().__init__(str(path), _Handler, bind_and_activate=False)
+        old_umask = os.umask(0o177)
+        try:
+            self.server_bind()
+        finally:
+            os.umask(old_umask)
+        self.server_activate()
+
+    def server_close(self) -> None:
+        super().server_close()
+        Path(self.server_address).unlink(missing_ok=True)
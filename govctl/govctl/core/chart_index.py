@@ -0,0 +1,235 @@
+"""Key-path index of the charts' values.yaml files.
+
+Generated values are checked against this index so that a key the target
+chart does not know about (usually a typo) is reported when govctl runs,
+rather than after a deploy. The index is a trie of every key path in each
+chart's defaults, with its subcharts' keys merged in under their keys and
+their ``global`` keys merged into the chart's own ``global``. Leaves record
+the kind of value the chart expects.
+
+The index ships with govctl as ``chart_index.json``, next to this module,
+as the charts are not part of the package. Regenerate it whenever a chart's
+values.yaml changes, from the govctl/ directory:
+
+    python -m govctl.core.chart_index           # rewrite chart_index.json
+    python -m govctl.core.chart_index --check   # exit non-zero if it is stale
+
+Generators call ``validate(chart, data)`` on the data they emit; problems
+found inside a ``collecting_problems()`` block are gathered for the command
+to report.
+"""
+
+import argparse
+import json
+import sys
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterator
+
+from govctl.core.coalesce import GLOBAL_KEY
+
+if TYPE_CHECKING:
+    from govctl.core.charts import Chart
+
+# The chart the generated values.yaml and secrets.yaml are for
+UMBRELLA_CHART = "governance-platform"
+
+INDEX_PATH = Path(__file__).resolve().parent / "chart_index.json"
+INDEX_VERSION = 1
+
+# Leaf kinds. A trie node is either a dict of child nodes or one of these.
+ANY = "any"  # null defaults and subcharts without vendored defaults
+MAP = "map"  # free-form mapping, e.g. `annotations: {}`
+LIST = "list"
+BOOL = "bool"
+NUMBER = "number"
+STRING = "string"
+
+Node = dict[str, Any] | str
+
+
+def _kind(value: Any) -> str:
+    if isinstance(value, list):
+        return LIST
+    if isinstance(value, bool):
+        return BOOL
+    if isinstance(value, (int, float)):
+        return NUMBER
+    if isinstance(value, dict):
+        return MAP
+    return STRING
+
+
+def values_trie(values: Any) -> Node:
+    """Trie of every key path in a values mapping."""
+    if isinstance(values, dict):
+        if not values:
+            return MAP
+        return {key: values_trie(value) for key, value in values.items()}
+    if values is None:
+        return ANY
+    return _kind(values)
+
+
+def merge_tries(a: Node | None, b: Node) -> Node:
+    """Union of two tries: a path is known if either knows it."""
+    if a is None or a == b:
+        return b
+    if isinstance(a, dict) and isinstance(b, dict):
+        merged = dict(a)
+        for key, node in b.items():
+            merged[key] = merge_tries(merged.get(key), node)
+        return merged
+    if MAP in (a, b) and (isinstance(a, dict) or isinstance(b, dict)):
+        return MAP
+    # Null defaults and conflicting kinds: accept anything
+    return ANY
+
+
+def chart_trie(chart: "Chart") -> Node:
+    """Trie of a chart's values, including those of its subcharts."""
+    trie = values_trie(chart.values)
+    if not isinstance(trie, dict):
+        trie = {}
+    for dependency, subchart in chart.dependencies:
+        if subchart is None:
+            trie[dependency.key] = ANY
+            continue
+        subtrie = chart_trie(subchart)
+        if isinstance(subtrie, dict) and GLOBAL_KEY in subtrie:
+            subtrie = dict(subtrie)
+            trie[GLOBAL_KEY] = merge_tries(
+                trie.get(GLOBAL_KEY), subtrie.pop(GLOBAL_KEY)
+            )
+        trie[dependency.key] = merge_tries(trie.get(dependency.key), subtrie)
+    return trie
+
+
+def build_index(charts_dir: Path) -> dict[str, Any]:
+    """Build the index of every chart under ``charts_dir``."""
+    from govctl.core.charts import load_chart
+
+    charts = {}
+    for chart_dir in sorted(charts_dir.iterdir()):
+        if not (chart_dir / "Chart.yaml").is_file():
+            continue
+        chart = load_chart(chart_dir)
+        charts[chart.name] = chart_trie(chart)
+    return {"version": INDEX_VERSION, "charts": charts}
+
+
+@lru_cache(maxsize=1)
+def load_index() -> dict[str, Node]:
+    """The packaged index: chart name to key-path trie."""
+    with open(INDEX_PATH, "rb") as f:
+        index = json.load(f)
+    if index.get("version") != INDEX_VERSION:
+        raise ValueError(f"{INDEX_PATH.name} is out of date; regenerate it")
+    return index["charts"]
+
+
+def check_values(chart: str, values: dict[str, Any]) -> list[str]:
+    """Report keys of ``values`` that ``chart`` does not know, or of the wrong kind.
+
+    Returns:
+        One message per problem, each starting with the dotted key path.
+    """
+    trie = load_index().get(chart)
+    if trie is None:
+        return [f"{chart}: not a known chart"]
+    problems: list[str] = []
+    _check(trie, values, "", problems)
+    return problems
+
+
+def _check(node: Node, value: Any, path: str, problems: list[str]) -> None:
+    if node == ANY or value is None:
+        return
+    if isinstance(node, dict):
+        if not isinstance(value, dict):
+            problems.append(f"{path}: expected a mapping, got {_kind(value)}")
+            return
+        for key, child in value.items():
+            child_path = f"{path}.{key}" if path else str(key)
+            if key in node:
+                _check(node[key], child, child_path, problems)
+            else:
+                problems.append(f"{child_path}: unknown key")
+        return
+    kind = _kind(value)
+    if kind != node:
+        problems.append(f"{path}: expected {node}, got {kind}")
+
+
+_problems: list[str] | None = None
+
+
+def validate(chart: str, values: dict[str, Any]) -> list[str]:
+    """Check values against a chart and report the problems to the collector.
+
+    Returns:
+        The problems, each prefixed with the chart name.
+    """
+    problems = [f"{chart}: {problem}" for problem in check_values(chart, values)]
+    report(problems)
+    return problems
+
+
+def report(problems: list[str]) -> None:
+    """Add problems found earlier (e.g. cached with a fragment) to the collector."""
+    if _problems is not None:
+        _problems.extend(problems)
+
+
+@contextmanager
+def collecting_problems() -> Iterator[list[str]]:
+    """Gather the problems reported by generators within the block."""
+    global _problems
+    problems: list[str] = []
+    previous, _problems = _problems, problems
+    try:
+        yield problems
+    finally:
+        _problems = previous
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Regenerate chart_index.json")
+    parser.add_argument(
+        "charts_dir",
+        nargs="?",
+        type=Path,
+        help="Directory holding the charts (default: charts/ in this or a parent "
+        "directory)",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Exit non-zero if chart_index.json does not match the charts",
+    )
+    args = parser.parse_args()
+
+    charts_dir = args.charts_dir
+    if charts_dir is None:
+        from govctl.core.charts import find_umbrella_chart
+
+        umbrella = find_umbrella_chart(Path.cwd())
+        if umbrella is None:
+            parser.error("no charts/ directory found; pass it explicitly")
+        charts_dir = umbrella.parent
+
+    index = build_index(charts_dir)
+    content = json.dumps(index, separators=(",", ":"), sort_keys=True) + "\n"
+    if args.check:
+        if not INDEX_PATH.is_file() or INDEX_PATH.read_text() != content:
+            print(f"{INDEX_PATH} is stale; run python -m govctl.core.chart_index")
+            sys.exit(1)
+        print(f"{INDEX_PATH.name} is up to date")
+        return
+    INDEX_PATH.write_text(content)
+    print(f"Wrote {INDEX_PATH} ({len(index['charts'])} charts)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,326 @@
+"""Helm chart loading and effective values for govctl.
+
+Computes the values each chart of a release is rendered with, the way
+``helm template`` would, without running Helm: the ``-f`` files are merged
+and coalesced over the umbrella chart's defaults and then, level by level,
+over each enabled subchart's defaults (see ``govctl.core.coalesce``).
+
+Chart defaults are several thousand lines of YAML, so parsed ``values.yaml``
+files are cached on disk as JSON, keyed by the SHA-256 of their content.
+"""
+
+import hashlib
+import io
+import json
+import tarfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from govctl.core.chart_index import UMBRELLA_CHART
+from govctl.core.coalesce import (
+    Values,
+    coalesce_globals,
+    coalesce_values,
+    condition_enabled,
+    merge_values,
+)
+from govctl.utils.cache import cache_dir, write_atomic
+from govctl.utils.profiling import phase
+from govctl.utils.yaml import _FastLoader
+
+# In-process layer over the disk cache, by content hash
+_parsed: dict[str, Any] = {}
+
+
+@dataclass(frozen=True)
+class Dependency:
+    """One entry of a chart's ``dependencies`` list."""
+
+    name: str
+    repository: str = ""
+    alias: str | None = None
+    condition: str | None = None
+
+    @property
+    def key(self) -> str:
+        """The key the subchart's values live under in its parent."""
+        return self.alias or self.name
+
+
+@dataclass
+class Chart:
+    """A chart's defaults and its resolved dependencies.
+
+    A dependency's chart is ``None`` when it is neither vendored under the
+    chart's ``charts/`` directory nor a ``file://`` dependency, e.g. remote
+    charts before ``helm dependency build`` has run.
+    """
+
+    name: str
+    values: Values
+    version: str = ""
+    app_version: str = ""
+    dependencies: list[tuple[Dependency, "Chart | None"]] = field(default_factory=list)
+
+
+@dataclass
+class EffectiveValues:
+    """Effective values of a release, per chart.
+
+    ``charts`` maps the umbrella chart's name to its values (without those of
+    its enabled subcharts) and each enabled subchart's key to the values it
+    is rendered with, in dependency order.
+    """
+
+    charts: dict[str, Values] = field(default_factory=dict)
+    # Dotted paths of disabled subcharts, and of those without defaults
+    disabled: list[str] = field(default_factory=list)
+    unavailable: list[str] = field(default_factory=list)
+    warnings: list[str] = field(default_factory=list)
+
+
+def find_umbrella_chart(start: Path) -> Path | None:
+    """Find ``charts/governance-platform`` in ``start`` or one of its parents."""
+    for directory in (start, *start.parents):
+        candidate = directory / "charts" / UMBRELLA_CHART
+        if (candidate / "Chart.yaml").is_file():
+            return candidate
+    return None
+
+
+def parse_yaml_cached(content: bytes) -> Any:
+    """Parse YAML, reusing an earlier parse of the same content if cached.
+
+    Documents that JSON cannot represent exactly (non-string keys, dates,
+    ...) are parsed every time.
+    """
+    digest = hashlib.sha256(content).hexdigest()
+    if digest in _parsed:
+        return _parsed[digest]
+
+    try:
+        path = cache_dir("chart-values") / f"{digest}.json"
+    except OSError:
+        path = None
+
+    try:
+        data = json.loads(path.read_bytes()) if path else None
+    except (OSError, ValueError):
+        data = None
+    if data is None:
+        data = yaml.load(content, Loader=_FastLoader)
+        if path and _json_exact(data):
+            write_atomic(path, json.dumps(data, separators=(",", ":")).encode())
+
+    _parsed[digest] = data
+    return data
+
+
+def _json_exact(data: Any) -> bool:
+    """Whether ``data`` round-trips through JSON unchanged."""
+    if isinstance(data, dict):
+        return all(
+            isinstance(key, str) and _json_exact(value) for key, value in data.items()
+        )
+    if isinstance(data, list):
+        return all(_json_exact(item) for item in data)
+    return data is None or isinstance(data, (str, int, float, bool))
+
+
+def load_chart(path: Path) -> Chart:
+    """Load a chart from a directory or a packaged ``.tgz``.
+
+    Raises:
+        ValueError: If ``path`` is not a chart.
+        OSError: If it cannot be read.
+    """
+    if path.is_dir():
+        return _load_chart_dir(path)
+    return _load_chart_archive(path.read_bytes(), str(path))
+
+
+def _load_chart_dir(path: Path) -> Chart:
+    chart_file = path / "Chart.yaml"
+    if not chart_file.is_file():
+        raise ValueError(f"{path} is not a chart (no Chart.yaml)")
+    values_file = path / "values.yaml"
+    values = values_file.read_bytes() if values_file.is_file() else b""
+
+    vendored = []
+    charts_dir = path / "charts"
+    if charts_dir.is_dir():
+        for entry in sorted(charts_dir.iterdir()):
+            if entry.suffix == ".tgz" or (entry / "Chart.yaml").is_file():
+                vendored.append(load_chart(entry))
+
+    return _build_chart(chart_file.read_bytes(), values, vendored, str(path), path)
+
+
+def _load_chart_archive(content: bytes, source: str) -> Chart:
+    """Load a packaged chart, reading only the files needed for its values."""
+    files = {}
+    try:
+        with tarfile.open(fileobj=io.BytesIO(content), mode="r:*") as archive:
+            for member in archive:
+                # Members are <chart>/<path>; only Chart.yaml, values.yaml
+                # and whatever is under charts/ are needed
+                _, _, relative = member.name.partition("/")
+                if member.isfile() and (
+                    relative in ("Chart.yaml", "values.yaml")
+                    or relative.startswith("charts/")
+                ):
+                    files[relative] = archive.extractfile(member).read()
+    except tarfile.TarError as e:
+        raise ValueError(f"{source} is not a chart archive: {e}") from None
+    return _chart_from_files(files, source)
+
+
+def _chart_from_files(files: dict[str, bytes], source: str) -> Chart:
+    if "Chart.yaml" not in files:
+        raise ValueError(f"{source} is not a chart (no Chart.yaml)")
+
+    vendored = []
+    unpacked: dict[str, dict[str, bytes]] = {}
+    for relative, content in sorted(files.items()):
+        parts = relative.split("/", 2)
+        if parts[0] != "charts" or len(parts) < 2:
+            continue
+        if len(parts) == 2 and parts[1].endswith(".tgz"):
+            vendored.append(_load_chart_archive(content, f"{source}/{relative}"))
+        elif len(parts) == 3:
+            unpacked.setdefault(parts[1], {})[parts[2]] = content
+    for name, subchart_files in unpacked.items():
+        if "Chart.yaml" in subchart_files:
+            vendored.append(
+                _chart_from_files(subchart_files, f"{source}/charts/{name}")
+            )
+
+    return _build_chart(
+        files["Chart.yaml"], files.get("values.yaml", b""), vendored, source, None
+    )
+
+
+def _build_chart(
+    chart_yaml: bytes,
+    values_yaml: bytes,
+    vendored: list[Chart],
+    source: str,
+    directory: Path | None,
+) -> Chart:
+    metadata = parse_yaml_cached(chart_yaml)
+    if not isinstance(metadata, dict) or not metadata.get("name"):
+        raise ValueError(f"{source}/Chart.yaml has no chart name")
+    values = parse_yaml_cached(values_yaml) or {}
+    if not isinstance(values, dict):
+        raise ValueError(f"{source}/values.yaml is not a mapping")
+
+    by_name = {chart.name: chart for chart in vendored}
+    dependencies = []
+    for entry in metadata.get("dependencies") or []:
+        dependency = Dependency(
+            name=entry["name"],
+            repository=entry.get("repository") or "",
+            alias=entry.get("alias"),
+            condition=entry.get("condition"),
+        )
+        # Like Helm, prefer the vendored copy; fall back to file:// sources so
+        # that charts work from a checkout before `helm dependency build`
+        chart = by_name.get(dependency.name)
+        if chart is None and directory and dependency.repository.startswith("file://"):
+            local = directory / dependency.repository.removeprefix("file://")
+            if (local / "Chart.yaml").is_file():
+                chart = load_chart(local.resolve())
+        dependencies.append((dependency, chart))
+
+    return Chart(
+        name=metadata["name"],
+        values=values,
+        version=str(metadata.get("version") or ""),
+        app_version=str(metadata.get("appVersion") or ""),
+        dependencies=dependencies,
+    )
+
+
+def effective_values(chart: Chart, layers: list[Values]) -> EffectiveValues:
+    """Compute the values each chart of a release is rendered with.
+
+    Args:
+        chart: The umbrella chart.
+        layers: Parsed ``-f`` values files, in command-line order.
+    """
+    result = EffectiveValues()
+    values = release_values(chart, layers, result)
+
+    subcharts = {
+        dependency.key
+        for dependency, _ in chart.dependencies
+        if dependency.key not in result.disabled
+    }
+    result.charts[chart.name] = {
+        key: value for key, value in values.items() if key not in subcharts
+    }
+    for dependency, _ in chart.dependencies:
+        if dependency.key in subcharts:
+            result.charts[dependency.key] = values[dependency.key]
+    return result
+
+
+def release_values(
+    chart: Chart, layers: list[Values], result: EffectiveValues | None = None
+) -> Values:
+    """The ``.Values`` the umbrella chart's own templates are rendered with.
+
+    Includes every enabled subchart's effective values under its key.
+    Disabled and missing subcharts are recorded in ``result``, if given.
+    """
+    with phase("coalesce values"):
+        if result is None:
+            result = EffectiveValues()
+        return _coalesce(chart, merge_values(layers), "", result)
+
+
+def _coalesce(
+    chart: Chart, values: Values, prefix: str, result: EffectiveValues
+) -> Values:
+    """Coalesce values over a chart's defaults and those of its enabled subcharts."""
+    warn = result.warnings.append
+    values = coalesce_values(values, chart.values, prefix, warn)
+
+    # Conditions may be answered by a subchart's own defaults (`enabled: true`)
+    lookup = dict(values)
+    for dependency, subchart in chart.dependencies:
+        own = values.get(dependency.key)
+        if subchart is not None and isinstance(own, (dict, type(None))):
+            lookup[dependency.key] = coalesce_values(
+                own or {}, subchart.values, "", _quiet
+            )
+
+    merged = dict(values)
+    for dependency, subchart in chart.dependencies:
+        path = f"{prefix}{dependency.key}"
+        if not condition_enabled(dependency.condition, lookup, prefix, warn):
+            result.disabled.append(path)
+            continue
+
+        own = values.get(dependency.key)
+        if own is None:
+            own = {}
+        elif not isinstance(own, dict):
+            raise ValueError(
+                f"{path}: values for a subchart must be a table, "
+                f"not {type(own).__name__}"
+            )
+        own = coalesce_globals(own, values, f"{path}.", warn)
+        if subchart is None:
+            result.unavailable.append(path)
+            merged[dependency.key] = own
+        else:
+            merged[dependency.key] = _coalesce(subchart, own, f"{path}.", result)
+    return merged
+
+
+def _quiet(message: str) -> None:
+    pass
@@ -0,0 +1,155 @@
+"""Helm's values merge semantics.
+
+Follows ``pkg/chartutil/coalesce.go`` and ``pkg/cli/values`` in Helm 3:
+
+- ``-f`` files are merged in order, later files winning; maps merge
+  recursively, anything else is replaced.
+- User values are then coalesced over the chart defaults: maps merge
+  recursively, user scalars win, and a user ``null`` deletes the default.
+- Each subchart sees its parent's values under its name (or alias), with the
+  parent's ``global`` copied in over its own and its defaults coalesced in.
+- Subcharts whose ``condition`` is false are left out.
+
+None of these functions mutate their arguments: merged maps are new dicts,
+and values taken unchanged from either side are shared, so callers must treat
+the results as read-only.
+"""
+
+from typing import Any, Callable
+
+GLOBAL_KEY = "global"
+
+Values = dict[str, Any]
+Warn = Callable[[str], None]
+
+
+def merge_values(layers: list[Values]) -> Values:
+    """Merge ``-f`` values files, later layers overriding earlier ones."""
+    merged: Values = {}
+    for layer in layers:
+        merged = _merge_maps(merged, layer)
+    return merged
+
+
+def _merge_maps(base: Values, override: Values) -> Values:
+    merged = dict(base)
+    for key, value in override.items():
+        current = merged.get(key)
+        if isinstance(value, dict) and isinstance(current, dict):
+            merged[key] = _merge_maps(current, value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def coalesce_values(
+    values: Values, defaults: Values, prefix: str, warn: Warn
+) -> Values:
+    """Coalesce user values over one chart's own defaults (not its subcharts')."""
+    result = dict(values)
+    for key, default in defaults.items():
+        if key not in values:
+            result[key] = default
+            continue
+        value = values[key]
+        if value is None:
+            del result[key]
+        elif isinstance(value, dict):
+            if isinstance(default, dict):
+                result[key] = coalesce_tables(value, default, f"{prefix}{key}", warn)
+            elif default is not None:
+                warn(f"{prefix}{key}: skipped value, the chart default is not a table")
+    return result
+
+
+def coalesce_tables(dst: Values, src: Values, prefix: str, warn: Warn) -> Values:
+    """Coalesce ``dst`` over ``src``, recursively; ``dst`` wins.
+
+    Unlike at the top level of a chart's values, a ``null`` in ``dst`` is
+    dropped even when ``src`` has no such key.
+    """
+    result = {key: value for key, value in dst.items() if value is not None}
+    for key, src_value in src.items():
+        if key not in dst:
+            result[key] = src_value
+            continue
+        dst_value = dst[key]
+        if dst_value is None:
+            continue
+        if isinstance(src_value, dict):
+            if isinstance(dst_value, dict):
+                result[key] = coalesce_tables(
+                    dst_value, src_value, f"{prefix}.{key}", warn
+                )
+            else:
+                warn(f"{prefix}.{key}: cannot overwrite table with non-table value")
+        elif isinstance(dst_value, dict) and src_value is not None:
+            warn(f"{prefix}.{key}: destination is a table, ignoring non-table value")
+    return result
+
+
+def coalesce_globals(child: Values, parent: Values, prefix: str, warn: Warn) -> Values:
+    """Copy the parent's ``global`` into a subchart's values, parent winning."""
+    child_globals = child.get(GLOBAL_KEY, {})
+    parent_globals = parent.get(GLOBAL_KEY, {})
+    if not isinstance(child_globals, dict):
+        warn(f"{prefix}{GLOBAL_KEY}: not a table, parent globals skipped")
+        return child
+    if not isinstance(parent_globals, dict):
+        warn(f"{GLOBAL_KEY}: not a table, not copied to {prefix.rstrip('.')}")
+        return child
+
+    merged = dict(child_globals)
+    for key, value in parent_globals.items():
+        current = merged.get(key)
+        if isinstance(value, dict):
+            if key not in merged:
+                merged[key] = value
+            elif not isinstance(current, dict):
+                warn(f"{prefix}{GLOBAL_KEY}.{key}: is a table in the parent, skipped")
+            else:
+                # Globals merge top-down: the parent's entries win
+                merged[key] = coalesce_tables(
+                    value, current, f"{prefix}{GLOBAL_KEY}.{key}", warn
+                )
+        elif isinstance(current, dict):
+            warn(f"{prefix}{GLOBAL_KEY}.{key}: is a table, ignoring the parent value")
+        else:
+            merged[key] = value
+    return {**child, GLOBAL_KEY: merged}
+
+
+def path_value(values: Values, path: str) -> Any:
+    """Look up a dotted path such as ``auth-service.enabled``.
+
+    Raises:
+        KeyError: If any part of the path is missing.
+    """
+    node: Any = values
+    for part in path.split("."):
+        if not isinstance(node, dict) or part not in node:
+            raise KeyError(path)
+        node = node[part]
+    return node
+
+
+def condition_enabled(
+    condition: str | None, values: Values, prefix: str, warn: Warn
+) -> bool:
+    """Evaluate a dependency's ``condition`` against its parent's values.
+
+    The first comma-separated path that resolves to a boolean decides; a
+    subchart with no condition, or none that resolves, is enabled.
+    """
+    for path in (condition or "").split(","):
+        path = path.strip()
+        if not path:
+            continue
+        try:
+            value = path_value(values, path)
+        except KeyError:
+            continue
+        if isinstance(value, bool):
+            return value
+        warn(f"{prefix}{path}: condition returned non-bool value, ignored")
+    return True
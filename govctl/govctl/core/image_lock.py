@@ -0,0 +1,130 @@
+"""Image lock files: the images to deploy, pinned to their digests.
+
+An image lock file is a YAML mapping of each image govctl configures to a
+pinned reference, ``repository:tag@sha256:<digest>``::
+
+    images:
+      auth-service: ghcr.io/eqtylab/auth-service:1.1.1@sha256:8de9...
+      governance-service: ghcr.io/eqtylab/governance-service:1.1.1@sha256:89b9...
+      ...
+      keycloak-bootstrap: dwdraju/alpine-curl-jq:latest@sha256:...
+      postgresql: docker.io/bitnamilegacy/postgresql:17-debian-12@sha256:...
+
+The digests of the platform's own images are in each release's
+``releases/<version>/release-manifest.yaml``. With a lock, every generated
+image gets the locked repository and a ``tag@digest`` tag (the charts render
+``repository:tag``, so the digest rides along in the tag and the runtime
+pulls by it), with pull policy ``IfNotPresent``: a pinned image never
+changes, so a pod that starts on a node which already has the image uses
+the node's copy instead of asking the registry again. Without a lock the
+generated values follow the ``latest`` tags with pull policy ``Always``.
+
+A lock must cover every image the configuration deploys (the platform's, its
+auth provider's bootstrap image, the bundled PostgreSQL unless the database
+is external, and PgBouncer with ``enable_pgbouncer``); loading or applying an
+incomplete one fails before anything is generated.
+"""
+
+import dataclasses
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from govctl.core.models import IMAGE_REF_PATTERN, ImageLockConfig, PlatformConfig
+
+# Lock file name of each image -> ImageLockConfig field
+LOCK_NAMES: dict[str, str] = {
+    field.name.replace("_", "-"): field.name
+    for field in dataclasses.fields(ImageLockConfig)
+}
+
+
+def image_depends_on(name: str) -> str:
+    """The PlatformConfig field path of an image's lock entry."""
+    return f"images.{LOCK_NAMES[name]}"
+
+
+def load_image_lock(path: str | Path) -> ImageLockConfig:
+    """Load an image lock file.
+
+    Raises:
+        OSError: If the file cannot be read.
+        ValueError: If the file is not a lock file, names an unknown image or
+            has an invalid reference.
+    """
+    with open(path) as f:
+        try:
+            lock = yaml.safe_load(f) or {}
+        except yaml.YAMLError as e:
+            raise ValueError(f"Invalid YAML: {e}") from None
+
+    images = lock.get("images") if isinstance(lock, dict) else None
+    if not isinstance(images, dict):
+        raise ValueError("Image lock must be a mapping with an 'images' mapping")
+
+    unknown = sorted(set(images) - set(LOCK_NAMES))
+    if unknown:
+        raise ValueError(f"Unknown image(s) in lock: {', '.join(unknown)}")
+
+    return ImageLockConfig(
+        **{LOCK_NAMES[name]: str(ref or "") for name, ref in images.items()}
+    )
+
+
+def image_lock_fields(lock: ImageLockConfig) -> dict[str, str]:
+    """A lock's entries by flat field name (``image_auth_service``, ...).
+
+    For merging into fleet manifest environments and other flat mappings.
+    """
+    return {
+        f"image_{field.name}": getattr(lock, field.name)
+        for field in dataclasses.fields(lock)
+        if getattr(lock, field.name)
+    }
+
+
+def _split_registry(repository: str) -> tuple[str, str]:
+    """Split a repository into its registry and path, as docker resolves it."""
+    host, _, path = repository.partition("/")
+    if path and ("." in host or ":" in host or host == "localhost"):
+        return host, path
+    return "docker.io", repository
+
+
+def image_values(
+    config: PlatformConfig,
+    name: str,
+    repository: str | None = None,
+    pull_policy: str = "Always",
+    registry: bool = False,
+) -> dict[str, Any]:
+    """The ``image`` values of one image: pinned when the config has a lock.
+
+    Args:
+        config: The configuration.
+        name: The image's lock file name (a key of ``LOCK_NAMES``).
+        repository: Repository to set when unpinned; otherwise the chart's.
+        pull_policy: Pull policy when unpinned.
+        registry: Whether the chart takes the registry separately
+            (``image.registry``, as the Bitnami-style charts do); a pinned
+            repository is then split into its registry and path.
+    """
+    if not config.images.enabled:
+        values: dict[str, Any] = {"repository": repository} if repository else {}
+        values.update({"tag": "latest", "pullPolicy": pull_policy})
+        return values
+
+    ref = getattr(config.images, LOCK_NAMES[name])
+    match = IMAGE_REF_PATTERN.fullmatch(ref)
+    if match is None:
+        # PlatformConfig rejects incomplete locks; this is a generator bug
+        raise ValueError(f"Image lock has no entry for: {name}")
+    values = {"repository": match["repository"]}
+    if registry:
+        host, path = _split_registry(match["repository"])
+        values = {"registry": host, "repository": path}
+    values.update(
+        {"tag": f"{match['tag']}@{match['digest']}", "pullPolicy": "IfNotPresent"}
+    )
+    return values
@@ -0,0 +1,174 @@
+"""Fleet manifest loading for govctl."""
+
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from govctl.core.models import (
+    FIELD_PATHS,
+    FIELD_TYPES,
+    AuthProvider,
+    DatabaseMode,
+    PlatformConfig,
+    PlatformConfigBuilder,
+)
+from govctl.utils.validate import is_valid_domain, is_valid_environment_name
+
+# Fields that must be present for every environment (after defaults are applied)
+REQUIRED_FIELDS = ("cloud_provider", "domain", "environment", "auth_provider")
+
+
+@dataclass
+class FleetEntry:
+    """A single environment in a fleet manifest."""
+
+    name: str
+    data: dict[str, Any]
+
+
+def config_from_dict(data: dict[str, Any]) -> PlatformConfig:
+    """Build a PlatformConfig from a mapping of field names to values.
+
+    Fields use their flat names (e.g. ``keycloak_realm`` for
+    ``config.keycloak.realm``, see ``FLAT_FIELDS``). Enum fields accept their
+    string values (e.g. ``cloud_provider: gcp``) and string fields numbers;
+    every other value must have the field's type. Null keeps a field's
+    default. ``token_exchange_key_algorithm`` is only accepted with the
+    Keycloak auth provider.
+    The database mode follows the same default as ``govctl init``: external
+    for ``production``, bundled otherwise.
+
+    Raises:
+        ValueError: If a field is unknown, missing, or has an invalid value.
+    """
+    unknown = sorted(set(data) - set(FIELD_PATHS))
+    if unknown:
+        raise ValueError(f"Unknown config field(s): {', '.join(unknown)}")
+
+    missing = [name for name in REQUIRED_FIELDS if not data.get(name)]
+    if missing:
+        raise ValueError(f"Missing required field(s): {', '.join(missing)}")
+
+    kwargs: dict[str, Any] = {}
+    for name, value in data.items():
+        if value is None:
+            continue  # null keeps the field's default
+        field_type = FIELD_TYPES[FIELD_PATHS[name]]
+        if isinstance(field_type, type) and issubclass(field_type, Enum):
+            try:
+                value = field_type(str(value).lower())
+            except ValueError:
+                choices = ", ".join(member.value for member in field_type)
+                raise ValueError(
+                    f"Invalid value for {name}: {value!r} (expected one of: {choices})"
+                ) from None
+        elif field_type is int:
+            try:
+                if isinstance(value, (bool, float)):
+                    raise TypeError
+                value = int(value)
+            except (TypeError, ValueError):
+                raise ValueError(
+                    f"Invalid value for {name}: {value!r} (expected an integer)"
+                ) from None
+        elif field_type is bool:
+            if not isinstance(value, bool):
+                raise ValueError(
+                    f"Invalid value for {name}: {value!r} (expected true or false)"
+                )
+        elif field_type is str:
+            # YAML reads unquoted numbers as numbers; take them as written
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                value = str(value)
+            elif not isinstance(value, str):
+                raise ValueError(
+                    f"Invalid value for {name}: {value!r} (expected a string)"
+                )
+        kwargs[name] = value
+
+    kwargs["environment"] = kwargs["environment"].lower()
+    if (
+        "token_exchange_key_algorithm" in kwargs
+        and kwargs["auth_provider"] != AuthProvider.KEYCLOAK
+    ):
+        # Only Keycloak's token exchange uses the key
+        raise ValueError(
+            "Invalid value for token_exchange_key_algorithm: "
+            f"{kwargs['token_exchange_key_algorithm'].value!r} (only used with "
+            f"auth_provider keycloak, not {kwargs['auth_provider'].value})"
+        )
+    if not is_valid_domain(kwargs["domain"]):
+        raise ValueError(f"Invalid domain format: {kwargs['domain']!r}")
+
+    if "database_mode" not in kwargs:
+        kwargs["database_mode"] = (
+            DatabaseMode.EXTERNAL
+            if kwargs["environment"] == "production"
+            else DatabaseMode.BUNDLED
+        )
+
+    builder = PlatformConfigBuilder()
+    for name, value in kwargs.items():
+        builder.set(FIELD_PATHS[name], value)
+    return builder.build()
+
+
+def load_manifest(path: str | Path) -> list[FleetEntry]:
+    """Load a fleet manifest.
+
+    The manifest is a YAML mapping with an optional ``defaults`` block and an
+    ``environments`` list. Each environment is a mapping of PlatformConfig
+    fields plus an optional ``name`` (defaults to the environment name) that
+    must be unique across the fleet and is used as its output directory::
+
+        defaults:
+          cloud_provider: gcp
+          auth_provider: keycloak
+        environments:
+          - name: acme-prod
+            domain: governance.acme.example.com
+            environment: production
+
+    Entries are returned unvalidated so that one bad environment does not
+    prevent the rest of the fleet from being generated.
+
+    Raises:
+        ValueError: If the manifest structure itself is invalid.
+    """
+    with open(path) as f:
+        manifest = yaml.safe_load(f) or {}
+
+    if not isinstance(manifest, dict):
+        raise ValueError("Manifest must be a mapping with an 'environments' list")
+
+    defaults = manifest.get("defaults") or {}
+    environments = manifest.get("environments") or []
+    if not isinstance(defaults, dict):
+        raise ValueError("'defaults' must be a mapping")
+    if not isinstance(environments, list):
+        raise ValueError("'environments' must be a list")
+
+    entries: list[FleetEntry] = []
+    seen: set[str] = set()
+    for index, environment in enumerate(environments):
+        if not isinstance(environment, dict):
+            raise ValueError(f"Environment #{index + 1} must be a mapping")
+
+        data = {**defaults, **environment}
+        name = str(data.pop("name", None) or data.get("environment") or "")
+        if not name:
+            raise ValueError(f"Environment #{index + 1} has no name or environment")
+        if not is_valid_environment_name(name):
+            raise ValueError(
+                f"Invalid environment name: {name!r} (use letters, numbers, '.', '_', '-')"
+            )
+        if name in seen:
+            raise ValueError(f"Duplicate environment name: {name}")
+        seen.add(name)
+
+        entries.append(FleetEntry(name=name, data=data))
+
+    return entries
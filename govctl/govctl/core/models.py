@@ -1,7 +1,14 @@
 """Configuration models for govctl."""
 
+import dataclasses
+import hashlib
+import json
+import re
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, get_args
 
 
 class CloudProvider(str, Enum):
@@ -27,6 +34,19 @@ class DatabaseMode(str, Enum):
     EXTERNAL = "external"
 
 
+class KeyAlgorithm(str, Enum):
+    RSA_2048 = "rsa-2048"
+    RSA_3072 = "rsa-3072"
+    EC_P256 = "ec-p256"
+    ED25519 = "ed25519"
+
+
+class SizingTier(str, Enum):
+    SMALL = "small"
+    MEDIUM = "medium"
+    LARGE = "large"
+
+
 # Mapping of cloud provider to storage provider
 CLOUD_TO_STORAGE = {
     CloudProvider.AWS: "aws_s3",
@@ -34,10 +54,166 @@ CLOUD_TO_STORAGE = {
     CloudProvider.GCP: "gcs",
 }
 
+# Mapping of key algorithm to the JWS algorithm used to sign with it
+KEY_ALGORITHM_TO_JWS = {
+    KeyAlgorithm.RSA_2048: "RS256",
+    KeyAlgorithm.RSA_3072: "RS256",
+    KeyAlgorithm.EC_P256: "ES256",
+    KeyAlgorithm.ED25519: "EdDSA",
+}
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class AwsKmsConfig:
+    """AWS KMS settings (key management provider ``aws_kms``)."""
+
+    region: str = ""
+    endpoint: str = ""
+    alias_prefix: str = ""
+    deletion_window_days: int = 7
+
+
+@dataclass(frozen=True, slots=True)
+class AzureKeyVaultConfig:
+    """Azure Key Vault settings (key management provider ``azure_key_vault``)."""
+
+    url: str = ""
+    tenant_id: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class GcpKmsConfig:
+    """GCP KMS settings (key management provider ``gcp_kms``)."""
+
+    project_id: str = ""
+    location_id: str = ""
+    key_ring_id: str = "eqtylab-did"
+    scheduled_destroy_days: int = 24
+
+
+@dataclass(frozen=True, slots=True)
+class Auth0Config:
+    """Auth0 settings (auth provider ``auth0``)."""
+
+    domain: str = ""
+    audience: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class EntraConfig:
+    """Microsoft Entra ID settings (auth provider ``entra``)."""
+
+    tenant_id: str = ""
+    client_id: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class KeycloakConfig:
+    """Keycloak settings (auth provider ``keycloak``)."""
+
+    url: str = ""
+    realm: str = "governance"
+    # Algorithm of the generated auth-service token-exchange signing key
+    token_exchange_key_algorithm: KeyAlgorithm = KeyAlgorithm.RSA_2048
+
+
+@dataclass(frozen=True, slots=True)
+class SizingConfig:
+    """Expected load, from which the workloads are sized (see ``core/sizing.py``).
+
+    A named tier, load figures, or both (the figures then override the tier's
+    reference load). With neither, the charts' default sizing is kept.
+    """
+
+    tier: SizingTier | None = None
+    expected_rps: int = 0
+    concurrent_users: int = 0
+    artifact_volume_gb: int = 0
+
+    def __post_init__(self) -> None:
+        for name in ("expected_rps", "concurrent_users", "artifact_volume_gb"):
+            if getattr(self, name) < 0:
+                raise ValueError(f"{name} must not be negative")
+
+    @property
+    def enabled(self) -> bool:
+        """Whether a load profile was given at all."""
+        return self.tier is not None or any(
+            (self.expected_rps, self.concurrent_users, self.artifact_volume_gb)
+        )
+
+
+# A pinned image reference: ``repository:tag@sha256:<digest>``
+IMAGE_REF_PATTERN = re.compile(
+    r"(?P<repository>[^\s@]+):(?P<tag>\w[\w.-]{0,127})@(?P<digest>sha256:[0-9a-f]{64})"
+)
+
+
+@dataclass(frozen=True, slots=True)
+class ImageLockConfig:
+    """Pinned image references, from an image lock file (see ``core/image_lock.py``).
+
+    Either every image the configuration deploys is pinned, or none is and the
+    generated values follow the ``latest`` tags (and the charts' own tags for
+    the bundled PostgreSQL and PgBouncer).
+    """
+
+    auth_service: str = ""
+    governance_service: str = ""
+    governance_studio: str = ""
+    integrity_service: str = ""
+    eqty_pdfgen: str = ""
+    llm_gateway: str = ""
+    control_plane: str = ""
+    guardian_console: str = ""
+    auth0_bootstrap: str = ""
+    entra_bootstrap: str = ""
+    keycloak_bootstrap: str = ""
+    postgresql: str = ""
+    pgbouncer: str = ""
+
+    def __post_init__(self) -> None:
+        for field in dataclasses.fields(self):
+            ref = getattr(self, field.name)
+            if ref and not IMAGE_REF_PATTERN.fullmatch(ref):
+                raise ValueError(
+                    f"Invalid image reference for {field.name}: {ref!r} "
+                    "(expected repository:tag@sha256:<digest>)"
+                )
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any image is pinned."""
+        return any(getattr(self, field.name) for field in dataclasses.fields(self))
+
+    def missing(self, config: "PlatformConfig") -> list[str]:
+        """Images the configuration deploys but are not pinned."""
+        # Images only some configurations deploy; every other one always is
+        conditional = {
+            "postgresql": config.database_mode == DatabaseMode.BUNDLED,
+            "pgbouncer": config.enable_pgbouncer,
+        }
+        missing = []
+        for field in dataclasses.fields(self):
+            if field.name.endswith("_bootstrap"):
+                deployed = field.name == f"{config.auth_provider.value}_bootstrap"
+            else:
+                deployed = conditional.get(field.name, True)
+            if deployed and not getattr(self, field.name):
+                missing.append(field.name)
+        return missing
+
+
+@dataclass(frozen=True, slots=True)
 class PlatformConfig:
-    """Configuration for the Governance Platform."""
+    """Configuration for the Governance Platform.
+
+    Immutable and hashable, so a configuration can be used directly as a cache
+    key; use ``dataclasses.replace()`` or ``PlatformConfigBuilder`` to derive
+    a new one. Provider-specific settings live in nested sub-configs, which
+    default to shared instances, so an environment only pays for the
+    providers it configures.
+    """
 
     # Core settings
     cloud_provider: CloudProvider
@@ -48,15 +224,30 @@ class PlatformConfig:
     # Feature flags
     enable_ingress: bool = True
 
+    # Per-client rate limits on the ingresses (needs the controller to see the
+    # real client IPs, see generators/ingress.py)
+    ingress_rate_limits: bool = False
+
     # Database mode (bundled Bitnami PostgreSQL or external managed PostgreSQL)
     database_mode: DatabaseMode = DatabaseMode.BUNDLED
 
+    # Route every database connection through a PgBouncer pooler
+    enable_pgbouncer: bool = False
+
+    # Streaming read replicas of the bundled PostgreSQL primary
+    postgresql_read_replicas: int = 0
+
     # Derived settings (computed from cloud_provider)
     @property
     def storage_provider(self) -> str:
         """Get the storage provider based on cloud provider."""
         return CLOUD_TO_STORAGE[self.cloud_provider]
 
+    @property
+    def token_exchange_signing_algorithm(self) -> str:
+        """Get the JWS algorithm matching the token-exchange key algorithm."""
+        return KEY_ALGORITHM_TO_JWS[self.keycloak.token_exchange_key_algorithm]
+
     # Cloud region
     cloud_region: str = ""
 
@@ -72,34 +263,20 @@ class PlatformConfig:
     key_management_provider: KeyManagementProvider = (
         KeyManagementProvider.AZURE_KEY_VAULT
     )
+    aws_kms: AwsKmsConfig = AwsKmsConfig()
+    azure_key_vault: AzureKeyVaultConfig = AzureKeyVaultConfig()
+    gcp_kms: GcpKmsConfig = GcpKmsConfig()
 
-    # AWS KMS-specific
-    aws_kms_region: str = ""
-    aws_kms_endpoint: str = ""
-    aws_kms_alias_prefix: str = ""
-    aws_kms_deletion_window_days: int = 7
-
-    # Azure Key Vault-specific
-    azure_key_vault_url: str = ""
-    azure_tenant_id: str = ""
-
-    # GCP KMS-specific
-    gcp_kms_project_id: str = ""
-    gcp_kms_location_id: str = ""
-    gcp_kms_key_ring_id: str = "eqtylab-did"
-    gcp_kms_scheduled_destroy_days: int = 24
+    # Auth providers
+    auth0: Auth0Config = Auth0Config()
+    entra: EntraConfig = EntraConfig()
+    keycloak: KeycloakConfig = KeycloakConfig()
 
-    # Auth0-specific
-    auth0_domain: str = ""
-    auth0_audience: str = ""
+    # Capacity sizing
+    sizing: SizingConfig = SizingConfig()
 
-    # Entra-specific
-    entra_tenant_id: str = ""
-    entra_client_id: str = ""
-
-    # Keycloak-specific
-    keycloak_url: str = ""
-    keycloak_realm: str = "governance"
+    # Pinned images (an image lock file)
+    images: ImageLockConfig = ImageLockConfig()
 
     # Image registry
     image_registry_url: str = "ghcr.io"
@@ -107,6 +284,166 @@ class PlatformConfig:
     image_registry_password: str = ""
     image_registry_email: str = ""
 
+    def __post_init__(self) -> None:
+        if self.postgresql_read_replicas < 0:
+            raise ValueError("postgresql_read_replicas must not be negative")
+        if self.images.enabled:
+            missing = self.images.missing(self)
+            if missing:
+                raise ValueError(
+                    "Image lock has no entry for: "
+                    + ", ".join(name.replace("_", "-") for name in missing)
+                )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Flat mapping of every field, as accepted by ``config_from_dict``.
+
+        Nested settings use their flat names (see ``FLAT_FIELDS``) and enums
+        their string values.
+        """
+        data = {}
+        for name in FIELD_PATHS:
+            value = attrgetter(FIELD_PATHS[name])(self)
+            data[name] = value.value if isinstance(value, Enum) else value
+        return data
+
+    def digest(self) -> str:
+        """Hash of every field that is stable across processes and runs.
+
+        Unlike ``hash()``, which is salted per process for strings, this can
+        key on-disk caches or be compared between workers.
+        """
+        payload = json.dumps(self.to_dict(), sort_keys=True)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+
+# Nested sub-config fields of PlatformConfig and their types
+NESTED_CONFIGS: dict[str, type] = {
+    "aws_kms": AwsKmsConfig,
+    "azure_key_vault": AzureKeyVaultConfig,
+    "gcp_kms": GcpKmsConfig,
+    "auth0": Auth0Config,
+    "entra": EntraConfig,
+    "keycloak": KeycloakConfig,
+    "sizing": SizingConfig,
+    "images": ImageLockConfig,
+}
+
+# Flat field names (as used in fleet manifests, `govctl serve` requests and
+# earlier govctl versions) of the settings that live in a nested sub-config
+FLAT_FIELDS: dict[str, str] = {
+    "aws_kms_region": "aws_kms.region",
+    "aws_kms_endpoint": "aws_kms.endpoint",
+    "aws_kms_alias_prefix": "aws_kms.alias_prefix",
+    "aws_kms_deletion_window_days": "aws_kms.deletion_window_days",
+    "azure_key_vault_url": "azure_key_vault.url",
+    "azure_tenant_id": "azure_key_vault.tenant_id",
+    "gcp_kms_project_id": "gcp_kms.project_id",
+    "gcp_kms_location_id": "gcp_kms.location_id",
+    "gcp_kms_key_ring_id": "gcp_kms.key_ring_id",
+    "gcp_kms_scheduled_destroy_days": "gcp_kms.scheduled_destroy_days",
+    "auth0_domain": "auth0.domain",
+    "auth0_audience": "auth0.audience",
+    "entra_tenant_id": "entra.tenant_id",
+    "entra_client_id": "entra.client_id",
+    "keycloak_url": "keycloak.url",
+    "keycloak_realm": "keycloak.realm",
+    "token_exchange_key_algorithm": "keycloak.token_exchange_key_algorithm",
+    "sizing_tier": "sizing.tier",
+    "expected_rps": "sizing.expected_rps",
+    "concurrent_users": "sizing.concurrent_users",
+    "artifact_volume_gb": "sizing.artifact_volume_gb",
+    **{
+        f"image_{field.name}": f"images.{field.name}"
+        for field in dataclasses.fields(ImageLockConfig)
+    },
+}
+
+# Flat field name -> field path, for every setting of a PlatformConfig
+FIELD_PATHS: dict[str, str] = {
+    **{
+        f.name: f.name
+        for f in dataclasses.fields(PlatformConfig)
+        if f.name not in NESTED_CONFIGS
+    },
+    **FLAT_FIELDS,
+}
+
+
+def _field_type(path: str) -> type:
+    owner, _, name = path.rpartition(".")
+    cls = NESTED_CONFIGS[owner] if owner else PlatformConfig
+    field_type = next(f.type for f in dataclasses.fields(cls) if f.name == name)
+    # Optional fields (``X | None``) take the values of X
+    args = [arg for arg in get_args(field_type) if arg is not type(None)]
+    return args[0] if len(args) == 1 else field_type
+
+
+# Field path -> declared type (e.g. "keycloak.realm" -> str, "sizing.tier" ->
+# SizingTier)
+FIELD_TYPES: dict[str, type] = {
+    path: _field_type(path) for path in FIELD_PATHS.values()
+}
+
+
+class PlatformConfigBuilder:
+    """Collects PlatformConfig settings one at a time, then builds the config.
+
+    For flows that learn the configuration step by step, such as the
+    interactive prompts. Settings are given by field path, e.g. ``domain`` or
+    ``keycloak.realm``::
+
+        builder = PlatformConfigBuilder(cloud_provider=CloudProvider.GCP)
+        builder.set("domain", "governance.example.com")
+        builder.set("keycloak.realm", "governance")
+        config = builder.build()
+    """
+
+    def __init__(self, **fields: Any):
+        self._values: dict[str, Any] = {}
+        for name, value in fields.items():
+            self.set(name, value)
+
+    def set(self, path: str, value: Any) -> "PlatformConfigBuilder":
+        """Set a field by path.
+
+        Raises:
+            ValueError: If there is no such field.
+        """
+        if path not in FIELD_TYPES:
+            raise ValueError(f"Unknown config field: {path}")
+        self._values[path] = value
+        return self
+
+    def get(self, path: str, default: Any = None) -> Any:
+        """Value set for a field so far, or ``default``."""
+        return self._values.get(path, default)
+
+    def build(self) -> PlatformConfig:
+        """Build the configuration from the fields set so far.
+
+        Raises:
+            TypeError: If a required field has not been set.
+        """
+        kwargs: dict[str, Any] = {}
+        nested: dict[str, dict[str, Any]] = {}
+        for path, value in self._values.items():
+            owner, _, name = path.rpartition(".")
+            if owner:
+                nested.setdefault(owner, {})[name] = value
+            else:
+                kwargs[name] = value
+        for owner, values in nested.items():
+            kwargs[owner] = _sub_config(owner, tuple(sorted(values.items())))
+        return PlatformConfig(**kwargs)
+
+
+@lru_cache(maxsize=4096)
+def _sub_config(owner: str, values: tuple[tuple[str, Any], ...]) -> Any:
+    # Environments of a fleet mostly share their provider settings (e.g. from
+    # the manifest defaults), so they share the sub-config instances too
+    return NESTED_CONFIGS[owner](**dict(values))
+
 
 @dataclass
 class GeneratedFiles:
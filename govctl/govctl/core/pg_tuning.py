@@ -0,0 +1,246 @@
+"""postgresql.conf tuning of the bundled PostgreSQL from its resources.
+
+Bitnami's stock postgresql.conf is sized for a small shared host (128MB of
+shared buffers, 4MB per sort, 1GB of WAL between checkpoints). The bundled
+primary instead gets settings derived from the memory and CPU limits and the
+volume that the postgresql section assigns it (``core/sizing.py``), emitted
+as ``primary.extendedConfiguration``. With RAM the memory limit, cores the
+CPU limit and volume the persistence size:
+
+================================ ============================================
+Setting                          Rule
+================================ ============================================
+shared_buffers                   RAM / 4
+effective_cache_size             RAM * 3 / 4
+maintenance_work_mem             RAM / 16, at most 2GB
+max_connections                  ``CONNECTIONS_PER_GB`` per GB of RAM, at
+                                 least 100; without a pooler, at least every
+                                 client's connections plus the reserve
+work_mem                         (RAM - shared_buffers -
+                                 maintenance_work_mem) / (max_connections x
+                                 3) / max_parallel_workers_per_gather, at
+                                 least 64kB
+wal_buffers                      shared_buffers x 3%, 64kB to 16MB
+max_wal_size                     volume / 10, 1GB to 16GB
+min_wal_size                     max_wal_size / 4
+checkpoint_timeout               15min (checkpoints by size under load)
+checkpoint_completion_target     0.9
+max_worker_processes             cores, at least 8
+max_parallel_workers             cores
+max_parallel_workers_per_gather  cores / 2 (rounded up), 1 to 4
+max_parallel_maintenance_workers cores / 2 (rounded up), 1 to 4
+random_page_cost                 1.1 (SSD-backed volumes)
+effective_io_concurrency         200
+================================ ============================================
+
+The work_mem rule budgets three sorts or hashes per connection (each run
+by up to max_parallel_workers_per_gather processes), so that shared
+buffers, one maintenance command and every connection's work memory fit the
+memory limit together. Read replicas get the same settings (a hot standby
+needs at least the primary's max_connections and worker counts).
+
+``benchmarks/pg_tuning_table.py`` prints the settings of each sizing tier;
+``tests/test_pg_tuning.py`` checks them against the expected table.
+"""
+
+import math
+from dataclasses import dataclass
+
+from govctl.core.models import DatabaseMode, PlatformConfig, SizingTier
+from govctl.core.pooling import (
+    RESERVED_CONNECTIONS,
+    SERVER_MAX_CONNECTIONS,
+    client_demand,
+)
+from govctl.core.sizing import (
+    POSTGRESQL_MIN_STORAGE_GB,
+    POSTGRESQL_RESOURCES,
+    SIZING_DEPENDS_ON,
+    Resources,
+    postgresql_sizing,
+)
+
+# PlatformConfig fields read by the tuning rules
+PG_TUNING_DEPENDS_ON: tuple[str, ...] = (
+    "database_mode",
+    "enable_pgbouncer",
+    *SIZING_DEPENDS_ON,
+)
+
+# Memory split of the RAM (the container's memory limit)
+SHARED_BUFFERS_FRACTION = 0.25
+EFFECTIVE_CACHE_FRACTION = 0.75
+MAINTENANCE_WORK_MEM_FRACTION = 1 / 16
+MAINTENANCE_WORK_MEM_MAX_MB = 2048
+
+# Connections per GB of RAM, and the floor (PostgreSQL's default)
+CONNECTIONS_PER_GB = 25
+MIN_MAX_CONNECTIONS = 100
+
+# Sorts/hashes budgeted per connection, and the smallest work_mem
+WORK_MEM_OPERATIONS = 3
+WORK_MEM_MIN_KB = 64
+
+# wal_buffers as a fraction of shared_buffers, and its bounds
+WAL_BUFFERS_FRACTION = 0.03
+WAL_BUFFERS_MIN_KB = 64
+WAL_BUFFERS_MAX_KB = 16 * 1024
+
+# Share of the volume that WAL between checkpoints may take, and its bounds
+WAL_VOLUME_FRACTION = 0.1
+MAX_WAL_SIZE_MIN_MB = 1024
+MAX_WAL_SIZE_MAX_MB = 16 * 1024
+
+# Fixed settings: spread checkpoints out, and cost plans for SSD volumes
+CHECKPOINT_TIMEOUT = "15min"
+CHECKPOINT_COMPLETION_TARGET = 0.9
+RANDOM_PAGE_COST = 1.1
+EFFECTIVE_IO_CONCURRENCY = 200
+
+# Most parallel workers per query or maintenance command
+MAX_PARALLEL_PER_OPERATION = 4
+MIN_WORKER_PROCESSES = 8
+
+_BINARY_UNITS = {"Ki": 1 / 1024, "Mi": 1, "Gi": 1024, "Ti": 1024 * 1024}
+
+
+def memory_mb(quantity: str) -> int:
+    """A Kubernetes memory quantity (``512Mi``, ``4Gi``) in MB."""
+    for suffix, scale in _BINARY_UNITS.items():
+        if quantity.endswith(suffix):
+            return int(float(quantity[: -len(suffix)]) * scale)
+    return int(quantity) // (1024 * 1024)
+
+
+def cpu_cores(quantity: str) -> float:
+    """A Kubernetes CPU quantity (``500m``, ``2``) in cores."""
+    if quantity.endswith("m"):
+        return int(quantity[:-1]) / 1000
+    return float(quantity)
+
+
+@dataclass(frozen=True)
+class PostgresqlTuning:
+    """Derived postgresql.conf settings of one PostgreSQL server."""
+
+    shared_buffers_mb: int
+    effective_cache_size_mb: int
+    maintenance_work_mem_mb: int
+    max_connections: int
+    work_mem_kb: int
+    wal_buffers_kb: int
+    min_wal_size_mb: int
+    max_wal_size_mb: int
+    max_worker_processes: int
+    max_parallel_workers: int
+    max_parallel_workers_per_gather: int
+    max_parallel_maintenance_workers: int
+
+    def settings(self) -> dict[str, str]:
+        """Every setting as it is written to postgresql.conf."""
+        return {
+            "max_connections": str(self.max_connections),
+            "shared_buffers": f"{self.shared_buffers_mb}MB",
+            "effective_cache_size": f"{self.effective_cache_size_mb}MB",
+            "work_mem": f"{self.work_mem_kb}kB",
+            "maintenance_work_mem": f"{self.maintenance_work_mem_mb}MB",
+            "wal_buffers": f"{self.wal_buffers_kb}kB",
+            "min_wal_size": f"{self.min_wal_size_mb}MB",
+            "max_wal_size": f"{self.max_wal_size_mb}MB",
+            "checkpoint_timeout": CHECKPOINT_TIMEOUT,
+            "checkpoint_completion_target": str(CHECKPOINT_COMPLETION_TARGET),
+            "random_page_cost": str(RANDOM_PAGE_COST),
+            "effective_io_concurrency": str(EFFECTIVE_IO_CONCURRENCY),
+            "max_worker_processes": str(self.max_worker_processes),
+            "max_parallel_workers": str(self.max_parallel_workers),
+            "max_parallel_workers_per_gather": str(
+                self.max_parallel_workers_per_gather
+            ),
+            "max_parallel_maintenance_workers": str(
+                self.max_parallel_maintenance_workers
+            ),
+        }
+
+    def to_conf(self) -> str:
+        """The settings as postgresql.conf lines (``extendedConfiguration``)."""
+        return "".join(f"{name} = {value}\n" for name, value in self.settings().items())
+
+
+def tune_postgresql(
+    resources: Resources, storage_gb: int, min_connections: int = 0
+) -> PostgresqlTuning:
+    """Tune a server for its resources and volume.
+
+    Args:
+        resources: The server's resources; the limits are what it tunes for.
+        storage_gb: Size of the data volume, which also holds the WAL.
+        min_connections: Connections the clients need at least.
+    """
+    ram_mb = memory_mb(resources.memory_limit)
+    cores = max(1, math.ceil(cpu_cores(resources.cpu_limit)))
+
+    shared_buffers_mb = int(ram_mb * SHARED_BUFFERS_FRACTION)
+    maintenance_work_mem_mb = min(
+        MAINTENANCE_WORK_MEM_MAX_MB, int(ram_mb * MAINTENANCE_WORK_MEM_FRACTION)
+    )
+    max_connections = max(
+        MIN_MAX_CONNECTIONS, ram_mb * CONNECTIONS_PER_GB // 1024, min_connections
+    )
+    per_operation = min(MAX_PARALLEL_PER_OPERATION, math.ceil(cores / 2))
+    work_mem_kb = (
+        (ram_mb - shared_buffers_mb - maintenance_work_mem_mb)
+        * 1024
+        // (max_connections * WORK_MEM_OPERATIONS)
+        // per_operation
+    )
+    max_wal_size_mb = min(
+        MAX_WAL_SIZE_MAX_MB,
+        max(MAX_WAL_SIZE_MIN_MB, int(storage_gb * 1024 * WAL_VOLUME_FRACTION)),
+    )
+    return PostgresqlTuning(
+        shared_buffers_mb=shared_buffers_mb,
+        effective_cache_size_mb=int(ram_mb * EFFECTIVE_CACHE_FRACTION),
+        maintenance_work_mem_mb=maintenance_work_mem_mb,
+        max_connections=max_connections,
+        work_mem_kb=max(WORK_MEM_MIN_KB, work_mem_kb),
+        wal_buffers_kb=min(
+            WAL_BUFFERS_MAX_KB,
+            max(
+                WAL_BUFFERS_MIN_KB, int(shared_buffers_mb * 1024 * WAL_BUFFERS_FRACTION)
+            ),
+        ),
+        min_wal_size_mb=max_wal_size_mb // 4,
+        max_wal_size_mb=max_wal_size_mb,
+        max_worker_processes=max(MIN_WORKER_PROCESSES, cores),
+        max_parallel_workers=cores,
+        max_parallel_workers_per_gather=per_operation,
+        max_parallel_maintenance_workers=per_operation,
+    )
+
+
+def direct_connections(config: PlatformConfig) -> int:
+    """Server connections the clients open without a pooler, plus the reserve."""
+    return sum(client_demand(config).values()) + RESERVED_CONNECTIONS
+
+
+def postgresql_tuning(config: PlatformConfig) -> PostgresqlTuning | None:
+    """Tuning of the bundled PostgreSQL, or None in external mode.
+
+    Unsized configurations get the tuning of the section's fixed sizing (the
+    ``SMALL`` tier's resources and volume).
+    """
+    if config.database_mode == DatabaseMode.EXTERNAL:
+        return None
+    resources, storage_gb = postgresql_sizing(config) or (
+        POSTGRESQL_RESOURCES[SizingTier.SMALL],
+        POSTGRESQL_MIN_STORAGE_GB[SizingTier.SMALL],
+    )
+    # A pooler bounds the server connections itself (see core/pooling.py)
+    min_connections = 0 if config.enable_pgbouncer else direct_connections(config)
+    return tune_postgresql(resources, storage_gb, min_connections)
+
+
+def server_max_connections(config: PlatformConfig) -> int:
+    """PostgreSQL's max_connections: tuned when bundled, assumed when external."""
+    tuning = postgresql_tuning(config)
+    return tuning.max_connections if tuning else SERVER_MAX_CONNECTIONS
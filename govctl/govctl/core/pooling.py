@@ -0,0 +1,127 @@
+"""PgBouncer connection pooling derived from the services' replica counts.
+
+With ``config.enable_pgbouncer`` every database client (auth-service,
+governance-service, integrity-service, the setup hooks and the gateway's
+``gatewayDsn``) connects to a PgBouncer pooler instead of PostgreSQL, in
+both database modes. The pool settings follow from how many client
+connections the services can open at their peak replica counts and how
+many server connections PostgreSQL has to give:
+
+- client demand per database: the sum over its services of peak replicas x
+  per-replica client pool (``CLIENT_POOL_PER_REPLICA``); the gateway
+  (``GATEWAY_CLIENT_CONNECTIONS``) always counts, as its DSN is generated;
+- server budget: ``max_connections`` (tuned from the bundled server's memory,
+  see ``core/pg_tuning.py``; ``SERVER_MAX_CONNECTIONS`` for a managed
+  instance) less ``RESERVED_CONNECTIONS``, split between the pooler
+  replicas, each of which keeps its own server pools;
+- ``defaultPoolSize`` (also ``maxDbConnections``): a pooler replica's share
+  of the largest database's demand, capped so that the pool of every
+  database fits the replica's budget (PgBouncer applies one pool size to
+  every database);
+- pool mode: ``session`` while the pools are not capped, so every client
+  connection can hold a server connection of its own (pooling only bounds
+  the total), ``transaction`` once they are and server connections must be
+  shared between transactions;
+- ``maxClientConn``: the total client demand plus ``CLIENT_HEADROOM``, per
+  replica, so that one replica can carry every client while another
+  restarts.
+"""
+
+import math
+from dataclasses import dataclass
+
+from govctl.core.models import PlatformConfig
+from govctl.core.sizing import SIZING_DEPENDS_ON, peak_replicas
+
+# PlatformConfig fields read by the pooling rules
+POOLER_DEPENDS_ON: tuple[str, ...] = ("enable_pgbouncer", *SIZING_DEPENDS_ON)
+
+# Port of the pooler Service
+POOLER_PORT = 6432
+
+# Pooler replicas; two keep connections flowing through a restart
+POOLER_REPLICAS = 2
+
+# Most connections one replica of each service opens (its client pool size)
+CLIENT_POOL_PER_REPLICA: dict[str, int] = {
+    "auth-service": 10,
+    "governance-service": 20,
+    "integrity-service": 10,
+}
+
+# Database each service connects to
+SERVICE_DATABASES: dict[str, str] = {
+    "auth-service": "governance",
+    "governance-service": "governance",
+    "integrity-service": "IntegrityServiceDB",
+}
+
+# Client connections of the gateway-stack services (through gatewayDsn)
+GATEWAY_DATABASE = "guardian_gateway"
+GATEWAY_CLIENT_CONNECTIONS = 20
+
+# PostgreSQL max_connections assumed for managed instances, whose default
+# follows the instance size (PostgreSQL's own default)
+SERVER_MAX_CONNECTIONS = 100
+
+# Server connections kept free of the pools (superuser, migrations, psql)
+RESERVED_CONNECTIONS = 10
+
+# Spare client connections over the computed demand
+CLIENT_HEADROOM = 1.25
+
+# Protocol-level prepared statements tracked per connection in transaction
+# mode, for drivers that prepare statements (PgBouncer 1.21+)
+MAX_PREPARED_STATEMENTS = 100
+
+
+@dataclass(frozen=True)
+class PoolSettings:
+    """Derived PgBouncer settings for one environment."""
+
+    pool_mode: str
+    default_pool_size: int
+    max_client_conn: int
+    # Client connections per database at peak replica counts
+    client_demand: dict[str, int]
+    # Server connections the pools may use across all pooler replicas
+    server_budget: int
+
+
+def pooler_host(config: PlatformConfig) -> str:
+    """Service name of the pooler: ``{release}-pgbouncer``."""
+    return f"{config.release_name}-pgbouncer"
+
+
+def client_demand(config: PlatformConfig) -> dict[str, int]:
+    """Client connections per database at the services' peak replica counts."""
+    demand = {GATEWAY_DATABASE: GATEWAY_CLIENT_CONNECTIONS}
+    for service, pool in CLIENT_POOL_PER_REPLICA.items():
+        database = SERVICE_DATABASES[service]
+        demand[database] = demand.get(database, 0) + pool * peak_replicas(
+            config, service
+        )
+    return demand
+
+
+def pool_settings(
+    config: PlatformConfig, max_connections: int = SERVER_MAX_CONNECTIONS
+) -> PoolSettings | None:
+    """The pooler settings for a configuration, or None without a pooler.
+
+    ``max_connections`` is the server's (``pg_tuning.server_max_connections``).
+    """
+    if not config.enable_pgbouncer:
+        return None
+
+    demand = client_demand(config)
+    budget = max_connections - RESERVED_CONNECTIONS
+    needed = math.ceil(max(demand.values()) / POOLER_REPLICAS)
+    fits = max(1, budget // POOLER_REPLICAS // len(demand))
+    return PoolSettings(
+        pool_mode="session" if needed <= fits else "transaction",
+        default_pool_size=min(needed, fits),
+        max_client_conn=math.ceil(sum(demand.values()) * CLIENT_HEADROOM),
+        client_demand=demand,
+        server_budget=budget,
+    )
@@ -0,0 +1,312 @@
+"""Capacity-driven sizing of the platform's workloads.
+
+A load profile (``config.sizing``: a named tier, expected load figures, or
+both) is resolved to a ``Load``. From it each service gets a replica count,
+CPU/memory requests and limits, and HPA settings, following the rules
+tabulated below:
+
+- replicas: the most that any one load dimension needs, and never fewer than
+  the service's floor::
+
+      max(min_replicas,
+          ceil(rps * rps_share / rps_per_replica),
+          ceil(users / users_per_replica),
+          ceil(artifact_gb / artifact_gb_per_replica))
+
+- per-pod resources: by the load's tier, the smallest tier whose reference
+  load covers the load in every dimension (``LARGE`` beyond that). Services
+  scale out rather than up, so pods only grow a step per tier.
+- HPA: ``minReplicas`` is the replica count, ``maxReplicas`` leaves
+  ``BURST_FACTOR`` times that for peaks (both capped at
+  ``MAX_REPLICAS_CAP``), and ``replicaCount`` equals
+  ``minReplicas`` for when autoscaling is turned off.
+- PostgreSQL (bundled mode only): resources by tier, and a volume sized for
+  the metadata of the artifact volume (the artifacts themselves live in
+  object storage). Its postgresql.conf settings and read replicas follow
+  from these in ``core/pg_tuning.py``.
+
+``benchmarks/sizing_table.py`` prints the derived table for each tier;
+``tests/test_sizing.py`` checks it and its invariants.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Any
+
+from govctl.core.models import PlatformConfig, SizingConfig, SizingTier
+
+# PlatformConfig fields read by the sizing rules; sections that size their
+# workloads add these to their DEPENDS_ON
+SIZING_DEPENDS_ON: tuple[str, ...] = (
+    "sizing.tier",
+    "sizing.expected_rps",
+    "sizing.concurrent_users",
+    "sizing.artifact_volume_gb",
+)
+
+
+@dataclass(frozen=True)
+class Load:
+    """Expected platform load."""
+
+    # Sustained requests per second across the platform
+    rps: int
+    # Concurrently signed-in users
+    users: int
+    # Total volume of stored artifacts, in GB
+    artifact_gb: int
+
+
+# Replica count of each service without a load profile
+DEFAULT_REPLICAS: dict[str, int] = {
+    "auth-service": 2,
+    "governance-service": 2,
+    "governance-studio": 1,
+    "integrity-service": 2,
+    "eqty-pdfgen": 2,
+}
+
+# Reference load of each named tier
+TIER_LOADS: dict[SizingTier, Load] = {
+    SizingTier.SMALL: Load(rps=10, users=50, artifact_gb=50),
+    SizingTier.MEDIUM: Load(rps=50, users=500, artifact_gb=500),
+    SizingTier.LARGE: Load(rps=250, users=5000, artifact_gb=5000),
+}
+
+
+@dataclass(frozen=True)
+class Resources:
+    """CPU/memory requests and limits of one pod."""
+
+    cpu_request: str
+    memory_request: str
+    cpu_limit: str
+    memory_limit: str
+
+    def to_values(self) -> dict[str, Any]:
+        return {
+            "requests": {"cpu": self.cpu_request, "memory": self.memory_request},
+            "limits": {"cpu": self.cpu_limit, "memory": self.memory_limit},
+        }
+
+
+@dataclass(frozen=True)
+class ServiceRule:
+    """How a service's replicas and pods follow the load."""
+
+    # Fraction of the platform's requests that reach the service
+    rps_share: float
+    # Requests per second one replica sustains at the HPA CPU target
+    rps_per_replica: int
+    # Concurrent users one replica holds (sessions, open connections)
+    users_per_replica: int | None
+    # Artifact volume one replica keeps up with (hashing, verification)
+    artifact_gb_per_replica: int | None
+    # Availability floor; 2 keeps a replica up through a rolling update or
+    # node drain
+    min_replicas: int
+    # Per-pod resources by load tier
+    resources: dict[SizingTier, Resources]
+
+
+SERVICE_RULES: dict[str, ServiceRule] = {
+    # Every API call has its token checked by the auth service
+    "auth-service": ServiceRule(
+        rps_share=1.0,
+        rps_per_replica=150,
+        users_per_replica=2000,
+        artifact_gb_per_replica=None,
+        min_replicas=2,
+        resources={
+            SizingTier.SMALL: Resources("100m", "128Mi", "500m", "512Mi"),
+            SizingTier.MEDIUM: Resources("250m", "256Mi", "1000m", "512Mi"),
+            SizingTier.LARGE: Resources("500m", "512Mi", "2000m", "1Gi"),
+        },
+    ),
+    "governance-service": ServiceRule(
+        rps_share=0.6,
+        rps_per_replica=40,
+        users_per_replica=500,
+        artifact_gb_per_replica=None,
+        min_replicas=2,
+        resources={
+            SizingTier.SMALL: Resources("250m", "256Mi", "500m", "512Mi"),
+            SizingTier.MEDIUM: Resources("500m", "512Mi", "1000m", "1Gi"),
+            SizingTier.LARGE: Resources("1000m", "1Gi", "2000m", "2Gi"),
+        },
+    ),
+    # Static frontend assets, cheap to serve
+    "governance-studio": ServiceRule(
+        rps_share=0.3,
+        rps_per_replica=300,
+        users_per_replica=2000,
+        artifact_gb_per_replica=None,
+        min_replicas=1,
+        resources={
+            SizingTier.SMALL: Resources("50m", "128Mi", "200m", "256Mi"),
+            SizingTier.MEDIUM: Resources("100m", "128Mi", "500m", "256Mi"),
+            SizingTier.LARGE: Resources("250m", "256Mi", "1000m", "512Mi"),
+        },
+    ),
+    "integrity-service": ServiceRule(
+        rps_share=0.3,
+        rps_per_replica=25,
+        users_per_replica=None,
+        artifact_gb_per_replica=500,
+        min_replicas=2,
+        resources={
+            SizingTier.SMALL: Resources("100m", "256Mi", "500m", "512Mi"),
+            SizingTier.MEDIUM: Resources("250m", "512Mi", "1000m", "1Gi"),
+            SizingTier.LARGE: Resources("500m", "1Gi", "2000m", "2Gi"),
+        },
+    ),
+    # PDF rendering is slow and memory-hungry, but rarely requested
+    "eqty-pdfgen": ServiceRule(
+        rps_share=0.02,
+        rps_per_replica=2,
+        users_per_replica=None,
+        artifact_gb_per_replica=None,
+        min_replicas=1,
+        resources={
+            SizingTier.SMALL: Resources("100m", "256Mi", "500m", "512Mi"),
+            SizingTier.MEDIUM: Resources("250m", "512Mi", "1000m", "1Gi"),
+            SizingTier.LARGE: Resources("500m", "1Gi", "2000m", "2Gi"),
+        },
+    ),
+}
+
+# HPA ceiling as a multiple of the replica count, and its absolute cap
+BURST_FACTOR = 3
+MAX_REPLICAS_CAP = 50
+
+# HPA utilization targets; rps_per_replica is measured at the CPU target
+TARGET_CPU_PERCENT = 70
+TARGET_MEMORY_PERCENT = 80
+
+# Bundled PostgreSQL primary resources by load tier (SMALL is the chart
+# section's fixed sizing)
+POSTGRESQL_RESOURCES: dict[SizingTier, Resources] = {
+    SizingTier.SMALL: Resources("500m", "1Gi", "2000m", "2Gi"),
+    SizingTier.MEDIUM: Resources("1000m", "4Gi", "2000m", "4Gi"),
+    SizingTier.LARGE: Resources("2000m", "8Gi", "4000m", "8Gi"),
+}
+
+# Smallest PostgreSQL volume by load tier, in GB
+POSTGRESQL_MIN_STORAGE_GB: dict[SizingTier, int] = {
+    SizingTier.SMALL: 10,
+    SizingTier.MEDIUM: 50,
+    SizingTier.LARGE: 200,
+}
+
+# Database metadata per GB of artifacts, and the volume size granularity
+POSTGRESQL_GB_PER_ARTIFACT_GB = 0.05
+POSTGRESQL_STORAGE_STEP_GB = 10
+
+
+def resolve_load(sizing: SizingConfig) -> Load | None:
+    """The load of a sizing profile, or None if it gives none.
+
+    Figures that are set override the tier's reference load; without a tier,
+    unset figures are zero.
+    """
+    if not sizing.enabled:
+        return None
+    base = TIER_LOADS[sizing.tier] if sizing.tier else Load(0, 0, 0)
+    return Load(
+        rps=sizing.expected_rps or base.rps,
+        users=sizing.concurrent_users or base.users,
+        artifact_gb=sizing.artifact_volume_gb or base.artifact_gb,
+    )
+
+
+def load_tier(load: Load) -> SizingTier:
+    """The smallest tier whose reference load covers ``load``."""
+    for tier, reference in TIER_LOADS.items():
+        if (
+            load.rps <= reference.rps
+            and load.users <= reference.users
+            and load.artifact_gb <= reference.artifact_gb
+        ):
+            return tier
+    return SizingTier.LARGE
+
+
+def _ceil_div(amount: float, per_replica: float | None) -> int:
+    return math.ceil(amount / per_replica) if per_replica else 0
+
+
+@dataclass(frozen=True)
+class ServiceSizing:
+    """Derived sizing of one service."""
+
+    replicas: int
+    max_replicas: int
+    resources: Resources
+
+    def to_values(self) -> dict[str, Any]:
+        """The service's replicaCount, resources and autoscaling values."""
+        return {
+            "replicaCount": self.replicas,
+            "resources": self.resources.to_values(),
+            "autoscaling": {
+                "enabled": True,
+                "minReplicas": self.replicas,
+                "maxReplicas": self.max_replicas,
+                "targetCPUUtilizationPercentage": TARGET_CPU_PERCENT,
+                "targetMemoryUtilizationPercentage": TARGET_MEMORY_PERCENT,
+            },
+        }
+
+
+def size_service(service: str, load: Load) -> ServiceSizing:
+    """Size a service (a key of ``SERVICE_RULES``) for a load."""
+    rule = SERVICE_RULES[service]
+    replicas = min(
+        MAX_REPLICAS_CAP,
+        max(
+            rule.min_replicas,
+            _ceil_div(load.rps * rule.rps_share, rule.rps_per_replica),
+            _ceil_div(load.users, rule.users_per_replica),
+            _ceil_div(load.artifact_gb, rule.artifact_gb_per_replica),
+        ),
+    )
+    max_replicas = min(MAX_REPLICAS_CAP, max(replicas * BURST_FACTOR, replicas + 1))
+    return ServiceSizing(replicas, max_replicas, rule.resources[load_tier(load)])
+
+
+def peak_replicas(config: PlatformConfig, service: str) -> int:
+    """Most replicas a service runs: its HPA ceiling if sized, else its fixed count."""
+    load = resolve_load(config.sizing)
+    if load is None:
+        return DEFAULT_REPLICAS[service]
+    return size_service(service, load).max_replicas
+
+
+def postgresql_storage_gb(load: Load) -> int:
+    """PostgreSQL volume size for a load, in GB."""
+    metadata_gb = load.artifact_gb * POSTGRESQL_GB_PER_ARTIFACT_GB
+    step = POSTGRESQL_STORAGE_STEP_GB
+    return max(
+        POSTGRESQL_MIN_STORAGE_GB[load_tier(load)],
+        math.ceil(metadata_gb / step) * step,
+    )
+
+
+def service_sizing_values(config: PlatformConfig, service: str) -> dict[str, Any]:
+    """Sizing values to merge into a service's section.
+
+    Empty when the configuration has no load profile, so the section keeps
+    its fixed replica count and the chart's default resources.
+    """
+    load = resolve_load(config.sizing)
+    if load is None:
+        return {}
+    return size_service(service, load).to_values()
+
+
+def postgresql_sizing(config: PlatformConfig) -> tuple[Resources, int] | None:
+    """(resources, volume GB) of the bundled PostgreSQL primary, if sized."""
+    load = resolve_load(config.sizing)
+    if load is None:
+        return None
+    return POSTGRESQL_RESOURCES[load_tier(load)], postgresql_storage_gb(load)
@@ -0,0 +1,148 @@
+"""Structural diff of parsed YAML trees.
+
+Compares two trees by content rather than by text, so key order, comments,
+quoting and flow style make no difference. Every mapping and list is given a
+Merkle-style hash of its content first (mappings hashed independently of key
+order), so a subtree that is the same on both sides is skipped after a single
+comparison, however large it is. Lists are aligned on their items' hashes, so
+an item inserted into a list shows up as one addition rather than as a change
+to every item after it.
+"""
+
+import hashlib
+import re
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+from typing import Any
+
+ADDED = "added"
+REMOVED = "removed"
+CHANGED = "changed"
+
+# Keys that can be written unquoted in a change's path
+_PLAIN_KEY = re.compile(r"[A-Za-z0-9_-]+")
+
+
+@dataclass(frozen=True)
+class Change:
+    """A difference between two trees at one path.
+
+    ``old`` is None for added values and ``new`` is None for removed ones.
+    """
+
+    kind: str
+    path: str
+    old: Any = None
+    new: Any = None
+
+
+def _digest(data: bytes) -> bytes:
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _scalar_hash(value: Any) -> bytes:
+    # The type name keeps e.g. 1, 1.0, True and "1" apart
+    return _digest(f"{type(value).__name__}:{value!r}".encode())
+
+
+def tree_hashes(node: Any, hashes: dict[int, bytes] | None = None) -> bytes:
+    """Hash a tree, recording the hash of every mapping and list by ``id``.
+
+    Returns:
+        The hash of ``node``. Hashes of its mappings and lists are stored in
+        ``hashes`` (keyed by ``id()``, so the tree must stay alive while they
+        are used).
+    """
+    if hashes is None:
+        hashes = {}
+    if isinstance(node, dict):
+        known = hashes.get(id(node))
+        if known is not None:
+            return known
+        entries = sorted(
+            _scalar_hash(key) + tree_hashes(value, hashes)
+            for key, value in node.items()
+        )
+        digest = _digest(b"map" + b"".join(entries))
+    elif isinstance(node, list):
+        known = hashes.get(id(node))
+        if known is not None:
+            return known
+        digest = _digest(b"list" + b"".join(tree_hashes(item, hashes) for item in node))
+    else:
+        return _scalar_hash(node)
+    hashes[id(node)] = digest
+    return digest
+
+
+def _key_path(path: str, key: Any) -> str:
+    if isinstance(key, str) and _PLAIN_KEY.fullmatch(key):
+        return f"{path}.{key}" if path else key
+    return f'{path}["{key}"]' if isinstance(key, str) else f"{path}[{key!r}]"
+
+
+class _Differ:
+    def __init__(self, old: Any, new: Any):
+        self.hashes: dict[int, bytes] = {}
+        self.old_hash = tree_hashes(old, self.hashes)
+        self.new_hash = tree_hashes(new, self.hashes)
+        self.changes: list[Change] = []
+
+    def hash(self, node: Any) -> bytes:
+        if isinstance(node, (dict, list)):
+            return self.hashes[id(node)]
+        return _scalar_hash(node)
+
+    def diff(self, old: Any, new: Any, path: str) -> None:
+        if self.hash(old) == self.hash(new):
+            return
+        if isinstance(old, dict) and isinstance(new, dict):
+            self.diff_maps(old, new, path)
+        elif isinstance(old, list) and isinstance(new, list):
+            self.diff_lists(old, new, path)
+        else:
+            self.changes.append(Change(CHANGED, path, old, new))
+
+    def diff_maps(self, old: dict, new: dict, path: str) -> None:
+        for key, value in old.items():
+            if key in new:
+                self.diff(value, new[key], _key_path(path, key))
+            else:
+                self.changes.append(Change(REMOVED, _key_path(path, key), old=value))
+        for key, value in new.items():
+            if key not in old:
+                self.changes.append(Change(ADDED, _key_path(path, key), new=value))
+
+    def diff_lists(self, old: list, new: list, path: str) -> None:
+        matcher = SequenceMatcher(
+            None,
+            [self.hash(item) for item in old],
+            [self.hash(item) for item in new],
+            autojunk=False,
+        )
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag == "equal":
+                continue
+            # Items replaced one for one are diffed further; the rest of a
+            # replaced run counts as removed or added
+            paired = min(i2 - i1, j2 - j1)
+            for offset in range(paired):
+                self.diff(old[i1 + offset], new[j1 + offset], f"{path}[{j1 + offset}]")
+            for i in range(i1 + paired, i2):
+                self.changes.append(Change(REMOVED, f"{path}[{i}]", old=old[i]))
+            for j in range(j1 + paired, j2):
+                self.changes.append(Change(ADDED, f"{path}[{j}]", new=new[j]))
+
+
+def diff_trees(old: Any, new: Any) -> list[Change]:
+    """List the differences between two parsed YAML trees.
+
+    Paths are dotted keys with ``[n]`` list indices (indices into ``new``,
+    except for removed items); keys other than plain identifiers are quoted,
+    e.g. ``annotations["nginx.ingress.kubernetes.io/ssl-redirect"]``. An
+    empty list means the trees are equal.
+    """
+    differ = _Differ(old, new)
+    if differ.old_hash != differ.new_hash:
+        differ.diff(old, new, "")
+    return differ.changes
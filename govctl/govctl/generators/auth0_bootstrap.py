@@ -1,26 +1,56 @@
 """Auth0 bootstrap values generator."""
 
-from typing import Any
+import io
+from typing import Any, TextIO
 
+from govctl.core.chart_index import validate
+from govctl.core.image_lock import image_depends_on, image_values
 from govctl.core.models import PlatformConfig
-from govctl.utils.yaml import dump_yaml_with_header
+from govctl.utils.profiling import phase
+from govctl.utils.yaml import write_yaml_with_header
+
+# Chart the generated values are for
+CHART = "auth0-bootstrap"
+
+# PlatformConfig fields read by this generator (used to fingerprint its output)
+DEPENDS_ON: tuple[str, ...] = (
+    "domain",
+    "auth0.domain",
+    "auth0.audience",
+    image_depends_on("auth0-bootstrap"),
+)
 
 
 def generate_auth0_bootstrap(config: PlatformConfig) -> str:
     """Generate auth0-bootstrap values.yaml content based on configuration."""
+    stream = io.StringIO()
+    write_auth0_bootstrap(config, stream)
+    return stream.getvalue()
+
+
+def write_auth0_bootstrap(config: PlatformConfig, stream: TextIO) -> None:
+    """Write auth0-bootstrap values.yaml content to a text stream."""
+    with phase("build bootstrap"):
+        data = generate_auth0_bootstrap_data(config)
+    with phase("check bootstrap"):
+        validate(CHART, data)
+    with phase("emit bootstrap"):
+        write_yaml_with_header(data, "bootstrap", config, stream)
+
+
+def generate_auth0_bootstrap_data(config: PlatformConfig) -> dict[str, Any]:
+    """Build the auth0-bootstrap values based on configuration."""
     domain = config.domain
-    auth0_domain = config.auth0_domain or "YOUR_AUTH0_DOMAIN.us.auth0.com"
-    api_identifier = config.auth0_audience or f"https://{domain}"
+    auth0_domain = config.auth0.domain or "YOUR_AUTH0_DOMAIN.us.auth0.com"
+    api_identifier = config.auth0.audience or f"https://{domain}"
     admin_email = f"admin@{domain}"
 
     data: dict[str, Any] = {
         "bootstrap": {
             "enabled": True,
-            "image": {
-                "repository": "dwdraju/alpine-curl-jq",
-                "tag": "latest",
-                "pullPolicy": "IfNotPresent",
-            },
+            "image": image_values(
+                config, "auth0-bootstrap", "dwdraju/alpine-curl-jq", "IfNotPresent"
+            ),
             "args": ["/scripts/bootstrap.sh"],
             "backoffLimit": 3,
             "ttlSecondsAfterFinished": 300,
@@ -127,4 +157,4 @@ def generate_auth0_bootstrap(config: PlatformConfig) -> str:
         },
     }
 
-    return dump_yaml_with_header(data, "bootstrap", config)
+    return data
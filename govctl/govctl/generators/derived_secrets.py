@@ -0,0 +1,102 @@
+"""Deterministic secret derivation from a master key (HKDF mode).
+
+Normally every generated secret is fresh random material, so the only way to
+reproduce a secrets file is to keep it. Within ``deriving_secrets(master_key)``
+the generated secrets are instead derived with HKDF-SHA256 from the master
+key, labelled with the environment (domain and environment name) and the
+secret's purpose. The same master key then always rebuilds the same secrets
+for an environment, with nothing stored but the master key itself, and
+different environments or purposes get independent secrets.
+
+Values filled in by hand (registry passwords, client secrets, ...) are not
+derived; they are still marked as required.
+"""
+
+import base64
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+from govctl.core.models import KeyAlgorithm, PlatformConfig
+
+# Shortest master key accepted, in bytes
+MIN_MASTER_KEY_BYTES = 32
+
+# Prefix of every HKDF info label; bump the version to change all derivations
+_LABEL = b"govctl secrets v1"
+
+_master_key: bytes | None = None
+
+
+def load_master_key(path: str | Path) -> bytes:
+    """Read a master key file: base64 of at least 32 random bytes.
+
+    Create one with e.g. ``openssl rand -base64 32 > master.key``.
+
+    Raises:
+        ValueError: If the file does not hold a valid master key.
+    """
+    text = Path(path).read_text().strip()
+    try:
+        key = base64.b64decode(text, validate=True)
+    except ValueError:
+        raise ValueError(f"{path} is not base64-encoded") from None
+    if len(key) < MIN_MASTER_KEY_BYTES:
+        raise ValueError(
+            f"{path} holds {len(key)} bytes; a master key needs at least "
+            f"{MIN_MASTER_KEY_BYTES}"
+        )
+    return key
+
+
+@contextmanager
+def deriving_secrets(master_key: bytes | None) -> Iterator[None]:
+    """Derive the secrets generated within the block from ``master_key``.
+
+    With None, secrets are random as usual (so callers can pass an optional
+    master key straight through).
+    """
+    global _master_key
+    previous, _master_key = _master_key, master_key
+    try:
+        yield
+    finally:
+        _master_key = previous
+
+
+def deriving() -> bool:
+    """Whether secrets are currently being derived from a master key."""
+    return _master_key is not None
+
+
+def derive(config: PlatformConfig, purpose: str, length: int = 32) -> bytes:
+    """``length`` bytes derived for an environment and purpose.
+
+    Raises:
+        RuntimeError: If called outside ``deriving_secrets``.
+    """
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+
+    if _master_key is None:
+        raise RuntimeError("No master key; use deriving_secrets()")
+    # NUL-separated, as none of the parts can contain a NUL
+    info = b"\0".join(
+        [_LABEL, config.domain.encode(), config.environment.encode(), purpose.encode()]
+    )
+    return HKDF(hashes.SHA256(), length, salt=None, info=info).derive(_master_key)
+
+
+def derive_private_key(
+    config: PlatformConfig, purpose: str, algorithm: KeyAlgorithm
+) -> str:
+    """Private key (PKCS8 PEM) derived for an environment and purpose.
+
+    Each algorithm gets its own key, so changing the algorithm does not reuse
+    material derived for another one.
+    """
+    from govctl.generators.keys import private_key_from_seed
+
+    return private_key_from_seed(
+        algorithm, derive(config, f"{purpose}/{algorithm.value}")
+    )
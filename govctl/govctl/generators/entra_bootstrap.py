@@ -1,24 +1,53 @@
 """Entra bootstrap values generator."""
 
-from typing import Any
+import io
+from typing import Any, TextIO
 
+from govctl.core.chart_index import validate
+from govctl.core.image_lock import image_depends_on, image_values
 from govctl.core.models import PlatformConfig
-from govctl.utils.yaml import dump_yaml_with_header
+from govctl.utils.profiling import phase
+from govctl.utils.yaml import write_yaml_with_header
+
+# Chart the generated values are for
+CHART = "entra-bootstrap"
+
+# PlatformConfig fields read by this generator (used to fingerprint its output)
+DEPENDS_ON: tuple[str, ...] = (
+    "domain",
+    "entra.tenant_id",
+    image_depends_on("entra-bootstrap"),
+)
 
 
 def generate_entra_bootstrap(config: PlatformConfig) -> str:
     """Generate entra-bootstrap values.yaml content based on configuration."""
+    stream = io.StringIO()
+    write_entra_bootstrap(config, stream)
+    return stream.getvalue()
+
+
+def write_entra_bootstrap(config: PlatformConfig, stream: TextIO) -> None:
+    """Write entra-bootstrap values.yaml content to a text stream."""
+    with phase("build bootstrap"):
+        data = generate_entra_bootstrap_data(config)
+    with phase("check bootstrap"):
+        validate(CHART, data)
+    with phase("emit bootstrap"):
+        write_yaml_with_header(data, "bootstrap", config, stream)
+
+
+def generate_entra_bootstrap_data(config: PlatformConfig) -> dict[str, Any]:
+    """Build the entra-bootstrap values based on configuration."""
     domain = config.domain
-    tenant_id = config.entra_tenant_id or "YOUR_ENTRA_TENANT_ID"
+    tenant_id = config.entra.tenant_id or "YOUR_ENTRA_TENANT_ID"
 
     data: dict[str, Any] = {
         "bootstrap": {
             "enabled": True,
-            "image": {
-                "repository": "mcr.microsoft.com/azure-cli",
-                "tag": "latest",
-                "pullPolicy": "IfNotPresent",
-            },
+            "image": image_values(
+                config, "entra-bootstrap", "mcr.microsoft.com/azure-cli", "IfNotPresent"
+            ),
             "backoffLimit": 3,
             "ttlSecondsAfterFinished": 300,
             "activeDeadlineSeconds": 600,
@@ -53,4 +82,4 @@ def generate_entra_bootstrap(config: PlatformConfig) -> str:
         },
     }
 
-    return dump_yaml_with_header(data, "bootstrap", config)
+    return data
@@ -0,0 +1,122 @@
+"""Config fingerprints for incremental regeneration.
+
+Each generator declares the PlatformConfig fields it reads (``DEPENDS_ON``).
+A section's fingerprint is a hash of those fields' values plus the govctl
+version and a digest of govctl's own code, so an output file only needs
+regenerating when one of its sections' fingerprints changes. The version alone
+is not enough: it is "unknown" in a source checkout and does not change
+between the builds of one release.
+"""
+
+import hashlib
+import json
+from enum import Enum
+from functools import cache
+from importlib import metadata
+from operator import attrgetter
+from pathlib import Path
+from typing import Any
+
+from govctl.core.models import AuthProvider, PlatformConfig
+from govctl.generators import (
+    auth0_bootstrap,
+    entra_bootstrap,
+    keycloak_bootstrap,
+    secrets,
+    values,
+)
+from govctl.utils.yaml import HEADER_DEPENDS_ON
+
+# Fields read by each top-level section of values.yaml
+VALUES_DEPENDS_ON: dict[str, tuple[str, ...]] = {
+    "header": HEADER_DEPENDS_ON,
+    **{section.key: section.depends_on for section in values.SECTIONS},
+}
+
+# Fields read by the auth-provider-specific section of values.yaml
+AUTH_SECTION_DEPENDS_ON: dict[AuthProvider, tuple[str, ...]] = {
+    provider: section.depends_on for provider, section in values.AUTH_SECTIONS.items()
+}
+
+# Fields read by each bootstrap generator
+BOOTSTRAP_DEPENDS_ON: dict[AuthProvider, tuple[str, ...]] = {
+    AuthProvider.AUTH0: auth0_bootstrap.DEPENDS_ON,
+    AuthProvider.ENTRA: entra_bootstrap.DEPENDS_ON,
+    AuthProvider.KEYCLOAK: keycloak_bootstrap.DEPENDS_ON,
+}
+
+
+@cache
+def govctl_version() -> str:
+    """Installed govctl version, or "unknown" when running from a source tree."""
+    try:
+        return metadata.version("govctl")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+# Files of the govctl package that determine what it generates
+_CODE_SUFFIXES = (".py", ".json")
+
+
+@cache
+def code_digest() -> str:
+    """Digest of the govctl package's source files, as installed or checked out."""
+    package = Path(__file__).resolve().parents[1]
+    digest = hashlib.sha256()
+    for path in sorted(package.rglob("*")):
+        if path.suffix not in _CODE_SUFFIXES or "__pycache__" in path.parts:
+            continue
+        digest.update(path.relative_to(package).as_posix().encode() + b"\0")
+        digest.update(hashlib.sha256(path.read_bytes()).digest())
+    return digest.hexdigest()
+
+
+def _field_value(config: PlatformConfig, name: str) -> Any:
+    value = attrgetter(name)(config)
+    return value.value if isinstance(value, Enum) else value
+
+
+def fingerprint_fields(config: PlatformConfig, fields: tuple[str, ...]) -> str:
+    """Hash the given config fields' values, the govctl version and code digest."""
+    payload = json.dumps(
+        [
+            govctl_version(),
+            code_digest(),
+            {name: _field_value(config, name) for name in fields},
+        ],
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+def values_fingerprints(config: PlatformConfig) -> dict[str, str]:
+    """Per-section fingerprints for values.yaml."""
+    depends_on = dict(VALUES_DEPENDS_ON)
+    if config.enable_pgbouncer:
+        depends_on["pgbouncer"] = values.PGBOUNCER_SECTION.depends_on
+    depends_on[config.auth_provider.value] = AUTH_SECTION_DEPENDS_ON[
+        config.auth_provider
+    ]
+    return {
+        section: fingerprint_fields(config, fields)
+        for section, fields in depends_on.items()
+    }
+
+
+def secrets_fingerprints(config: PlatformConfig) -> dict[str, str]:
+    """Per-section fingerprints for secrets.yaml."""
+    return {
+        "header": fingerprint_fields(config, HEADER_DEPENDS_ON),
+        "secrets": fingerprint_fields(config, secrets.DEPENDS_ON),
+    }
+
+
+def bootstrap_fingerprints(config: PlatformConfig) -> dict[str, str]:
+    """Per-section fingerprints for the auth provider's bootstrap values."""
+    return {
+        "header": fingerprint_fields(config, HEADER_DEPENDS_ON),
+        "bootstrap": fingerprint_fields(
+            config, BOOTSTRAP_DEPENDS_ON[config.auth_provider]
+        ),
+    }
@@ -0,0 +1,218 @@
+"""Fleet generator: drive the per-environment generators across a manifest."""
+
+import io
+import itertools
+import os
+import time
+from collections import Counter, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from govctl.core.chart_index import collecting_problems
+from govctl.core.manifest import FleetEntry, config_from_dict
+from govctl.core.models import AuthProvider, KeyAlgorithm
+from govctl.generators.derived_secrets import deriving_secrets
+from govctl.generators.keys import key_engine
+from govctl.generators.outputs import generate_outputs, write_outputs, write_stream
+from govctl.utils.envelope import DataKey
+
+# Upper bound on environments per worker task, and on tasks in flight per
+# worker, so that memory stays flat however large the fleet is
+MAX_BATCH_SIZE = 32
+TASKS_IN_FLIGHT_PER_WORKER = 2
+
+
+@dataclass
+class FleetResult:
+    """Outcome of generating a single fleet environment."""
+
+    name: str
+    seconds: float
+    files: list[Path] = field(default_factory=list)
+    written: int = 0
+    output: str | None = None
+    # File name -> content, for archive output
+    contents: dict[str, str | bytes] | None = None
+    error: str | None = None
+    # Generated keys the target charts do not know, or of the wrong kind
+    problems: list[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def generate_entry(
+    entry: FleetEntry,
+    output_dir: Path | None,
+    incremental: bool = False,
+    archive: bool = False,
+    data_key: DataKey | None = None,
+) -> FleetResult:
+    """Generate and write every output file for one fleet environment.
+
+    With no output directory, the files are rendered as a multi-document YAML
+    stream into ``FleetResult.output`` instead, for the caller to forward, or
+    with ``archive`` into ``FleetResult.contents``, for the caller to add to
+    an archive. With a ``data_key``, secrets files are encrypted (not
+    supported for the YAML stream). Failures are captured in the result rather than raised so
+    that a single bad environment does not abort the rest of the fleet.
+    """
+    start = time.perf_counter()
+    try:
+        config = config_from_dict(entry.data)
+        with collecting_problems() as problems:
+            if archive:
+                return FleetResult(
+                    name=entry.name,
+                    seconds=time.perf_counter() - start,
+                    contents=generate_outputs(config, data_key),
+                    problems=problems,
+                )
+            if output_dir is None:
+                stream = io.StringIO()
+                write_stream(config, stream, source_prefix=f"{entry.name}/")
+                return FleetResult(
+                    name=entry.name,
+                    seconds=time.perf_counter() - start,
+                    output=stream.getvalue(),
+                    problems=problems,
+                )
+            results = write_outputs(
+                config, output_dir / entry.name, incremental, data_key
+            )
+    except Exception as e:
+        return FleetResult(
+            name=entry.name,
+            seconds=time.perf_counter() - start,
+            error=f"{type(e).__name__}: {e}",
+        )
+
+    return FleetResult(
+        name=entry.name,
+        seconds=time.perf_counter() - start,
+        files=[path for path, _ in results],
+        written=sum(1 for _, written in results if written),
+        problems=problems,
+    )
+
+
+def generate_entries(
+    entries: list[FleetEntry],
+    output_dir: Path | None,
+    incremental: bool = False,
+    archive: bool = False,
+    master_key: bytes | None = None,
+    data_key: DataKey | None = None,
+) -> list[FleetResult]:
+    """Generate a batch of fleet environments.
+
+    Token-exchange keys for the whole batch are prefetched up front so they
+    are generated in parallel on the key engine's thread pool instead of one
+    after another. Incremental runs skip this, as they usually reuse the
+    existing keys, and so do runs that derive secrets from ``master_key``.
+    """
+    if not incremental and master_key is None:
+        _prefetch_keys(entries)
+    with deriving_secrets(master_key):
+        return [
+            generate_entry(entry, output_dir, incremental, archive, data_key)
+            for entry in entries
+        ]
+
+
+def _prefetch_keys(entries: list[FleetEntry]) -> None:
+    """Start generating the token-exchange keys a batch of entries will need."""
+    key_counts: Counter[KeyAlgorithm] = Counter()
+    for entry in entries:
+        if (
+            str(entry.data.get("auth_provider", "")).lower()
+            != AuthProvider.KEYCLOAK.value
+        ):
+            continue
+        try:
+            algorithm = KeyAlgorithm(
+                str(entry.data.get("token_exchange_key_algorithm", "rsa-2048")).lower()
+            )
+        except ValueError:
+            continue  # reported when the entry itself is generated
+        key_counts[algorithm] += 1
+    for algorithm, count in key_counts.items():
+        key_engine.prefetch(algorithm, count)
+
+
+def default_workers() -> int:
+    """Default worker pool size: one process per available core."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def run_fleet(
+    entries: Iterable[FleetEntry],
+    output_dir: Path | None,
+    workers: int | None = None,
+    incremental: bool = False,
+    archive: bool = False,
+    master_key: bytes | None = None,
+    data_key: DataKey | None = None,
+) -> Iterator[FleetResult]:
+    """Generate every environment in a fleet, yielding results in manifest order.
+
+    Environments are fanned out over a process pool so that key generation and
+    YAML emission run on every core. With ``workers=1`` everything runs in the
+    current process, which is easier to debug. Only a few batches are in
+    flight at a time, so results (including streamed output or archive
+    contents when ``output_dir`` is None) never pile up faster than they are
+    consumed. With a ``master_key``, secrets are derived from it (see
+    govctl.generators.derived_secrets) rather than random. With a
+    ``data_key``, every environment's secrets file is encrypted under that
+    one key, which is created once for the whole run.
+    """
+    entries = list(entries)
+    workers = min(workers or default_workers(), max(len(entries), 1))
+
+    # Batch several environments per task to amortize inter-process overhead
+    # and let each batch prefetch its keys together
+    batch_size = min(MAX_BATCH_SIZE, max(1, len(entries) // (workers * 4)))
+    batches = (entries[i : i + batch_size] for i in range(0, len(entries), batch_size))
+
+    if workers == 1:
+        for batch in batches:
+            yield from generate_entries(
+                batch, output_dir, incremental, archive, master_key, data_key
+            )
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending: deque[Future[list[FleetResult]]] = deque(
+            executor.submit(
+                generate_entries,
+                batch,
+                output_dir,
+                incremental,
+                archive,
+                master_key,
+                data_key,
+            )
+            for batch in itertools.islice(batches, workers * TASKS_IN_FLIGHT_PER_WORKER)
+        )
+        while pending:
+            results = pending.popleft().result()
+            batch = next(batches, None)
+            if batch is not None:
+                pending.append(
+                    executor.submit(
+                        generate_entries,
+                        batch,
+                        output_dir,
+                        incremental,
+                        archive,
+                        master_key,
+                        data_key,
+                    )
+                )
+            yield from results
@@ -0,0 +1,152 @@
+"""Ingress values shared by the service sections, with performance profiles.
+
+Every public service sits behind ingress-nginx on the platform domain. Its
+``ingress`` values are built here from a named profile, which sets the
+nginx annotations for how the service's traffic behaves:
+
+- ``API`` (auth-service, governance-service): JSON requests and responses.
+  Buffered both ways, short timeouts and header buffers large enough for
+  bearer tokens.
+- ``UPLOAD`` (integrity-service): large artifact uploads. No body size limit,
+  request and response buffering off so that bodies stream to and from the
+  service instead of being spooled to the controller's disk first, and long
+  send/read timeouts.
+- ``SPA`` (governance-studio): the frontend. Buffered responses and short
+  timeouts; the body size limit stays at the API's, as the studio proxies
+  document uploads.
+
+Every profile talks HTTP/1.1 to the upstream with a keep-alive ``Connection``
+header, so the controller reuses its upstream connections (pooled by its
+``upstream-keepalive-*`` settings) instead of opening one per request.
+Response compression (``use-gzip``, ``enable-brotli``) is a controller-wide
+ConfigMap setting in ingress-nginx, with no per-Ingress annotation, so it is
+not set here.
+
+With ``config.ingress_rate_limits`` each profile also limits every client IP
+(``PROFILE_RATE_LIMITS``). This is off by default: behind a cloud load
+balancer or NAT, the controller sees the balancer's address as the client of
+every request unless it is configured to trust the forwarded one
+(``use-forwarded-headers`` or ``use-proxy-protocol`` in its ConfigMap, with
+the balancer's ranges in ``proxy-real-ip-cidr``), and would throttle all
+clients together.
+"""
+
+from enum import Enum
+from typing import Any
+
+from govctl.core.models import PlatformConfig
+
+# Annotation prefix of ingress-nginx
+NGINX = "nginx.ingress.kubernetes.io/"
+
+
+class IngressProfile(str, Enum):
+    API = "api"
+    UPLOAD = "upload"
+    SPA = "spa"
+
+
+# Upstream keep-alive, shared by every profile
+_KEEPALIVE: dict[str, str] = {
+    "proxy-http-version": "1.1",
+    "connection-proxy-header": "keep-alive",
+}
+
+# nginx annotations (without the prefix) of each profile
+PROFILE_ANNOTATIONS: dict[IngressProfile, dict[str, str]] = {
+    IngressProfile.API: {
+        **_KEEPALIVE,
+        "proxy-body-size": "64m",
+        "proxy-buffering": "on",
+        "proxy-buffer-size": "16k",
+        "proxy-buffers-number": "8",
+        "client-header-buffer-size": "16k",
+        "large-client-header-buffers": "4 16k",
+        "proxy-connect-timeout": "5",
+        "proxy-send-timeout": "60",
+        "proxy-read-timeout": "60",
+    },
+    IngressProfile.UPLOAD: {
+        **_KEEPALIVE,
+        "proxy-body-size": "0",
+        "proxy-request-buffering": "off",
+        "proxy-buffering": "off",
+        "client-header-buffer-size": "16k",
+        "large-client-header-buffers": "4 16k",
+        "proxy-connect-timeout": "5",
+        "proxy-send-timeout": "600",
+        "proxy-read-timeout": "600",
+    },
+    IngressProfile.SPA: {
+        **_KEEPALIVE,
+        "proxy-body-size": "64m",
+        "proxy-buffering": "on",
+        "proxy-buffer-size": "8k",
+        "proxy-buffers-number": "16",
+        "proxy-connect-timeout": "5",
+        "proxy-send-timeout": "30",
+        "proxy-read-timeout": "30",
+    },
+}
+
+# Per-client-IP limits of each profile, with config.ingress_rate_limits. The
+# SPA's burst leaves room for the asset requests of a first page load.
+PROFILE_RATE_LIMITS: dict[IngressProfile, dict[str, str]] = {
+    IngressProfile.API: {"limit-rps": "100", "limit-burst-multiplier": "5"},
+    IngressProfile.UPLOAD: {"limit-connections": "20"},
+    IngressProfile.SPA: {"limit-rps": "200", "limit-burst-multiplier": "5"},
+}
+
+# PlatformConfig fields read by ingress_values
+INGRESS_DEPENDS_ON: tuple[str, ...] = (
+    "enable_ingress",
+    "ingress_rate_limits",
+    "domain",
+    "environment",
+)
+
+
+def ingress_values(
+    config: PlatformConfig,
+    profile: IngressProfile,
+    path: str,
+    path_type: str = "ImplementationSpecific",
+    rewrite: bool = True,
+) -> dict[str, Any]:
+    """The ``ingress`` values of a service on the platform domain.
+
+    Args:
+        config: The configuration.
+        profile: The service's performance profile.
+        path: The service's path; with ``rewrite``, a regex whose second group
+            is the path passed on to the service (``/svc(/|$)(.*)``).
+        path_type: The path's pathType.
+        rewrite: Whether to strip the service's path prefix.
+    """
+    annotations = {"cert-manager.io/issuer": "letsencrypt-prod"}
+    if rewrite:
+        annotations[f"{NGINX}use-regex"] = "true"
+        annotations[f"{NGINX}rewrite-target"] = "/$2"
+    profile_annotations = dict(PROFILE_ANNOTATIONS[profile])
+    if config.ingress_rate_limits:
+        profile_annotations.update(PROFILE_RATE_LIMITS[profile])
+    for name, value in profile_annotations.items():
+        annotations[f"{NGINX}{name}"] = value
+
+    return {
+        "enabled": True,
+        "className": "nginx",
+        "annotations": annotations,
+        "hosts": [
+            {
+                "host": config.domain,
+                "paths": [{"path": path, "pathType": path_type}],
+            }
+        ],
+        "tls": [
+            {
+                "secretName": f"{config.environment}-tls-secret",
+                "hosts": [config.domain],
+            }
+        ],
+    }
@@ -1,24 +1,54 @@
 """Keycloak bootstrap values generator."""
 
-from typing import Any
+import io
+from typing import Any, TextIO
 
+from govctl.core.chart_index import validate
+from govctl.core.image_lock import image_depends_on, image_values
 from govctl.core.models import PlatformConfig
-from govctl.utils.yaml import dump_yaml_with_header
+from govctl.utils.profiling import phase
+from govctl.utils.yaml import write_yaml_with_header
+
+# Chart the generated values are for
+CHART = "keycloak-bootstrap"
+
+# PlatformConfig fields read by this generator (used to fingerprint its output)
+DEPENDS_ON: tuple[str, ...] = (
+    "domain",
+    "keycloak.realm",
+    "keycloak.token_exchange_key_algorithm",
+    image_depends_on("keycloak-bootstrap"),
+)
 
 
 def generate_keycloak_bootstrap(config: PlatformConfig) -> str:
     """Generate keycloak-bootstrap values.yaml content based on configuration."""
+    stream = io.StringIO()
+    write_keycloak_bootstrap(config, stream)
+    return stream.getvalue()
+
+
+def write_keycloak_bootstrap(config: PlatformConfig, stream: TextIO) -> None:
+    """Write keycloak-bootstrap values.yaml content to a text stream."""
+    with phase("build bootstrap"):
+        data = generate_keycloak_bootstrap_data(config)
+    with phase("check bootstrap"):
+        validate(CHART, data)
+    with phase("emit bootstrap"):
+        write_yaml_with_header(data, "bootstrap", config, stream)
+
+
+def generate_keycloak_bootstrap_data(config: PlatformConfig) -> dict[str, Any]:
+    """Build the keycloak-bootstrap values based on configuration."""
     domain = config.domain
-    realm = config.keycloak_realm
+    realm = config.keycloak.realm
 
     data: dict[str, Any] = {
         "bootstrap": {
             "enabled": True,
-            "image": {
-                "repository": "dwdraju/alpine-curl-jq",
-                "tag": "latest",
-                "pullPolicy": "IfNotPresent",
-            },
+            "image": image_values(
+                config, "keycloak-bootstrap", "dwdraju/alpine-curl-jq", "IfNotPresent"
+            ),
             "args": ["/scripts/bootstrap.sh"],
             "backoffLimit": 3,
             "ttlSecondsAfterFinished": 300,
@@ -48,6 +78,7 @@ def generate_keycloak_bootstrap(config: PlatformConfig) -> str:
                 "verifyEmail": False,
                 "sslRequired": "external",
                 "bruteForceProtected": True,
+                "defaultSignatureAlgorithm": config.token_exchange_signing_algorithm,
             },
             "tokens": {
                 "accessTokenLifespan": 300,
@@ -168,4 +199,4 @@ def generate_keycloak_bootstrap(config: PlatformConfig) -> str:
         },
     }
 
-    return dump_yaml_with_header(data, "bootstrap", config)
+    return data
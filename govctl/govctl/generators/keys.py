@@ -0,0 +1,316 @@
+"""Key material engine for generated signing keys.
+
+Key generation (RSA in particular) is by far the slowest step of a run, so
+keys are generated ahead of time on a thread pool as soon as it is known that
+one will be needed (i.e. once the auth provider is chosen). Generated keys are
+interchangeable random material, so any finished key of the right algorithm
+can be handed to whichever caller asks first; ``generate_secrets`` only
+collects the result.
+"""
+
+import itertools
+import math
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import cache
+from typing import Any
+
+from govctl.core.models import AuthProvider, KeyAlgorithm, PlatformConfig
+from govctl.generators.derived_secrets import deriving
+from govctl.utils.profiling import phase
+
+
+def generate_private_key(algorithm: KeyAlgorithm = KeyAlgorithm.RSA_2048) -> str:
+    """Generate a private key in PKCS8 PEM format."""
+    # cryptography is slow to import, and only needed once a key is generated
+    from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+
+    with phase(f"generate {algorithm.value} key"):
+        if algorithm == KeyAlgorithm.RSA_2048:
+            key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        elif algorithm == KeyAlgorithm.RSA_3072:
+            key = rsa.generate_private_key(public_exponent=65537, key_size=3072)
+        elif algorithm == KeyAlgorithm.EC_P256:
+            key = ec.generate_private_key(ec.SECP256R1())
+        elif algorithm == KeyAlgorithm.ED25519:
+            key = ed25519.Ed25519PrivateKey.generate()
+        else:
+            raise ValueError(f"Unsupported key algorithm: {algorithm}")
+
+        return _to_pem(key)
+
+
+def _to_pem(key: Any) -> str:
+    from cryptography.hazmat.primitives import serialization
+
+    return key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    ).decode()
+
+
+# Order of the P-256 group
+_P256_ORDER = 0xFFFFFFFF00000000FFFFFFFFFFFFFFFFBCE6FAADA7179E84F3B9CAC2FC632551
+
+# Prime candidates sharing a factor with an odd prime below these bounds are
+# rejected with a gcd before running Miller-Rabin on them: first the cheap
+# gcd with the small primes, which rejects most, then the larger one
+_SIEVE_BOUNDS = (1 << 11, 1 << 16)
+
+# Miller-Rabin rounds (with bases from the seed) per RSA prime candidate,
+# followed by a strong Lucas test as FIPS 186-5 (appendix B.3) allows:
+# together they are the Baillie-PSW test, which has no known pseudoprime
+_MILLER_RABIN_ROUNDS = 5
+
+
+def private_key_from_seed(algorithm: KeyAlgorithm, seed: bytes) -> str:
+    """Deterministically derive a private key (PKCS8 PEM) from a secret seed.
+
+    The same seed and algorithm always give the same key. EC and Ed25519 keys
+    take their scalar straight from the seed; RSA primes are searched for in a
+    stream of candidates expanded from the seed with HKDF, as FIPS 186-5
+    (appendix A.1.3) does from a DRBG, and the derived key is checked by
+    OpenSSL like any loaded key. ``seed`` should be at least 32 bytes of
+    uniformly random material, e.g. from HKDF.
+    """
+    from cryptography.hazmat.primitives.asymmetric import ec, ed25519
+
+    with phase(f"derive {algorithm.value} key"):
+        if algorithm == KeyAlgorithm.RSA_2048:
+            key = _rsa_key_from_seed(seed, 2048)
+        elif algorithm == KeyAlgorithm.RSA_3072:
+            key = _rsa_key_from_seed(seed, 3072)
+        elif algorithm == KeyAlgorithm.EC_P256:
+            # 64 extra bits make the bias of the modular reduction negligible
+            scalar = int.from_bytes(_expand(seed, b"ec-p256", 40), "big")
+            key = ec.derive_private_key(scalar % (_P256_ORDER - 1) + 1, ec.SECP256R1())
+        elif algorithm == KeyAlgorithm.ED25519:
+            key = ed25519.Ed25519PrivateKey.from_private_bytes(
+                _expand(seed, b"ed25519", 32)
+            )
+        else:
+            raise ValueError(f"Unsupported key algorithm: {algorithm}")
+
+        return _to_pem(key)
+
+
+def _expand(seed: bytes, label: bytes, length: int) -> bytes:
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.kdf.hkdf import HKDFExpand
+
+    return HKDFExpand(hashes.SHA256(), length, label).derive(seed)
+
+
+def _rsa_key_from_seed(seed: bytes, bits: int) -> Any:
+    from cryptography.hazmat.primitives.asymmetric import rsa
+
+    e = 65537
+    p = _prime_from_seed(seed, b"rsa-p", bits // 2, e)
+    q = _prime_from_seed(seed, b"rsa-q", bits // 2, e)
+    # |p - q| must not be small (FIPS 186-5 A.1.3); with independent random
+    # primes this only fails with negligible probability, but check anyway
+    if abs(p - q) <= 1 << (bits // 2 - 100):
+        raise ValueError("Derived RSA primes are too close; use a different seed")
+    d = pow(e, -1, math.lcm(p - 1, q - 1))
+    return rsa.RSAPrivateNumbers(
+        p=p,
+        q=q,
+        d=d,
+        dmp1=rsa.rsa_crt_dmp1(d, p),
+        dmq1=rsa.rsa_crt_dmq1(d, q),
+        iqmp=rsa.rsa_crt_iqmp(p, q),
+        public_numbers=rsa.RSAPublicNumbers(e, p * q),
+    ).private_key()
+
+
+def _prime_from_seed(seed: bytes, label: bytes, bits: int, e: int) -> int:
+    """First prime in the candidate stream for ``label`` that suits exponent e."""
+    for counter in itertools.count():
+        stream = _expand(seed, label + counter.to_bytes(4, "big"), bits // 8 * 2)
+        # Top two bits set so that p * q has exactly twice the bits; odd
+        candidate = int.from_bytes(stream[: bits // 8], "big")
+        candidate |= (3 << (bits - 2)) | 1
+        if any(math.gcd(candidate, product) != 1 for product in _sieve_products()):
+            continue
+        if math.gcd(candidate - 1, e) != 1:
+            continue
+        if _is_probable_prime(
+            candidate, stream[bits // 8 :]
+        ) and _is_strong_lucas_probable_prime(candidate):
+            return candidate
+    raise AssertionError("unreachable")
+
+
+@cache
+def _sieve_products() -> tuple[int, ...]:
+    """Products of the odd primes in each range of ``_SIEVE_BOUNDS``."""
+    bound = _SIEVE_BOUNDS[-1]
+    sieve = bytearray([1]) * bound
+    for n in range(3, math.isqrt(bound) + 1, 2):
+        if sieve[n]:
+            sieve[n * n :: 2 * n] = bytes(len(range(n * n, bound, 2 * n)))
+    products, low = [], 3
+    for high in _SIEVE_BOUNDS:
+        products.append(math.prod(n for n in range(low, high, 2) if sieve[n]))
+        low = high + 1
+    return tuple(products)
+
+
+def _is_probable_prime(n: int, randomness: bytes) -> bool:
+    """Miller-Rabin test, with bases taken from ``randomness``."""
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d, s = d // 2, s + 1
+    chunk = len(randomness) // _MILLER_RABIN_ROUNDS
+    for i in range(_MILLER_RABIN_ROUNDS):
+        base = int.from_bytes(randomness[i * chunk : (i + 1) * chunk], "big")
+        x = pow(base % (n - 3) + 2, d, n)
+        if x in (1, n - 1):
+            continue
+        for _ in range(s - 1):
+            x = pow(x, 2, n)
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def _is_strong_lucas_probable_prime(n: int) -> bool:
+    """Strong Lucas test with Selfridge's parameters (P = 1, Q = (1 - D) / 4)."""
+    if math.isqrt(n) ** 2 == n:
+        return False  # no D with Jacobi symbol -1 exists
+    D = 5
+    while (jacobi := _jacobi(D, n)) != -1:
+        if jacobi == 0 and abs(D) != n:
+            return False
+        D = -D - 2 if D > 0 else -D + 2
+    Q = (1 - D) // 4
+
+    d, s = n + 1, 0
+    while d % 2 == 0:
+        d, s = d // 2, s + 1
+    # U_k, V_k and Q^k for k = the bits of d read so far, starting at k = 1
+    u, v, q_k = 1, 1, Q % n
+    for bit in bin(d)[3:]:
+        u, v, q_k = u * v % n, (v * v - 2 * q_k) % n, q_k * q_k % n
+        if bit == "1":
+            u, v = _halve((u + v) % n, n), _halve((D * u + v) % n, n)
+            q_k = q_k * Q % n
+    if u == 0 or v == 0:
+        return True
+    for _ in range(s - 1):
+        v, q_k = (v * v - 2 * q_k) % n, q_k * q_k % n
+        if v == 0:
+            return True
+    return False
+
+
+def _halve(x: int, n: int) -> int:
+    """x / 2 modulo an odd n."""
+    return (x + n if x % 2 else x) // 2
+
+
+def _jacobi(a: int, n: int) -> int:
+    """Jacobi symbol (a / n) for an odd n > 0."""
+    a, result = a % n, 1
+    while a:
+        while a % 2 == 0:
+            a //= 2
+            if n % 8 in (3, 5):
+                result = -result
+        a, n = n, a
+        if a % 4 == 3 and n % 4 == 3:
+            result = -result
+        a %= n
+    return result if n == 1 else 0
+
+
+def key_algorithm_of(pem: str) -> KeyAlgorithm | None:
+    """Identify the algorithm of a PEM private key, or None if unsupported."""
+    from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+    from cryptography.hazmat.primitives import serialization
+
+    try:
+        # Only the key type is needed here; RSA validation costs tens of ms
+        key = serialization.load_pem_private_key(
+            pem.encode(), password=None, unsafe_skip_rsa_key_validation=True
+        )
+    except (ValueError, TypeError):
+        return None
+
+    if isinstance(key, rsa.RSAPrivateKey):
+        return {2048: KeyAlgorithm.RSA_2048, 3072: KeyAlgorithm.RSA_3072}.get(
+            key.key_size
+        )
+    if isinstance(key, ec.EllipticCurvePrivateKey) and isinstance(
+        key.curve, ec.SECP256R1
+    ):
+        return KeyAlgorithm.EC_P256
+    if isinstance(key, ed25519.Ed25519PrivateKey):
+        return KeyAlgorithm.ED25519
+    return None
+
+
+def needs_token_exchange_key(config: PlatformConfig) -> bool:
+    """Whether the secrets for this configuration include a token-exchange key."""
+    return config.auth_provider == AuthProvider.KEYCLOAK
+
+
+class KeyMaterialEngine:
+    """Generates private keys in the background and hands them out on demand."""
+
+    def __init__(self, max_workers: int | None = None):
+        self._max_workers = max_workers
+        self._executor: ThreadPoolExecutor | None = None
+        self._pending: dict[KeyAlgorithm, deque[Future[str]]] = {}
+        self._lock = threading.Lock()
+
+    def _submit(self, algorithm: KeyAlgorithm) -> Future[str]:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_workers, thread_name_prefix="govctl-keygen"
+            )
+        return self._executor.submit(generate_private_key, algorithm)
+
+    def prefetch(
+        self, algorithm: KeyAlgorithm = KeyAlgorithm.RSA_2048, count: int = 1
+    ) -> None:
+        """Start generating ``count`` keys of the given algorithm in the background."""
+        with self._lock:
+            pending = self._pending.setdefault(algorithm, deque())
+            for _ in range(count):
+                pending.append(self._submit(algorithm))
+
+    def prefetch_for(self, config: PlatformConfig) -> None:
+        """Start generating the keys a configuration's secrets will need.
+
+        Nothing to do when secrets are derived from a master key.
+        """
+        if needs_token_exchange_key(config) and not deriving():
+            self.prefetch(config.keycloak.token_exchange_key_algorithm)
+
+    def take(self, algorithm: KeyAlgorithm = KeyAlgorithm.RSA_2048) -> str:
+        """Return a private key, waiting for a prefetched one if available.
+
+        Falls back to generating the key synchronously if none was prefetched.
+        """
+        with self._lock:
+            pending = self._pending.get(algorithm)
+            future = pending.popleft() if pending else None
+        if future is None:
+            return generate_private_key(algorithm)
+        return future.result()
+
+    def shutdown(self) -> None:
+        """Cancel outstanding prefetches and release the worker threads."""
+        with self._lock:
+            self._pending.clear()
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+key_engine = KeyMaterialEngine()
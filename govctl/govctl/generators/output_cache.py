@@ -0,0 +1,172 @@
+"""Content-addressed on-disk cache of rendered non-secret output files.
+
+values.yaml and the bootstrap files are pure functions of the configuration
+fields their sections read and govctl's code, so a rendered file is stored
+under a hash of exactly those (the incremental-regeneration fingerprints and
+a digest of the govctl package's files) and reused by any later run, in any
+process, with the same key, whichever directory it runs from. The charts
+the generators check their output against are those of the
+``chart_index.json`` shipped in the package, so they are covered by the
+digest. Secrets are never cached.
+
+Entries live in ``cache_dir("outputs")``; if that directory cannot be
+created, files are rendered without the cache. The cache is capped in size
+(``$GOVCTL_OUTPUT_CACHE_MB``, 64 MiB by default; 0 disables it) and evicts
+the least recently used entries first, using file modification times, which
+are refreshed on every hit.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable
+
+from govctl.core.chart_index import collecting_problems, report
+from govctl.generators.fingerprint import code_digest
+from govctl.utils.cache import cache_dir, write_atomic
+from govctl.utils.profiling import phase
+
+CACHE_NAME = "outputs"
+DEFAULT_MAX_MB = 64
+
+# When over the cap, evict down to this fraction of it so that eviction does
+# not run again on the very next write
+_EVICT_TO = 0.8
+
+
+def cache_key(kind: str, fingerprints: dict[str, str]) -> str:
+    """Key of a rendered file from its fingerprints and govctl's code."""
+    payload = json.dumps([kind, fingerprints, code_digest()], sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class OutputCache:
+    """Size-capped, least-recently-used cache of rendered files in a directory."""
+
+    def __init__(self, directory: Path, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        # Total size of the entries, scanned on the first write
+        self._size: int | None = None
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> tuple[str, list[str]] | None:
+        """(content, chart key problems) stored under ``key``, if any."""
+        path = self._path(key)
+        try:
+            entry = json.loads(path.read_bytes())
+            os.utime(path)  # mark as recently used
+        except (OSError, ValueError):
+            return None
+        return entry["content"], entry["problems"]
+
+    def put(self, key: str, content: str, problems: list[str]) -> None:
+        """Store a rendered file, evicting old entries if over the size cap."""
+        data = json.dumps({"content": content, "problems": problems}).encode()
+        write_atomic(self._path(key), data)
+        with self._lock:
+            if self._size is None:
+                self._size = self._scan_size()
+            else:
+                self._size += len(data)
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _entries(self) -> list[tuple[float, int, str]]:
+        """(modification time, size, path) of every entry on disk."""
+        entries = []
+        try:
+            with os.scandir(self.directory) as it:
+                for entry in it:
+                    if not entry.name.endswith(".json"):
+                        continue
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue  # evicted by another process meanwhile
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+        except OSError:
+            pass
+        return entries
+
+    def _scan_size(self) -> int:
+        return sum(size for _, size, _ in self._entries())
+
+    def _evict(self) -> None:
+        # Other processes share the directory, so go by what is on disk
+        entries = sorted(self._entries())
+        size = sum(size for _, size, _ in entries)
+        target = self.max_bytes * _EVICT_TO
+        for _, entry_size, path in entries:
+            if size <= target:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            size -= entry_size
+        self._size = size
+
+
+_output_cache: OutputCache | None = None
+# Whether the cache directory could not be created (not retried)
+_output_cache_unusable = False
+_output_cache_lock = threading.Lock()
+
+
+def output_cache() -> OutputCache | None:
+    """The process-wide output cache, or None if disabled or unusable."""
+    global _output_cache, _output_cache_unusable
+    with _output_cache_lock:
+        if _output_cache is None and not _output_cache_unusable:
+            max_mb = os.environ.get("GOVCTL_OUTPUT_CACHE_MB", str(DEFAULT_MAX_MB))
+            try:
+                max_bytes = int(float(max_mb) * 1024 * 1024)
+            except ValueError:
+                raise ValueError(
+                    f"GOVCTL_OUTPUT_CACHE_MB must be a number, not {max_mb!r}"
+                ) from None
+            if max_bytes <= 0:
+                return None
+            try:
+                directory = cache_dir(CACHE_NAME)
+            except OSError:
+                _output_cache_unusable = True
+                return None
+            _output_cache = OutputCache(directory, max_bytes)
+        return _output_cache
+
+
+def render_cached(
+    kind: str, fingerprints: dict[str, str], render: Callable[[], Any]
+) -> Any:
+    """Render a file through the output cache.
+
+    ``render`` is only called on a miss. Chart key problems it reports are
+    stored with the file and reported again on every hit. A ``None`` result
+    (no file for this configuration) is not cached.
+    """
+    cache = output_cache()
+    if cache is None:
+        return render()
+
+    key = cache_key(kind, fingerprints)
+    with phase("output cache"):
+        cached = cache.get(key)
+    if cached is not None:
+        content, problems = cached
+        report(problems)
+        return content
+
+    with collecting_problems() as problems:
+        content = render()
+    report(problems)
+    if content is not None:
+        with phase("output cache"):
+            cache.put(key, content, problems)
+    return content
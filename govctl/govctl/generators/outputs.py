@@ -0,0 +1,304 @@
+"""Per-environment output generator.
+
+Bundles the values, secrets, and bootstrap generators so callers that need
+every file for a configuration (init, fleet) drive them the same way.
+"""
+
+import io
+import json
+import os
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, TextIO
+
+import yaml
+
+from govctl.core.models import AuthProvider, PlatformConfig
+from govctl.generators.values import generate_values, write_values
+from govctl.generators.secrets import generate_secrets, write_secrets
+from govctl.generators.keycloak_bootstrap import write_keycloak_bootstrap
+from govctl.generators.entra_bootstrap import write_entra_bootstrap
+from govctl.generators.auth0_bootstrap import write_auth0_bootstrap
+from govctl.utils.archive import Archive
+from govctl.utils.envelope import ENCRYPTED_SUFFIX, DataKey
+from govctl.utils.profiling import phase
+from govctl.generators.output_cache import render_cached
+from govctl.generators.fingerprint import (
+    bootstrap_fingerprints,
+    secrets_fingerprints,
+    values_fingerprints,
+)
+
+# Per-file section fingerprints from the last incremental run, kept in the
+# output directory next to the generated files
+STATE_FILE = ".govctl-state.json"
+
+# Bootstrap values writer for each auth provider
+BOOTSTRAP_WRITERS: dict[AuthProvider, Callable[[PlatformConfig, TextIO], None]] = {
+    AuthProvider.AUTH0: write_auth0_bootstrap,
+    AuthProvider.ENTRA: write_entra_bootstrap,
+    AuthProvider.KEYCLOAK: write_keycloak_bootstrap,
+}
+
+
+def generate_bootstrap(config: PlatformConfig) -> str | None:
+    """Generate the bootstrap values for the configured auth provider, if any."""
+    writer = BOOTSTRAP_WRITERS.get(config.auth_provider)
+    if writer is None:
+        return None
+    stream = io.StringIO()
+    writer(config, stream)
+    return stream.getvalue()
+
+
+def output_writers(
+    config: PlatformConfig,
+) -> list[tuple[str, Callable[[TextIO], None]]]:
+    """List every output file for a configuration with a writer for its content.
+
+    values.yaml and the bootstrap file go through the output cache; see
+    govctl.generators.output_cache.
+
+    Returns:
+        (file name, writer) pairs in values, secrets, bootstrap order. Each
+        writer streams the file's content to the text stream it is given.
+    """
+    writers: list[tuple[str, Callable[[TextIO], None]]] = [
+        (
+            f"values-{config.environment}.yaml",
+            _cached_writer(
+                "values", values_fingerprints(config), partial(write_values, config)
+            ),
+        ),
+        (secrets_file_name(config), partial(write_secrets, config)),
+    ]
+
+    bootstrap_writer = BOOTSTRAP_WRITERS.get(config.auth_provider)
+    if bootstrap_writer is not None:
+        writers.append(
+            (
+                f"bootstrap-{config.environment}.yaml",
+                _cached_writer(
+                    "bootstrap",
+                    bootstrap_fingerprints(config),
+                    partial(bootstrap_writer, config),
+                ),
+            )
+        )
+
+    return writers
+
+
+def _cached_writer(
+    kind: str, fingerprints: dict[str, str], writer: Callable[[TextIO], None]
+) -> Callable[[TextIO], None]:
+    """Wrap a writer so that its content comes from the output cache if present."""
+
+    def render() -> str:
+        stream = io.StringIO()
+        writer(stream)
+        return stream.getvalue()
+
+    def write(stream: TextIO) -> None:
+        stream.write(render_cached(kind, fingerprints, render))
+
+    return write
+
+
+def secrets_file_name(config: PlatformConfig) -> str:
+    """Name of the (unencrypted) secrets file for a configuration."""
+    return f"secrets-{config.environment}.yaml"
+
+
+def generate_outputs(
+    config: PlatformConfig, data_key: DataKey | None = None
+) -> dict[str, str | bytes]:
+    """Generate every output file for a configuration.
+
+    With a ``data_key``, the secrets file is encrypted (see
+    govctl.utils.envelope) and named ``secrets-<env>.yaml.enc``.
+
+    Returns:
+        Mapping of file name to content, in values, secrets, bootstrap order.
+    """
+    outputs: dict[str, str | bytes] = {}
+    for file_name, writer in output_writers(config):
+        stream = io.StringIO()
+        with phase(file_name):
+            writer(stream)
+        if data_key is not None and file_name == secrets_file_name(config):
+            with phase("encrypt"):
+                outputs[file_name + ENCRYPTED_SUFFIX] = data_key.seal(stream.getvalue())
+        else:
+            outputs[file_name] = stream.getvalue()
+    return outputs
+
+
+def write_stream(
+    config: PlatformConfig, stream: TextIO, source_prefix: str = ""
+) -> None:
+    """Write every output file for a configuration as a multi-document YAML stream.
+
+    Each file becomes one document, introduced by a ``# Source:`` comment
+    naming the file (as ``helm template`` does), and is written straight to
+    the stream without being held in memory.
+    """
+    for file_name, writer in output_writers(config):
+        stream.write(f"---\n# Source: {source_prefix}{file_name}\n")
+        writer(stream)
+
+
+def write_archive(
+    config: PlatformConfig,
+    archive: Archive,
+    prefix: str = "",
+    data_key: DataKey | None = None,
+) -> None:
+    """Add every output file for a configuration to an archive.
+
+    Files are named ``<prefix><file name>``, in values, secrets, bootstrap
+    order. Each is generated in memory before it is added, as archive entries
+    need their size up front. With a ``data_key``, the secrets file is
+    encrypted, as for ``generate_outputs``.
+    """
+    for file_name, content in generate_outputs(config, data_key).items():
+        with phase("archive"):
+            archive.add(f"{prefix}{file_name}", content)
+
+
+def write_outputs(
+    config: PlatformConfig,
+    output_dir: Path,
+    incremental: bool = False,
+    data_key: DataKey | None = None,
+) -> list[tuple[Path, bool]]:
+    """Generate and write every output file for a configuration.
+
+    In incremental mode, a file is only regenerated when the fingerprint of a
+    config field one of its sections reads has changed since the last run,
+    secrets already present in the existing secrets file are kept, and files
+    whose content is byte-identical are not rewritten.
+
+    With a ``data_key``, the secrets file is encrypted as it is written, to
+    ``secrets-<env>.yaml.enc``; this cannot be combined with incremental mode,
+    which needs to read the existing secrets.
+
+    Returns:
+        (path, written) for each output file, in values, secrets, bootstrap order.
+    """
+    if data_key is not None and incremental:
+        raise ValueError("Encrypted secrets cannot be regenerated incrementally")
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    if not incremental:
+        results = []
+        for file_name, writer in output_writers(config):
+            path = output_dir / file_name
+            if data_key is not None and file_name == secrets_file_name(config):
+                path = output_dir / (file_name + ENCRYPTED_SUFFIX)
+                # Only replace the file once it is complete and sealed
+                tmp = path.with_name(f".{path.name}.{os.getpid()}")
+                try:
+                    with phase(file_name), open(tmp, "wb") as raw, data_key.writer(
+                        raw
+                    ) as f:
+                        writer(f)
+                    os.replace(tmp, path)
+                except BaseException:
+                    tmp.unlink(missing_ok=True)
+                    raise
+            else:
+                with phase(file_name), open(path, "w") as f:
+                    writer(f)
+            results.append((path, True))
+        return results
+
+    secrets_path = output_dir / secrets_file_name(config)
+    with phase("fingerprint config"):
+        planned = _plan_incremental(config, secrets_path)
+
+    state_path = output_dir / STATE_FILE
+    state = _load_state(state_path)
+    state_changed = False
+    results = []
+    for file_name, fingerprints, generate in planned:
+        path = output_dir / file_name
+        if path.exists() and state.get(file_name) == fingerprints:
+            results.append((path, False))
+            continue
+
+        with phase(file_name):
+            content = generate()
+            if content is None:
+                continue
+            results.append((path, _write_if_changed(path, content)))
+        state[file_name] = fingerprints
+        state_changed = True
+
+    if state_changed:
+        state_path.write_text(json.dumps(state, indent=2, sort_keys=True) + "\n")
+
+    return results
+
+
+def _plan_incremental(
+    config: PlatformConfig, secrets_path: Path
+) -> list[tuple[str, dict[str, str], Callable[[], str | None]]]:
+    """(file name, section fingerprints, generate) for each output file."""
+    return [
+        (
+            f"values-{config.environment}.yaml",
+            values_fingerprints(config),
+            lambda: render_cached(
+                "values", values_fingerprints(config), partial(generate_values, config)
+            ),
+        ),
+        (
+            secrets_path.name,
+            secrets_fingerprints(config),
+            lambda: generate_secrets(config, _load_existing_secrets(secrets_path)),
+        ),
+        (
+            f"bootstrap-{config.environment}.yaml",
+            bootstrap_fingerprints(config),
+            lambda: render_cached(
+                "bootstrap",
+                bootstrap_fingerprints(config),
+                partial(generate_bootstrap, config),
+            ),
+        ),
+    ]
+
+
+def _write_if_changed(path: Path, content: str) -> bool:
+    """Write content unless the file already holds exactly these bytes."""
+    data = content.encode()
+    try:
+        if path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    path.write_bytes(data)
+    return True
+
+
+def _load_state(path: Path) -> dict[str, Any]:
+    """Load incremental state, treating a missing or corrupt file as empty."""
+    try:
+        state = json.loads(path.read_text())
+    except (FileNotFoundError, ValueError):
+        return {}
+    return state if isinstance(state, dict) else {}
+
+
+def _load_existing_secrets(path: Path) -> dict[str, Any] | None:
+    """Load ``global.secrets`` from an existing secrets file, if there is one."""
+    try:
+        with open(path) as f:
+            data = yaml.safe_load(f)
+    except (FileNotFoundError, yaml.YAMLError):
+        return None
+    try:
+        return data["global"]["secrets"]
+    except (TypeError, KeyError):
+        return None
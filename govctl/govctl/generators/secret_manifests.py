@@ -0,0 +1,512 @@
+"""Kubernetes Secret manifests for the platform, rendered without Helm.
+
+Reproduces ``charts/governance-platform/templates/secrets/*.yaml`` from the
+umbrella chart's effective values (see ``govctl.core.charts.release_values``),
+byte for byte as ``helm template`` prints them: the same comments and
+whitespace, the same labels, Go-style ``quote`` escaping and the base64
+``.dockerconfigjson``, and the same ``fail`` messages for missing values.
+
+Templates that render no Secret (e.g. the Auth0 secret for a Keycloak
+deployment) leave only a comment in Helm's output; they are skipped here.
+Keep this module in step with the chart's templates.
+"""
+
+import base64
+import math
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any, Callable, TextIO
+
+from govctl.core.charts import Chart
+from govctl.core.coalesce import Values
+
+TEMPLATE_DIR = "templates/secrets"
+
+
+class SecretRenderError(ValueError):
+    """One or more templates would ``fail``; ``errors`` holds their messages."""
+
+    def __init__(self, errors: list[str]):
+        super().__init__("\n".join(errors))
+        self.errors = errors
+
+
+@dataclass
+class SecretManifest:
+    """A rendered Secret and the template it comes from, as in ``# Source:``."""
+
+    source: str
+    content: str
+
+
+@dataclass
+class _Context:
+    values: Values
+    secrets: Values
+    namespace: str
+    labels: str
+
+
+# --- Go template semantics ---------------------------------------------------
+
+
+def _get(node: Any, *path: str) -> Any:
+    """``.a.b.c`` (or ``index . "a" "b" "c"``), with missing keys as nil."""
+    for key in path:
+        if not isinstance(node, dict):
+            return None
+        node = node.get(key)
+    return node
+
+
+def _go_number(value: float) -> str:
+    """Format a number like Go's ``%v`` (Helm reads every number as a float64)."""
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value == 0:
+        return "0"
+    sign, digits, exponent = Decimal(repr(float(value))).normalize().as_tuple()
+    text = "".join(map(str, digits))
+    decimal_exponent = len(digits) - 1 + exponent
+    prefix = "-" if sign else ""
+    # Shortest %g: exponent form from 1e+06 on, as in Helm's infamous "1e+06"
+    if decimal_exponent < -4 or decimal_exponent >= 6:
+        mantissa = text[0] + ("." + text[1:] if len(text) > 1 else "")
+        return f"{prefix}{mantissa}e{'-' if decimal_exponent < 0 else '+'}{abs(decimal_exponent):02d}"
+    return prefix + format(Decimal(repr(abs(float(value)))).normalize(), "f")
+
+
+def _go_value(value: Any) -> str:
+    """``{{ value }}``; Helm renders nil as an empty string."""
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (int, float)):
+        return _go_number(value)
+    return str(value)
+
+
+_GO_ESCAPES = {
+    "\a": "\\a",
+    "\b": "\\b",
+    "\f": "\\f",
+    "\n": "\\n",
+    "\r": "\\r",
+    "\t": "\\t",
+    "\v": "\\v",
+    "\\": "\\\\",
+    '"': '\\"',
+}
+
+
+def _quote(value: Any) -> str:
+    """Sprig's ``quote``: a Go double-quoted string literal, or nothing for nil."""
+    if value is None:
+        return ""
+    quoted = ['"']
+    for char in _go_value(value):
+        if char in _GO_ESCAPES:
+            quoted.append(_GO_ESCAPES[char])
+        elif char.isprintable():
+            quoted.append(char)
+        elif ord(char) < 0x80:
+            quoted.append(f"\\x{ord(char):02x}")
+        elif ord(char) <= 0xFFFF:
+            quoted.append(f"\\u{ord(char):04x}")
+        else:
+            quoted.append(f"\\U{ord(char):08x}")
+    quoted.append('"')
+    return "".join(quoted)
+
+
+def _printf_s(value: Any) -> str:
+    """``printf "%s"`` of a value."""
+    if isinstance(value, str):
+        return value
+    if value is None:
+        return "%!s(<nil>)"
+    if isinstance(value, bool):
+        return f"%!s(bool={_go_value(value)})"
+    if isinstance(value, (int, float)):
+        return f"%!s(float64={_go_number(value)})"
+    return str(value)
+
+
+def _b64enc(text: str) -> str:
+    return base64.b64encode(text.encode()).decode()
+
+
+def _trunc_name(name: str) -> str:
+    """``trunc 63 | trimSuffix "-"``"""
+    name = name[:63]
+    return name[:-1] if name.endswith("-") else name
+
+
+def _labels(chart: Chart, values: Values, release_name: str) -> str:
+    """``include "governance-platform.labels" . | nindent 4``"""
+    name = _trunc_name(_go_value(values.get("nameOverride") or chart.name))
+    chart_label = _trunc_name(f"{chart.name}-{chart.version}".replace("+", "_"))
+    lines = [
+        f"helm.sh/chart: {chart_label}",
+        f"app.kubernetes.io/name: {name}",
+        f"app.kubernetes.io/instance: {release_name}",
+    ]
+    if chart.app_version:
+        lines.append(f"app.kubernetes.io/version: {_quote(chart.app_version)}")
+    lines.append("app.kubernetes.io/managed-by: Helm")
+    return "".join(f"\n    {line}" for line in lines)
+
+
+# --- Templates ---------------------------------------------------------------
+
+
+def _secret(
+    context: _Context,
+    name: Any,
+    secret_type: str,
+    data_key: str,
+    entries: list[str],
+    sections: tuple[str, ...] = ("# Data Validation", "# Secret Resource"),
+) -> str:
+    """The rendered text of one secrets template, after Helm trims it."""
+    return (
+        "# Enablement Check\n\n"
+        + "\n\n".join(sections)
+        + "\napiVersion: v1\nkind: Secret\nmetadata:\n"
+        + f"  name: {_go_value(name)}\n"
+        + f"  namespace: {context.namespace}\n"
+        + f"  labels:{context.labels}\n"
+        + f"type: {secret_type}\n"
+        + f"{data_key}:"
+        + "".join(f"\n  {entry}" for entry in entries)
+    )
+
+
+def _entry(keys: Any, values: Any, field: str) -> str:
+    return f"{_go_value(_get(keys, field))}: {_quote(_get(values, field))}"
+
+
+@dataclass(frozen=True)
+class _OpaqueTemplate:
+    """A template that renders one Opaque Secret from ``global.secrets.<path>``."""
+
+    file: str
+    path: tuple[str, ...]
+    enabled: Callable[[_Context], Any]
+    # Value fields checked with `fail`, and the end of their messages
+    required: tuple[str, ...]
+    required_when: str
+    # stringData fields, and those only written when set
+    fields: tuple[str, ...]
+    optional_fields: tuple[str, ...] = ()
+    # Field the Secret itself is only rendered with (after validation)
+    only_with: str | None = None
+    resource_comment: str = "# Secret Resource"
+    fail_notes: tuple[tuple[str, str], ...] = ()
+
+    def render(self, context: _Context, errors: list[str]) -> str | None:
+        if not self.enabled(context):
+            return None
+        secret = _get(context.secrets, *self.path)
+        dotted = ".".join(("global", "secrets", *self.path))
+        notes = dict(self.fail_notes)
+        for field in ("secretName", *(f"values.{name}" for name in self.required)):
+            if not _get(secret, *field.split(".")):
+                errors.append(
+                    f"{TEMPLATE_DIR}/{self.file}: {dotted}.{field} is required "
+                    f"{self.required_when}{notes.get(field, '')}"
+                )
+                return None
+        values = _get(secret, "values")
+        if self.only_with and not _get(values, self.only_with):
+            return None
+
+        keys = _get(secret, "keys")
+        entries = [
+            _entry(keys, values, field)
+            for field in self.fields
+            if field not in self.optional_fields or _get(values, field)
+        ]
+        return _secret(
+            context,
+            _get(secret, "secretName"),
+            "Opaque",
+            "stringData",
+            entries,
+            ("# Data Validation", self.resource_comment),
+        )
+
+
+def _created(context: _Context) -> Any:
+    return _get(context.secrets, "create")
+
+
+def _provider(section: str, provider: str) -> Callable[[_Context], Any]:
+    return lambda context: _created(context) and (
+        _get(context.secrets, section, "provider") == provider
+    )
+
+
+def _storage(*fields: str, any_of: bool = False) -> Callable[[_Context], Any]:
+    def enabled(context: _Context) -> Any:
+        values = [_get(context.secrets, *field.split(".")) for field in fields]
+        return _created(context) and (any(values) if any_of else all(values))
+
+    return enabled
+
+
+OPAQUE_TEMPLATES = (
+    _OpaqueTemplate(
+        file="auth-service.yaml",
+        path=("authService",),
+        enabled=lambda context: _created(context)
+        and _get(context.values, "auth-service", "enabled"),
+        required=("apiSecret", "jwtSecret"),
+        required_when="when auth-service is enabled and create is true",
+        fields=("apiSecret", "jwtSecret"),
+    ),
+    _OpaqueTemplate(
+        file="auth0.yaml",
+        path=("auth", "auth0"),
+        enabled=_provider("auth", "auth0"),
+        required=("clientId", "clientSecret", "mgmtClientId", "mgmtClientSecret"),
+        required_when="when auth provider is auth0 and create is true",
+        fields=("clientId", "clientSecret", "mgmtClientId", "mgmtClientSecret"),
+    ),
+    _OpaqueTemplate(
+        file="aws-kms.yaml",
+        path=("keyManagement", "aws_kms"),
+        enabled=_provider("keyManagement", "aws_kms"),
+        required=("accessKeyId", "secretAccessKey"),
+        required_when="when key management provider is aws and create is true",
+        fields=("accessKeyId", "secretAccessKey", "sessionToken"),
+        optional_fields=("sessionToken",),
+    ),
+    _OpaqueTemplate(
+        file="aws-s3.yaml",
+        path=("storage", "aws_s3"),
+        enabled=_storage(
+            "storage.aws_s3.values.accessKeyId",
+            "storage.aws_s3.values.secretAccessKey",
+        ),
+        required=(),
+        required_when="when creating AWS credentials secret",
+        fields=("accessKeyId", "secretAccessKey"),
+    ),
+    _OpaqueTemplate(
+        file="azure-blob.yaml",
+        path=("storage", "azure_blob"),
+        enabled=_storage(
+            "storage.azure_blob.values.accountKey",
+            "storage.azure_blob.values.connectionString",
+            any_of=True,
+        ),
+        required=(),
+        required_when="when creating Azure storage credentials secret",
+        fields=("accountKey", "connectionString"),
+        optional_fields=("accountKey", "connectionString"),
+    ),
+    _OpaqueTemplate(
+        file="azure-key-vault.yaml",
+        path=("keyManagement", "azure_key_vault"),
+        enabled=_provider("keyManagement", "azure_key_vault"),
+        required=("clientId", "clientSecret", "tenantId", "vaultUrl"),
+        required_when="when key management provider is azure and create is true",
+        fields=("clientId", "clientSecret", "tenantId", "vaultUrl"),
+    ),
+    _OpaqueTemplate(
+        file="entra.yaml",
+        path=("auth", "entra"),
+        enabled=_provider("auth", "entra"),
+        required=("clientId", "clientSecret", "tenantId"),
+        required_when="when auth provider is entra and create is true",
+        fields=(
+            "clientId",
+            "clientSecret",
+            "tenantId",
+            "graphClientId",
+            "graphClientSecret",
+        ),
+        optional_fields=("graphClientId", "graphClientSecret"),
+    ),
+    _OpaqueTemplate(
+        file="gcp-kms.yaml",
+        path=("keyManagement", "gcp_kms"),
+        enabled=_provider("keyManagement", "gcp_kms"),
+        required=(),
+        required_when="when key management provider is gcp_kms and create is true",
+        fields=("serviceAccountJson",),
+        only_with="serviceAccountJson",
+        resource_comment=(
+            "# Secret Resource (only created if serviceAccountJson is provided)"
+        ),
+    ),
+    _OpaqueTemplate(
+        file="gcs.yaml",
+        path=("storage", "gcs"),
+        enabled=_storage("storage.gcs.values.serviceAccountJson"),
+        required=(),
+        required_when="when creating GCS credentials secret",
+        fields=("serviceAccountJson",),
+    ),
+    _OpaqueTemplate(
+        file="governance-worker.yaml",
+        path=("governanceWorker",),
+        enabled=lambda context: _created(context)
+        and _get(context.values, "governance-service", "enabled")
+        and _get(
+            context.values, "governance-service", "config", "serviceAccount", "enabled"
+        ),
+        required=("encryptionKey", "clientId", "clientSecret"),
+        required_when=(
+            "when governance-service.config.serviceAccount.enabled is true "
+            "and create is true"
+        ),
+        fields=("encryptionKey", "clientId", "clientSecret"),
+    ),
+    _OpaqueTemplate(
+        file="keycloak.yaml",
+        path=("auth", "keycloak"),
+        enabled=_provider("auth", "keycloak"),
+        required=("serviceAccountClientId", "serviceAccountClientSecret"),
+        required_when="when provider is keycloak and create is true",
+        fields=(
+            "serviceAccountClientId",
+            "serviceAccountClientSecret",
+            "tokenExchangePrivateKey",
+        ),
+        optional_fields=("tokenExchangePrivateKey",),
+        fail_notes=(
+            (
+                "values.serviceAccountClientSecret",
+                " (retrieve from Keycloak admin console)",
+            ),
+        ),
+    ),
+)
+
+
+def _render_database(context: _Context, errors: list[str]) -> str | None:
+    """``database.yaml``: adds the gateway DSN when gateway-stack reads this Secret."""
+    if not _created(context):
+        return None
+    database = _get(context.secrets, "database")
+    gateway = _get(context.values, "gateway-stack")
+    uses_platform_secret = _get(gateway, "enabled") and (
+        _get(gateway, "database", "existingSecret") == _get(database, "secretName")
+    )
+
+    checks = [
+        ("secretName", "when create is true"),
+        ("values.username", "when create is true"),
+        ("values.password", "when create is true"),
+    ]
+    if uses_platform_secret:
+        checks.append(
+            ("values.gatewayDsn", "when create and gateway-stack are enabled")
+        )
+    for field, when in checks:
+        if not _get(database, *field.split(".")):
+            errors.append(
+                f"{TEMPLATE_DIR}/database.yaml: global.secrets.database.{field} "
+                f"is required {when}"
+            )
+            return None
+
+    keys, values = _get(database, "keys"), _get(database, "values")
+    entries = [
+        "# Standard keys (used by platform services)",
+        _entry(keys, values, "username"),
+        _entry(keys, values, "password"),
+    ]
+    if uses_platform_secret:
+        entries.append(_entry(keys, values, "gatewayDsn"))
+    return _secret(
+        context, _get(database, "secretName"), "Opaque", "stringData", entries
+    )
+
+
+def _render_image_pull(context: _Context, errors: list[str]) -> str | None:
+    """``image-pull.yaml``: a dockerconfigjson Secret for the image registry."""
+    if not _created(context):
+        return None
+    registry_secret = _get(context.secrets, "imageRegistry")
+    for field in ("secretName", "registry", "values.username", "values.password"):
+        if not _get(registry_secret, *field.split(".")):
+            errors.append(
+                f"{TEMPLATE_DIR}/image-pull.yaml: global.secrets.imageRegistry.{field} "
+                "is required when create is true"
+            )
+            return None
+
+    registry = _printf_s(_get(registry_secret, "registry"))
+    username = _printf_s(_get(registry_secret, "values", "username"))
+    password = _printf_s(_get(registry_secret, "values", "password"))
+    email = _printf_s(_get(registry_secret, "values", "email"))
+    auth = _b64enc(f"{username}:{password}")
+    docker_config = (
+        f'{{"auths":{{"{registry}":{{"username":"{username}",'
+        f'"password":"{password}","email":"{email}","auth":"{auth}"}}}}}}'
+    )
+    return _secret(
+        context,
+        _get(registry_secret, "secretName"),
+        "kubernetes.io/dockerconfigjson",
+        "data",
+        [f".dockerconfigjson: {_b64enc(docker_config)}"],
+        ("# Data Validation", "# Variable Assignment", "# Secret Resource"),
+    )
+
+
+TEMPLATES: dict[str, Callable[[_Context, list[str]], str | None]] = {
+    **{template.file: template.render for template in OPAQUE_TEMPLATES},
+    "database.yaml": _render_database,
+    "image-pull.yaml": _render_image_pull,
+}
+
+
+def render_secret_manifests(
+    chart: Chart,
+    values: Values,
+    release_name: str = "governance-platform",
+    namespace: str = "default",
+) -> list[SecretManifest]:
+    """Render the platform's Secret manifests, in ``helm template`` order.
+
+    Args:
+        chart: The umbrella chart, for its name, version and app version.
+        values: The umbrella chart's effective values.
+        release_name: ``.Release.Name``.
+        namespace: ``.Release.Namespace`` (``helm template`` defaults to
+            ``default``).
+
+    Raises:
+        SecretRenderError: If a template would ``fail`` on missing values.
+    """
+    context = _Context(
+        values=values,
+        secrets=_get(values, "global", "secrets") or {},
+        namespace=namespace,
+        labels=_labels(chart, values, release_name),
+    )
+    errors: list[str] = []
+    manifests = []
+    # Helm orders manifests of the same kind by template path
+    for file in sorted(TEMPLATES):
+        content = TEMPLATES[file](context, errors)
+        if content is not None:
+            manifests.append(
+                SecretManifest(f"{chart.name}/{TEMPLATE_DIR}/{file}", content)
+            )
+    if errors:
+        raise SecretRenderError(errors)
+    return manifests
+
+
+def write_secret_manifests(manifests: list[SecretManifest], stream: TextIO) -> None:
+    """Write manifests as ``helm template`` prints them."""
+    for manifest in manifests:
+        stream.write(f"---\n# Source: {manifest.source}\n{manifest.content}\n")
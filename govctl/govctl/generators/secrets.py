@@ -1,12 +1,11 @@
 """Secrets.yaml generator."""
 
 import base64
+import io
 import secrets
-from typing import Any
-
-from cryptography.hazmat.primitives.asymmetric import rsa
-from cryptography.hazmat.primitives import serialization
+from typing import Any, TextIO
 
+from govctl.core.chart_index import UMBRELLA_CHART, validate
 from govctl.core.models import (
     PlatformConfig,
     CloudProvider,
@@ -14,60 +13,163 @@ from govctl.core.models import (
     DatabaseMode,
     KeyManagementProvider,
 )
-from govctl.utils.yaml import dump_yaml_with_header, _LiteralStr
+from govctl.core.pooling import POOLER_PORT, pooler_host
+from govctl.generators.derived_secrets import derive, derive_private_key, deriving
+from govctl.generators.keys import key_algorithm_of, key_engine
+from govctl.utils.profiling import phase
+from govctl.utils.yaml import (
+    write_yaml_with_header,
+    _CommentDumper,
+    _LiteralStr,
+    _RequiredStr,
+)
+
+# PlatformConfig fields read by this generator (used to fingerprint its output)
+DEPENDS_ON: tuple[str, ...] = (
+    "auth_provider",
+    "database_mode",
+    "image_registry_url",
+    "image_registry_username",
+    "image_registry_email",
+    "entra.tenant_id",
+    "keycloak.token_exchange_key_algorithm",
+    "cloud_provider",
+    "aws_s3_use_iam_role",
+    "key_management_provider",
+    "azure_key_vault.tenant_id",
+    "azure_key_vault.url",
+    "enable_pgbouncer",
+    "release_name",
+)
+
+
+def _secret_bytes(config: PlatformConfig, purpose: str, length: int) -> bytes:
+    """Random bytes, or bytes derived from the master key in HKDF mode."""
+    if deriving():
+        return derive(config, purpose, length)
+    return secrets.token_bytes(length)
+
 
+def _generate_secret(config: PlatformConfig, purpose: str, length: int = 32) -> str:
+    """Generate a cryptographically secure secret (base64-encoded).
 
-def _generate_secret(length: int = 32) -> str:
-    """Generate a cryptographically secure random secret (base64-encoded)."""
-    return base64.b64encode(secrets.token_bytes(length)).decode()
+    ``purpose`` labels the secret for derivation from a master key; see
+    govctl.generators.derived_secrets.
+    """
+    return base64.b64encode(_secret_bytes(config, purpose, length)).decode()
 
 
-def _generate_db_secret(length: int = 32) -> str:
+def _generate_db_secret(config: PlatformConfig, purpose: str, length: int = 32) -> str:
     """Generate a cryptographically secure hex token.
 
     Uses only [0-9a-f] characters, safe for inclusion in URIs such as
     PostgreSQL connection strings.
     """
-    return secrets.token_hex(length)
+    return _secret_bytes(config, purpose, length).hex()
+
 
+def _token_exchange_private_key(
+    config: PlatformConfig, existing: dict[str, Any] | None = None
+) -> str:
+    """Collect a token-exchange private key (PEM) from the key material engine.
 
-def _generate_rsa_private_key(bits: int = 2048) -> str:
-    """Generate an RSA private key in PEM format."""
-    key = rsa.generate_private_key(public_exponent=65537, key_size=bits)
-    pem = key.private_bytes(
-        encoding=serialization.Encoding.PEM,
-        format=serialization.PrivateFormat.PKCS8,
-        encryption_algorithm=serialization.NoEncryption(),
-    ).decode()
-    return _LiteralStr(pem)
+    The key is usually already generated in the background; see
+    govctl.generators.keys. A previous key is reused if it matches the
+    configured key algorithm. In HKDF mode the key is derived from the
+    master key instead.
+    """
+    algorithm = config.keycloak.token_exchange_key_algorithm
+    previous = _previous(
+        existing, "auth", "keycloak", "values", "tokenExchangePrivateKey"
+    )
+    if previous and key_algorithm_of(previous) == algorithm:
+        return _LiteralStr(previous)
+    if deriving():
+        return _LiteralStr(
+            derive_private_key(
+                config, "auth/keycloak/tokenExchangePrivateKey", algorithm
+            )
+        )
+    with phase("wait for token-exchange key"):
+        return _LiteralStr(key_engine.take(algorithm))
+
+
+# Marker left in place of required values by older govctl versions
+_LEGACY_REQUIRED_PREFIX = "__REQUIRED__"
 
 
 def _required(comment: str) -> str:
-    """Mark a value as requiring user input. Post-processed into a YAML comment."""
-    return f"__REQUIRED__{comment}"
+    """Mark a value as requiring user input. Emitted as '' with a YAML comment."""
+    return _RequiredStr(comment)
 
 
-def _add_yaml_comments(yaml_str: str) -> str:
-    """Replace __REQUIRED__ markers with empty values and inline comments."""
-    import re
+def _previous(existing: dict[str, Any] | None, *path: str) -> str | None:
+    """Look up a filled-in value in a previously generated secrets section.
 
-    return re.sub(
-        r"'__REQUIRED__(.+?)'",
-        r"''  # REQUIRED: \1",
-        yaml_str,
-    )
+    Returns None if the value is missing, empty, or still a required marker.
+    """
+    node: Any = existing
+    for key in path:
+        if not isinstance(node, dict):
+            return None
+        node = node.get(key)
+    if isinstance(node, str) and node and not node.startswith(_LEGACY_REQUIRED_PREFIX):
+        return node
+    return None
 
 
-def generate_secrets(config: PlatformConfig) -> str:
-    """Generate secrets.yaml content based on configuration."""
-    secrets: dict[str, Any] = {
-        "global": {
-            "secrets": _generate_secrets_section(config),
+def _keep_filled_in(
+    section: dict[str, Any], existing: dict[str, Any], *path: str
+) -> None:
+    """Keep the values already filled in a previous file.
+
+    Required markers and values left empty (optional values the config does
+    not supply, such as the registry username or a KMS session token) are
+    replaced by the previous file's value, if it has one. Values the config
+    supplies explicitly win over the previous file's.
+    """
+    for key, value in section.items():
+        if isinstance(value, dict):
+            _keep_filled_in(value, existing, *path, key)
+        elif isinstance(value, _RequiredStr) or value == "":
+            previous = _previous(existing, *path, key)
+            if previous is not None:
+                section[key] = previous
+
+
+def generate_secrets(
+    config: PlatformConfig, existing: dict[str, Any] | None = None
+) -> str:
+    """Generate secrets.yaml content based on configuration.
+
+    Args:
+        config: Platform configuration.
+        existing: ``global.secrets`` from a previously generated secrets file.
+            Generated secrets and filled-in values found there are kept
+            instead of minting new ones.
+    """
+    stream = io.StringIO()
+    write_secrets(config, stream, existing)
+    return stream.getvalue()
+
+
+def write_secrets(
+    config: PlatformConfig, stream: TextIO, existing: dict[str, Any] | None = None
+) -> None:
+    """Write secrets.yaml content to a text stream. See ``generate_secrets``."""
+    with phase("build secrets"):
+        secrets: dict[str, Any] = {
+            "global": {
+                "secrets": _generate_secrets_section(config, existing),
+            }
         }
-    }
+    with phase("check secrets"):
+        validate(UMBRELLA_CHART, secrets)
 
-    yaml_output = dump_yaml_with_header(secrets, "secrets", config)
-    return _add_yaml_comments(yaml_output)
+    with phase("emit secrets"):
+        write_yaml_with_header(
+            secrets, "secrets", config, stream, dumper=_CommentDumper
+        )
 
 
 def _gateway_dsn(config: PlatformConfig, password: str) -> str:
@@ -77,8 +179,14 @@ def _gateway_dsn(config: PlatformConfig, password: str) -> str:
     so the generated password is repeated here. Change both together.
 
     Only used when gateway-stack is enabled; the umbrella writes this key into
-    the platform database Secret only in that case.
+    the platform database Secret only in that case. With PgBouncer enabled the
+    DSN points at the pooler, like every other database client.
     """
+    if config.enable_pgbouncer:
+        return (
+            f"postgres://postgres:{password}@{pooler_host(config)}:{POOLER_PORT}"
+            "/guardian_gateway?sslmode=disable"
+        )
     if config.database_mode == DatabaseMode.EXTERNAL:
         host = "TODO-set-managed-pg-host.example.com"
         ssl_mode = "verify-full"
@@ -91,9 +199,13 @@ def _gateway_dsn(config: PlatformConfig, password: str) -> str:
     return f"postgres://postgres:{password}@{host}:5432/guardian_gateway?sslmode={ssl_mode}"
 
 
-def _generate_secrets_section(config: PlatformConfig) -> dict[str, Any]:
+def _generate_secrets_section(
+    config: PlatformConfig, existing: dict[str, Any] | None = None
+) -> dict[str, Any]:
     """Generate the secrets section based on configuration."""
-    db_password = _generate_db_secret()
+    db_password = _previous(
+        existing, "database", "values", "password"
+    ) or _generate_db_secret(config, "database/password")
     secrets: dict[str, Any] = {
         "create": True,
         # Auth provider
@@ -114,8 +226,10 @@ def _generate_secrets_section(config: PlatformConfig) -> dict[str, Any]:
         "authService": {
             "secretName": "platform-auth-service",
             "values": {
-                "apiSecret": _generate_secret(),
-                "jwtSecret": _generate_secret(),
+                "apiSecret": _previous(existing, "authService", "values", "apiSecret")
+                or _generate_secret(config, "authService/apiSecret"),
+                "jwtSecret": _previous(existing, "authService", "values", "jwtSecret")
+                or _generate_secret(config, "authService/jwtSecret"),
             },
         },
         # Image registry (always required)
@@ -147,7 +261,7 @@ def _generate_secrets_section(config: PlatformConfig) -> dict[str, Any]:
             "values": {
                 "clientId": _required("Entra App Registration Client ID"),
                 "clientSecret": _required("Entra App Registration Client Secret"),
-                "tenantId": config.entra_tenant_id or _required("Entra Tenant ID"),
+                "tenantId": config.entra.tenant_id or _required("Entra Tenant ID"),
                 "graphClientId": _required("Microsoft Graph API Client ID"),
                 "graphClientSecret": _required("Microsoft Graph API Client Secret"),
             },
@@ -158,7 +272,9 @@ def _generate_secrets_section(config: PlatformConfig) -> dict[str, Any]:
             "values": {
                 "serviceAccountClientId": "governance-platform-backend",
                 "serviceAccountClientSecret": _required("Keycloak client secret"),
-                "tokenExchangePrivateKey": _generate_rsa_private_key(),
+                "tokenExchangePrivateKey": _token_exchange_private_key(
+                    config, existing
+                ),
             },
         }
 
@@ -166,7 +282,10 @@ def _generate_secrets_section(config: PlatformConfig) -> dict[str, Any]:
     secrets["governanceWorker"] = {
         "secretName": "platform-governance-worker",
         "values": {
-            "encryptionKey": _generate_secret(),
+            "encryptionKey": _previous(
+                existing, "governanceWorker", "values", "encryptionKey"
+            )
+            or _generate_secret(config, "governanceWorker/encryptionKey"),
             "clientId": _required("Worker service account client ID"),
             "clientSecret": _required("Worker service account client secret"),
         },
@@ -223,8 +342,9 @@ def _generate_secrets_section(config: PlatformConfig) -> dict[str, Any]:
             "values": {
                 "clientId": _required("Azure AD App Client ID"),
                 "clientSecret": _required("Azure AD App Client Secret"),
-                "tenantId": config.azure_tenant_id or _required("Azure Tenant ID"),
-                "vaultUrl": config.azure_key_vault_url
+                "tenantId": config.azure_key_vault.tenant_id
+                or _required("Azure Tenant ID"),
+                "vaultUrl": config.azure_key_vault.url
                 or _required("Azure Key Vault URL"),
             },
         }
@@ -238,4 +358,7 @@ def _generate_secrets_section(config: PlatformConfig) -> dict[str, Any]:
             },
         }
 
+    if existing:
+        _keep_filled_in(secrets, existing)
+
     return secrets
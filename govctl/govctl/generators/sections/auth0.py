@@ -4,6 +4,12 @@ from typing import Any
 
 from govctl.core.models import PlatformConfig
 
+# PlatformConfig fields read by this generator (used to fingerprint its output)
+DEPENDS_ON: tuple[str, ...] = (
+    "domain",
+    "auth0.domain",
+)
+
 
 def generate_auth0_section(config: PlatformConfig) -> dict[str, Any]:
     """Generate the auth0 post-install hook section of values.yaml."""
@@ -13,5 +19,5 @@ def generate_auth0_section(config: PlatformConfig) -> dict[str, Any]:
         "displayName": "Governance Platform",
         "createPlatformAdmin": True,
         "platformAdminEmail": f"admin@{config.domain}",
-        "domain": config.auth0_domain or "YOUR_AUTH0_DOMAIN.us.auth0.com",
+        "domain": config.auth0.domain or "YOUR_AUTH0_DOMAIN.us.auth0.com",
     }
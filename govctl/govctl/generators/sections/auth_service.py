@@ -2,50 +2,57 @@
 
 from typing import Any
 
+from govctl.core.image_lock import image_depends_on, image_values
 from govctl.core.models import PlatformConfig, AuthProvider, KeyManagementProvider
+from govctl.core.sizing import (
+    DEFAULT_REPLICAS,
+    SIZING_DEPENDS_ON,
+    service_sizing_values,
+)
+from govctl.generators.ingress import (
+    INGRESS_DEPENDS_ON,
+    IngressProfile,
+    ingress_values,
+)
+
+# PlatformConfig fields read by this generator (used to fingerprint its output)
+DEPENDS_ON: tuple[str, ...] = (
+    *INGRESS_DEPENDS_ON,
+    "auth_provider",
+    "auth0.domain",
+    "auth0.audience",
+    "entra.tenant_id",
+    "keycloak.url",
+    "keycloak.realm",
+    "keycloak.token_exchange_key_algorithm",
+    "key_management_provider",
+    "aws_kms.region",
+    "aws_kms.endpoint",
+    "aws_kms.alias_prefix",
+    "aws_kms.deletion_window_days",
+    "azure_key_vault.url",
+    "azure_key_vault.tenant_id",
+    "gcp_kms.project_id",
+    "gcp_kms.location_id",
+    "gcp_kms.key_ring_id",
+    "gcp_kms.scheduled_destroy_days",
+    image_depends_on("auth-service"),
+    *SIZING_DEPENDS_ON,
+)
 
 
 def generate_auth_service_section(config: PlatformConfig) -> dict[str, Any]:
     """Generate the auth-service section of values.yaml."""
     section: dict[str, Any] = {
-        "replicaCount": 2,
-        "image": {
-            "tag": "latest",
-            "pullPolicy": "Always",
-        },
+        "replicaCount": DEFAULT_REPLICAS["auth-service"],
+        "image": image_values(config, "auth-service"),
     }
+    section.update(service_sizing_values(config, "auth-service"))
 
     if config.enable_ingress:
-        section["ingress"] = {
-            "enabled": True,
-            "className": "nginx",
-            "annotations": {
-                "cert-manager.io/issuer": "letsencrypt-prod",
-                "nginx.ingress.kubernetes.io/use-regex": "true",
-                "nginx.ingress.kubernetes.io/rewrite-target": "/$2",
-                "nginx.ingress.kubernetes.io/proxy-body-size": "64m",
-                "nginx.ingress.kubernetes.io/proxy-buffer-size": "16k",
-                "nginx.ingress.kubernetes.io/client-header-buffer-size": "16k",
-                "nginx.ingress.kubernetes.io/large-client-header-buffers": "4 16k",
-            },
-            "hosts": [
-                {
-                    "host": config.domain,
-                    "paths": [
-                        {
-                            "path": "/authService(/|$)(.*)",
-                            "pathType": "ImplementationSpecific",
-                        }
-                    ],
-                }
-            ],
-            "tls": [
-                {
-                    "secretName": f"{config.environment}-tls-secret",
-                    "hosts": [config.domain],
-                }
-            ],
-        }
+        section["ingress"] = ingress_values(
+            config, IngressProfile.API, "/authService(/|$)(.*)"
+        )
 
     # Add auth provider config
     section["config"] = {
@@ -55,16 +62,16 @@ def generate_auth_service_section(config: PlatformConfig) -> dict[str, Any]:
     }
 
     if config.auth_provider == AuthProvider.AUTH0:
-        auth0_domain = config.auth0_domain or "YOUR_AUTH0_DOMAIN.us.auth0.com"
+        auth0_domain = config.auth0.domain or "YOUR_AUTH0_DOMAIN.us.auth0.com"
         section["config"]["idp"]["issuer"] = f"https://{auth0_domain}/"
         section["config"]["idp"]["skipIssuerVerification"] = True
         section["config"]["idp"]["auth0"] = {
             "domain": auth0_domain,
             "managementAudience": f"https://{auth0_domain}/api/v2/",
-            "apiIdentifier": config.auth0_audience or f"https://{auth0_domain}/api/v2/",
+            "apiIdentifier": config.auth0.audience or f"https://{auth0_domain}/api/v2/",
         }
     elif config.auth_provider == AuthProvider.ENTRA:
-        tenant_id = config.entra_tenant_id or "YOUR_ENTRA_TENANT_ID"
+        tenant_id = config.entra.tenant_id or "YOUR_ENTRA_TENANT_ID"
         section["config"]["idp"][
             "issuer"
         ] = f"https://login.microsoftonline.com/{tenant_id}/v2.0"
@@ -74,13 +81,13 @@ def generate_auth_service_section(config: PlatformConfig) -> dict[str, Any]:
             "defaultRoles": "user",
         }
     elif config.auth_provider == AuthProvider.KEYCLOAK:
-        keycloak_url = config.keycloak_url or f"https://{config.domain}/keycloak"
+        keycloak_url = config.keycloak.url or f"https://{config.domain}/keycloak"
         section["config"]["idp"][
             "issuer"
-        ] = f"{keycloak_url}/realms/{config.keycloak_realm}"
+        ] = f"{keycloak_url}/realms/{config.keycloak.realm}"
         section["config"]["idp"]["skipIssuerVerification"] = False
         section["config"]["idp"]["keycloak"] = {
-            "realm": config.keycloak_realm,
+            "realm": config.keycloak.realm,
             "adminUrl": keycloak_url,
             "clientId": "governance-platform-frontend",
             "enableUserManagement": True,
@@ -89,6 +96,7 @@ def generate_auth_service_section(config: PlatformConfig) -> dict[str, Any]:
         section["config"]["tokenExchange"] = {
             "enabled": True,
             "keyId": f"auth-service-{config.environment}-001",
+            "algorithm": config.token_exchange_signing_algorithm,
         }
 
     # Key management config (required for DID keys)
@@ -98,30 +106,30 @@ def generate_auth_service_section(config: PlatformConfig) -> dict[str, Any]:
 
     if config.key_management_provider == KeyManagementProvider.AWS_KMS:
         aws_kms_config: dict[str, Any] = {}
-        if config.aws_kms_region:
-            aws_kms_config["region"] = config.aws_kms_region
-        if config.aws_kms_endpoint:
-            aws_kms_config["endpoint"] = config.aws_kms_endpoint
-        if config.aws_kms_alias_prefix:
-            aws_kms_config["aliasPrefix"] = config.aws_kms_alias_prefix
-        if config.aws_kms_deletion_window_days != 7:
-            aws_kms_config["deletionWindowDays"] = config.aws_kms_deletion_window_days
+        if config.aws_kms.region:
+            aws_kms_config["region"] = config.aws_kms.region
+        if config.aws_kms.endpoint:
+            aws_kms_config["endpoint"] = config.aws_kms.endpoint
+        if config.aws_kms.alias_prefix:
+            aws_kms_config["aliasPrefix"] = config.aws_kms.alias_prefix
+        if config.aws_kms.deletion_window_days != 7:
+            aws_kms_config["deletionWindowDays"] = config.aws_kms.deletion_window_days
         if aws_kms_config:
             section["config"]["keyManagement"]["aws_kms"] = aws_kms_config
     elif config.key_management_provider == KeyManagementProvider.AZURE_KEY_VAULT:
         section["config"]["keyManagement"]["azure_key_vault"] = {
-            "vaultUrl": config.azure_key_vault_url,
-            "tenantId": config.azure_tenant_id,
+            "vaultUrl": config.azure_key_vault.url,
+            "tenantId": config.azure_key_vault.tenant_id,
         }
     elif config.key_management_provider == KeyManagementProvider.GCP_KMS:
         gcp_kms_config: dict[str, Any] = {
-            "projectId": config.gcp_kms_project_id,
-            "locationId": config.gcp_kms_location_id,
-            "keyRingId": config.gcp_kms_key_ring_id,
+            "projectId": config.gcp_kms.project_id,
+            "locationId": config.gcp_kms.location_id,
+            "keyRingId": config.gcp_kms.key_ring_id,
         }
-        if config.gcp_kms_scheduled_destroy_days != 24:
+        if config.gcp_kms.scheduled_destroy_days != 24:
             gcp_kms_config["scheduledDestroyDays"] = (
-                config.gcp_kms_scheduled_destroy_days
+                config.gcp_kms.scheduled_destroy_days
             )
         section["config"]["keyManagement"]["gcp_kms"] = gcp_kms_config
 
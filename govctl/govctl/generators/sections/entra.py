@@ -4,6 +4,9 @@ from typing import Any
 
 from govctl.core.models import PlatformConfig
 
+# PlatformConfig fields read by this generator (used to fingerprint its output)
+DEPENDS_ON: tuple[str, ...] = ("entra.tenant_id",)
+
 
 def generate_entra_section(config: PlatformConfig) -> dict[str, Any]:
     """Generate the entra post-install hook section of values.yaml."""
@@ -13,5 +16,5 @@ def generate_entra_section(config: PlatformConfig) -> dict[str, Any]:
         "displayName": "Governance Platform",
         "createPlatformAdmin": True,
         "platformAdminEmail": "YOUR_ENTRA_ADMIN_EMAIL",  # Must exist in your Entra tenant
-        "tenantId": config.entra_tenant_id or "YOUR_ENTRA_TENANT_ID",
+        "tenantId": config.entra.tenant_id or "YOUR_ENTRA_TENANT_ID",
     }
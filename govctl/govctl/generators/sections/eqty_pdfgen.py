@@ -2,7 +2,19 @@
 
 from typing import Any
 
+from govctl.core.image_lock import image_depends_on, image_values
 from govctl.core.models import PlatformConfig
+from govctl.core.sizing import (
+    DEFAULT_REPLICAS,
+    SIZING_DEPENDS_ON,
+    service_sizing_values,
+)
+
+# PlatformConfig fields read by this generator (used to fingerprint its output)
+DEPENDS_ON: tuple[str, ...] = (
+    image_depends_on("eqty-pdfgen"),
+    *SIZING_DEPENDS_ON,
+)
 
 
 def generate_eqty_pdfgen_section(config: PlatformConfig) -> dict[str, Any]:
@@ -13,11 +25,9 @@ def generate_eqty_pdfgen_section(config: PlatformConfig) -> dict[str, Any]:
     # per environment as the service is rolled out.
     section: dict[str, Any] = {
         "enabled": False,
-        "replicaCount": 2,
-        "image": {
-            "tag": "latest",
-            "pullPolicy": "Always",
-        },
+        "replicaCount": DEFAULT_REPLICAS["eqty-pdfgen"],
+        "image": image_values(config, "eqty-pdfgen"),
     }
+    section.update(service_sizing_values(config, "eqty-pdfgen"))
 
     return section
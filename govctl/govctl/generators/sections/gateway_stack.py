@@ -2,8 +2,16 @@
 
 from typing import Any
 
+from govctl.core.image_lock import image_depends_on, image_values
 from govctl.core.models import PlatformConfig
 
+# PlatformConfig fields read by this generator (used to fingerprint its output)
+DEPENDS_ON: tuple[str, ...] = (
+    image_depends_on("llm-gateway"),
+    image_depends_on("control-plane"),
+    image_depends_on("guardian-console"),
+)
+
 
 def generate_gateway_stack_section(config: PlatformConfig) -> dict[str, Any]:
     """Generate the gateway-stack section of values.yaml."""
@@ -21,23 +29,14 @@ def generate_gateway_stack_section(config: PlatformConfig) -> dict[str, Any]:
     section: dict[str, Any] = {
         "enabled": False,
         "llmGateway": {
-            "image": {
-                "tag": "latest",
-                "pullPolicy": "Always",
-            },
+            "image": image_values(config, "llm-gateway"),
         },
         "controlPlane": {
-            "image": {
-                "tag": "latest",
-                "pullPolicy": "Always",
-            },
+            "image": image_values(config, "control-plane"),
         },
         "guardianUI": {
             "enabled": False,
-            "image": {
-                "tag": "latest",
-                "pullPolicy": "Always",
-            },
+            "image": image_values(config, "guardian-console"),
         },
     }
 
@@ -2,47 +2,47 @@
 
 from typing import Any
 
+from govctl.core.image_lock import image_depends_on, image_values
 from govctl.core.models import PlatformConfig, CloudProvider, AuthProvider
+from govctl.core.sizing import (
+    DEFAULT_REPLICAS,
+    SIZING_DEPENDS_ON,
+    service_sizing_values,
+)
+from govctl.generators.ingress import (
+    INGRESS_DEPENDS_ON,
+    IngressProfile,
+    ingress_values,
+)
+
+# PlatformConfig fields read by this generator (used to fingerprint its output)
+DEPENDS_ON: tuple[str, ...] = (
+    *INGRESS_DEPENDS_ON,
+    "cloud_provider",
+    "cloud_region",
+    "aws_s3_use_iam_role",
+    "auth_provider",
+    "auth0.domain",
+    "entra.tenant_id",
+    "keycloak.url",
+    "keycloak.realm",
+    image_depends_on("governance-service"),
+    *SIZING_DEPENDS_ON,
+)
 
 
 def generate_governance_service_section(config: PlatformConfig) -> dict[str, Any]:
     """Generate the governance-service section of values.yaml."""
     section: dict[str, Any] = {
-        "replicaCount": 2,
-        "image": {
-            "tag": "latest",
-            "pullPolicy": "Always",
-        },
+        "replicaCount": DEFAULT_REPLICAS["governance-service"],
+        "image": image_values(config, "governance-service"),
     }
+    section.update(service_sizing_values(config, "governance-service"))
 
     if config.enable_ingress:
-        section["ingress"] = {
-            "enabled": True,
-            "className": "nginx",
-            "annotations": {
-                "cert-manager.io/issuer": "letsencrypt-prod",
-                "nginx.ingress.kubernetes.io/use-regex": "true",
-                "nginx.ingress.kubernetes.io/rewrite-target": "/$2",
-                "nginx.ingress.kubernetes.io/proxy-body-size": "64m",
-            },
-            "hosts": [
-                {
-                    "host": config.domain,
-                    "paths": [
-                        {
-                            "path": "/governanceService(/|$)(.*)",
-                            "pathType": "ImplementationSpecific",
-                        }
-                    ],
-                }
-            ],
-            "tls": [
-                {
-                    "secretName": f"{config.environment}-tls-secret",
-                    "hosts": [config.domain],
-                }
-            ],
-        }
+        section["ingress"] = ingress_values(
+            config, IngressProfile.API, "/governanceService(/|$)(.*)"
+        )
 
     # Application configuration
     section["config"] = {
@@ -75,15 +75,15 @@ def generate_governance_service_section(config: PlatformConfig) -> dict[str, Any
     # Auth provider config
     if config.auth_provider == AuthProvider.AUTH0:
         section["config"]["auth0Domain"] = (
-            config.auth0_domain or "YOUR_AUTH0_DOMAIN.us.auth0.com"
+            config.auth0.domain or "YOUR_AUTH0_DOMAIN.us.auth0.com"
         )
     elif config.auth_provider == AuthProvider.ENTRA:
         section["config"]["entraTenantId"] = (
-            config.entra_tenant_id or "YOUR_ENTRA_TENANT_ID"
+            config.entra.tenant_id or "YOUR_ENTRA_TENANT_ID"
         )
     elif config.auth_provider == AuthProvider.KEYCLOAK:
-        keycloak_url = config.keycloak_url or f"https://{config.domain}/keycloak"
+        keycloak_url = config.keycloak.url or f"https://{config.domain}/keycloak"
         section["config"]["keycloakUrl"] = keycloak_url
-        section["config"]["keycloakRealm"] = config.keycloak_realm
+        section["config"]["keycloakRealm"] = config.keycloak.realm
 
     return section
@@ -2,65 +2,72 @@
 
 from typing import Any
 
+from govctl.core.image_lock import image_depends_on, image_values
 from govctl.core.models import PlatformConfig, AuthProvider
+from govctl.core.sizing import (
+    DEFAULT_REPLICAS,
+    SIZING_DEPENDS_ON,
+    service_sizing_values,
+)
+from govctl.generators.ingress import (
+    INGRESS_DEPENDS_ON,
+    IngressProfile,
+    ingress_values,
+)
+
+
+# PlatformConfig fields read by this generator (used to fingerprint its output)
+DEPENDS_ON: tuple[str, ...] = (
+    *INGRESS_DEPENDS_ON,
+    "auth_provider",
+    "auth0.domain",
+    "auth0.audience",
+    "entra.tenant_id",
+    "entra.client_id",
+    "keycloak.url",
+    "keycloak.realm",
+    image_depends_on("governance-studio"),
+    *SIZING_DEPENDS_ON,
+)
 
 
 def generate_governance_studio_section(config: PlatformConfig) -> dict[str, Any]:
     """Generate the governance-studio section of values.yaml."""
     section: dict[str, Any] = {
-        "replicaCount": 1,
-        "image": {
-            "tag": "latest",
-            "pullPolicy": "Always",
-        },
+        "replicaCount": DEFAULT_REPLICAS["governance-studio"],
+        "image": image_values(config, "governance-studio"),
     }
+    section.update(service_sizing_values(config, "governance-studio"))
 
     if config.enable_ingress:
-        section["ingress"] = {
-            "enabled": True,
-            "className": "nginx",
-            "annotations": {
-                "cert-manager.io/issuer": "letsencrypt-prod",
-                "nginx.ingress.kubernetes.io/proxy-body-size": "64m",
-            },
-            "hosts": [
-                {
-                    "host": config.domain,
-                    "paths": [{"path": "/", "pathType": "Prefix"}],
-                }
-            ],
-            "tls": [
-                {
-                    "secretName": f"{config.environment}-tls-secret",
-                    "hosts": [config.domain],
-                }
-            ],
-        }
+        section["ingress"] = ingress_values(
+            config, IngressProfile.SPA, "/", "Prefix", rewrite=False
+        )
 
     # Auth provider config
     section["config"] = {}
 
     if config.auth_provider == AuthProvider.AUTH0:
-        auth0_domain = config.auth0_domain or "YOUR_AUTH0_DOMAIN.us.auth0.com"
+        auth0_domain = config.auth0.domain or "YOUR_AUTH0_DOMAIN.us.auth0.com"
         section["config"]["authProvider"] = "auth0"
         section["config"]["auth0Domain"] = auth0_domain
         section["config"]["auth0Audience"] = (
-            config.auth0_audience or f"https://{auth0_domain}/api/v2/"
+            config.auth0.audience or f"https://{auth0_domain}/api/v2/"
         )
         section["config"]["auth0ClientId"] = "YOUR_AUTH0_SPA_CLIENT_ID"
     elif config.auth_provider == AuthProvider.ENTRA:
-        tenant_id = config.entra_tenant_id or "YOUR_ENTRA_TENANT_ID"
+        tenant_id = config.entra.tenant_id or "YOUR_ENTRA_TENANT_ID"
         section["config"]["authProvider"] = "entra"
         section["config"]["entraClientId"] = (
-            config.entra_client_id or "YOUR_ENTRA_CLIENT_ID"
+            config.entra.client_id or "YOUR_ENTRA_CLIENT_ID"
         )
         section["config"]["entraTenantId"] = tenant_id
         section["config"]["entraScopes"] = "openid profile email offline_access api://<backend-client-id>/access_as_user"  # Replace <backend-client-id> with backend app registration ID
     elif config.auth_provider == AuthProvider.KEYCLOAK:
-        keycloak_url = config.keycloak_url or f"https://{config.domain}/keycloak"
+        keycloak_url = config.keycloak.url or f"https://{config.domain}/keycloak"
         section["config"]["authProvider"] = "keycloak"
         section["config"]["keycloakUrl"] = keycloak_url
-        section["config"]["keycloakRealm"] = config.keycloak_realm
+        section["config"]["keycloakRealm"] = config.keycloak.realm
         section["config"]["keycloakClientId"] = "governance-platform-frontend"
 
     # Application settings
@@ -2,47 +2,42 @@
 
 from typing import Any
 
+from govctl.core.image_lock import image_depends_on, image_values
 from govctl.core.models import PlatformConfig, CloudProvider
+from govctl.core.sizing import (
+    DEFAULT_REPLICAS,
+    SIZING_DEPENDS_ON,
+    service_sizing_values,
+)
+from govctl.generators.ingress import (
+    INGRESS_DEPENDS_ON,
+    IngressProfile,
+    ingress_values,
+)
+
+# PlatformConfig fields read by this generator (used to fingerprint its output)
+DEPENDS_ON: tuple[str, ...] = (
+    *INGRESS_DEPENDS_ON,
+    "cloud_provider",
+    "cloud_region",
+    "aws_s3_use_iam_role",
+    image_depends_on("integrity-service"),
+    *SIZING_DEPENDS_ON,
+)
 
 
 def generate_integrity_service_section(config: PlatformConfig) -> dict[str, Any]:
     """Generate the integrity-service section of values.yaml."""
     section: dict[str, Any] = {
-        "replicaCount": 2,
-        "image": {
-            "tag": "latest",
-            "pullPolicy": "Always",
-        },
+        "replicaCount": DEFAULT_REPLICAS["integrity-service"],
+        "image": image_values(config, "integrity-service"),
     }
+    section.update(service_sizing_values(config, "integrity-service"))
 
     if config.enable_ingress:
-        section["ingress"] = {
-            "enabled": True,
-            "className": "nginx",
-            "annotations": {
-                "cert-manager.io/issuer": "letsencrypt-prod",
-                "nginx.ingress.kubernetes.io/use-regex": "true",
-                "nginx.ingress.kubernetes.io/rewrite-target": "/$2",
-                "nginx.ingress.kubernetes.io/proxy-body-size": "0",
-            },
-            "hosts": [
-                {
-                    "host": config.domain,
-                    "paths": [
-                        {
-                            "path": "/integrityService(/|$)(.*)",
-                            "pathType": "ImplementationSpecific",
-                        }
-                    ],
-                }
-            ],
-            "tls": [
-                {
-                    "secretName": f"{config.environment}-tls-secret",
-                    "hosts": [config.domain],
-                }
-            ],
-        }
+        section["ingress"] = ingress_values(
+            config, IngressProfile.UPLOAD, "/integrityService(/|$)(.*)"
+        )
 
     # Persistence
     section["persistence"] = {"enabled": True}
@@ -4,12 +4,18 @@ from typing import Any
 
 from govctl.core.models import PlatformConfig
 
+# PlatformConfig fields read by this generator (used to fingerprint its output)
+DEPENDS_ON: tuple[str, ...] = (
+    "domain",
+    "keycloak.realm",
+)
+
 
 def generate_keycloak_section(config: PlatformConfig) -> dict[str, Any]:
     """Generate the keycloak post-install hook section of values.yaml."""
     return {
         "createOrganization": True,
-        "realmName": config.keycloak_realm,
+        "realmName": config.keycloak.realm,
         "displayName": "Governance Platform",
         "createPlatformAdmin": True,
         "platformAdminEmail": f"admin@{config.domain}",
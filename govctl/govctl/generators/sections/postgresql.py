@@ -1,8 +1,37 @@
 """PostgreSQL section generator."""
 
+import copy
 from typing import Any
 
+from govctl.core.image_lock import image_depends_on, image_values
 from govctl.core.models import DatabaseMode, PlatformConfig
+from govctl.core.pg_tuning import (
+    PG_TUNING_DEPENDS_ON,
+    postgresql_tuning,
+    server_max_connections,
+)
+from govctl.core.pooling import (
+    MAX_PREPARED_STATEMENTS,
+    POOLER_PORT,
+    POOLER_REPLICAS,
+    pool_settings,
+)
+from govctl.core.sizing import postgresql_sizing
+from govctl.utils.yaml import _LiteralStr
+
+# PlatformConfig fields read by this generator (used to fingerprint its output)
+DEPENDS_ON: tuple[str, ...] = (
+    *PG_TUNING_DEPENDS_ON,
+    "postgresql_read_replicas",
+    image_depends_on("postgresql"),
+)
+
+# PlatformConfig fields read by the pgbouncer generator: those of the pooling
+# rules, and of the tuned max_connections that bounds the pools
+PGBOUNCER_DEPENDS_ON: tuple[str, ...] = (
+    *PG_TUNING_DEPENDS_ON,
+    image_depends_on("pgbouncer"),
+)
 
 
 def generate_postgresql_section(config: PlatformConfig) -> dict[str, Any]:
@@ -10,7 +39,7 @@ def generate_postgresql_section(config: PlatformConfig) -> dict[str, Any]:
     if config.database_mode == DatabaseMode.EXTERNAL:
         return {"enabled": False}
 
-    return {
+    section: dict[str, Any] = {
         "enabled": True,
         "primary": {
             "persistence": {
@@ -29,3 +58,81 @@ def generate_postgresql_section(config: PlatformConfig) -> dict[str, Any]:
             },
         },
     }
+
+    if config.images.enabled:
+        # Read replicas run the same image; unpinned, the chart's tag is used
+        section["image"] = image_values(config, "postgresql", registry=True)
+
+    sizing = postgresql_sizing(config)
+    if sizing is not None:
+        resources, storage_gb = sizing
+        section["primary"]["persistence"]["size"] = f"{storage_gb}Gi"
+        section["primary"]["resources"] = resources.to_values()
+
+    # Appended to Bitnami's postgresql.conf (see core/pg_tuning.py)
+    tuning = postgresql_tuning(config)
+    section["primary"]["extendedConfiguration"] = _LiteralStr(tuning.to_conf())
+
+    if config.postgresql_read_replicas:
+        # Replicas mirror the primary, settings included: a hot standby
+        # needs at least its max_connections and worker counts
+        primary = section["primary"]
+        section["architecture"] = "replication"
+        section["readReplicas"] = {
+            "replicaCount": config.postgresql_read_replicas,
+            **copy.deepcopy(
+                {
+                    key: primary[key]
+                    for key in ("persistence", "resources", "extendedConfiguration")
+                }
+            ),
+        }
+        # The replication user shares the admin password of the
+        # platform-database Secret, which has no replication-password key
+        section["global"] = {
+            "postgresql": {
+                "auth": {"secretKeys": {"replicationPasswordKey": "password"}}
+            }
+        }
+
+    return section
+
+
+def generate_pgbouncer_section(config: PlatformConfig) -> dict[str, Any]:
+    """Generate the pgbouncer section of values.yaml (only with a pooler)."""
+    settings = pool_settings(config, server_max_connections(config))
+    if settings is None:
+        return {"enabled": False}
+
+    section: dict[str, Any] = {
+        "enabled": True,
+        "replicaCount": POOLER_REPLICAS,
+        "port": POOLER_PORT,
+        "poolMode": settings.pool_mode,
+        "defaultPoolSize": settings.default_pool_size,
+        "maxDbConnections": settings.default_pool_size,
+        "maxClientConn": settings.max_client_conn,
+        "maxPreparedStatements": (
+            MAX_PREPARED_STATEMENTS if settings.pool_mode == "transaction" else 0
+        ),
+    }
+
+    if config.images.enabled:
+        section["image"] = image_values(config, "pgbouncer", registry=True)
+
+    if config.database_mode == DatabaseMode.EXTERNAL:
+        # The pooler holds the TLS connection to the managed instance, so the
+        # upstream host and CA go here rather than in global.postgresql. See
+        # charts/governance-platform/README.md (Cloud-Managed PostgreSQL
+        # Configuration) for provider-specific notes.
+        section["upstream"] = {
+            "host": "TODO-set-managed-pg-host.example.com",
+            "port": 5432,
+            "tls": {
+                "sslMode": "verify-full",
+                "caSecret": "postgres-ca",
+                "caKey": "ca.crt",
+            },
+        }
+
+    return section
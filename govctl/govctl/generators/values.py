@@ -1,9 +1,29 @@
 """Values.yaml generator."""
 
-from typing import Any
+import io
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from operator import attrgetter
+from typing import Any, Callable, NamedTuple, TextIO
 
+from govctl.core.chart_index import UMBRELLA_CHART, report, validate
 from govctl.core.models import AuthProvider, DatabaseMode, PlatformConfig
-from govctl.utils.yaml import dump_yaml_with_header, dump_yaml_sections
+from govctl.core.pooling import POOLER_PORT, pooler_host
+from govctl.utils.profiling import phase
+from govctl.utils.yaml import dump_yaml_section
+from govctl.generators.sections import (
+    auth0,
+    auth_service,
+    entra,
+    eqty_pdfgen,
+    gateway_stack,
+    governance_service,
+    governance_studio,
+    integrity_service,
+    keycloak,
+    postgresql,
+)
 from govctl.generators.sections.auth_service import generate_auth_service_section
 from govctl.generators.sections.eqty_pdfgen import generate_eqty_pdfgen_section
 from govctl.generators.sections.gateway_stack import generate_gateway_stack_section
@@ -16,14 +36,33 @@ from govctl.generators.sections.governance_studio import (
 from govctl.generators.sections.integrity_service import (
     generate_integrity_service_section,
 )
-from govctl.generators.sections.postgresql import generate_postgresql_section
+from govctl.generators.sections.postgresql import (
+    generate_pgbouncer_section,
+    generate_postgresql_section,
+)
 from govctl.generators.sections.keycloak import generate_keycloak_section
 from govctl.generators.sections.entra import generate_entra_section
 from govctl.generators.sections.auth0 import generate_auth0_section
 
+# PlatformConfig fields read by the global section (used to fingerprint its output)
+GLOBAL_DEPENDS_ON: tuple[str, ...] = (
+    "environment",
+    "domain",
+    "database_mode",
+    "enable_pgbouncer",
+    "release_name",
+)
+
 
 def generate_values(config: PlatformConfig) -> str:
     """Generate values.yaml content based on configuration."""
+    stream = io.StringIO()
+    write_values(config, stream)
+    return stream.getvalue()
+
+
+def write_values(config: PlatformConfig, stream: TextIO) -> None:
+    """Write values.yaml content to a text stream, one section at a time."""
     header = f"""# =============================================================================
 # Governance Platform - VALUES FILE
 # =============================================================================
@@ -36,86 +75,22 @@ def generate_values(config: PlatformConfig) -> str:
 #
 """
 
-    sections: list[tuple[str, str, str, dict[str, Any]]] = [
-        (
-            "global",
-            "Global Configuration",
-            "Shared configuration values used across all services.",
-            _generate_global_section(config),
-        ),
-        (
-            "auth-service",
-            "Auth Service",
-            "Override values for the auth-service Helm chart.",
-            generate_auth_service_section(config),
-        ),
-        (
-            "eqty-pdfgen",
-            "EQTY PDFGen",
-            "Override values for the eqty-pdfgen Helm chart.",
-            generate_eqty_pdfgen_section(config),
-        ),
-        (
-            "gateway-stack",
-            "Gateway Stack",
-            "Override values for the gateway-stack Helm chart.",
-            generate_gateway_stack_section(config),
-        ),
-        (
-            "governance-service",
-            "Governance Service",
-            "Override values for the governance-service Helm chart.",
-            generate_governance_service_section(config),
-        ),
-        (
-            "governance-studio",
-            "Governance Studio",
-            "Override values for the governance-studio Helm chart.",
-            generate_governance_studio_section(config),
-        ),
-        (
-            "integrity-service",
-            "Integrity Service",
-            "Override values for the integrity-service Helm chart.",
-            generate_integrity_service_section(config),
-        ),
-        (
-            "postgresql",
-            "PostgreSQL",
-            "Override values for the postgresql Helm chart.",
-            generate_postgresql_section(config),
-        ),
-    ]
-
-    if config.auth_provider == AuthProvider.AUTH0:
-        sections.append(
-            (
-                "auth0",
-                "Auth0",
-                "Post-install organization and admin-user setup for Auth0.",
-                generate_auth0_section(config),
-            )
-        )
-    elif config.auth_provider == AuthProvider.ENTRA:
-        sections.append(
-            (
-                "entra",
-                "Entra",
-                "Override values for the entra Helm chart.",
-                generate_entra_section(config),
-            )
-        )
-    elif config.auth_provider == AuthProvider.KEYCLOAK:
-        sections.append(
-            (
-                "keycloak",
-                "Keycloak",
-                "Override values for the keycloak Helm chart.",
-                generate_keycloak_section(config),
-            )
-        )
+    stream.write(header)
+    for index, section in enumerate(sections_for(config)):
+        if index:
+            stream.write("\n")
+        stream.write(_render_section(section, config))
+
 
-    return header + dump_yaml_sections(sections)
+@dataclass(frozen=True)
+class Section:
+    """A top-level values.yaml section and the config fields it depends on."""
+
+    key: str
+    title: str
+    description: str
+    generate: Callable[[PlatformConfig], dict[str, Any]]
+    depends_on: tuple[str, ...]
 
 
 def _generate_global_section(config: PlatformConfig) -> dict[str, Any]:
@@ -125,7 +100,19 @@ def _generate_global_section(config: PlatformConfig) -> dict[str, Any]:
         "domain": config.domain,
     }
 
-    if config.database_mode == DatabaseMode.EXTERNAL:
+    if config.enable_pgbouncer:
+        # Every client connects to the pooler, which connects to PostgreSQL
+        # (bundled, or the managed instance set in pgbouncer.upstream).
+        # In-cluster traffic to the pooler is not encrypted; the pooler
+        # holds the TLS connection to a managed instance.
+        section["postgresql"] = {
+            "host": pooler_host(config),
+            "port": POOLER_PORT,
+            "database": "governance",
+            "username": "postgres",
+            "sslMode": "disable",
+        }
+    elif config.database_mode == DatabaseMode.EXTERNAL:
         # Placeholders for cloud-managed PostgreSQL.
         # See charts/governance-platform/examples/values-external-postgres.yaml
         # and charts/governance-platform/README.md (Cloud-Managed PostgreSQL Configuration)
@@ -143,3 +130,181 @@ def _generate_global_section(config: PlatformConfig) -> dict[str, Any]:
         }
 
     return section
+
+
+# Sections written for every configuration, in file order
+SECTIONS: tuple[Section, ...] = (
+    Section(
+        "global",
+        "Global Configuration",
+        "Shared configuration values used across all services.",
+        _generate_global_section,
+        GLOBAL_DEPENDS_ON,
+    ),
+    Section(
+        "auth-service",
+        "Auth Service",
+        "Override values for the auth-service Helm chart.",
+        generate_auth_service_section,
+        auth_service.DEPENDS_ON,
+    ),
+    Section(
+        "eqty-pdfgen",
+        "EQTY PDFGen",
+        "Override values for the eqty-pdfgen Helm chart.",
+        generate_eqty_pdfgen_section,
+        eqty_pdfgen.DEPENDS_ON,
+    ),
+    Section(
+        "gateway-stack",
+        "Gateway Stack",
+        "Override values for the gateway-stack Helm chart.",
+        generate_gateway_stack_section,
+        gateway_stack.DEPENDS_ON,
+    ),
+    Section(
+        "governance-service",
+        "Governance Service",
+        "Override values for the governance-service Helm chart.",
+        generate_governance_service_section,
+        governance_service.DEPENDS_ON,
+    ),
+    Section(
+        "governance-studio",
+        "Governance Studio",
+        "Override values for the governance-studio Helm chart.",
+        generate_governance_studio_section,
+        governance_studio.DEPENDS_ON,
+    ),
+    Section(
+        "integrity-service",
+        "Integrity Service",
+        "Override values for the integrity-service Helm chart.",
+        generate_integrity_service_section,
+        integrity_service.DEPENDS_ON,
+    ),
+    Section(
+        "postgresql",
+        "PostgreSQL",
+        "Override values for the postgresql Helm chart.",
+        generate_postgresql_section,
+        postgresql.DEPENDS_ON,
+    ),
+)
+
+# Section written after SECTIONS when the PgBouncer pooler is enabled
+PGBOUNCER_SECTION = Section(
+    "pgbouncer",
+    "PgBouncer",
+    "Connection pooler in front of PostgreSQL, sized from the services' replicas.",
+    generate_pgbouncer_section,
+    postgresql.PGBOUNCER_DEPENDS_ON,
+)
+
+# Section written last for the configured auth provider
+AUTH_SECTIONS: dict[AuthProvider, Section] = {
+    AuthProvider.AUTH0: Section(
+        "auth0",
+        "Auth0",
+        "Post-install organization and admin-user setup for Auth0.",
+        generate_auth0_section,
+        auth0.DEPENDS_ON,
+    ),
+    AuthProvider.ENTRA: Section(
+        "entra",
+        "Entra",
+        "Override values for the entra Helm chart.",
+        generate_entra_section,
+        entra.DEPENDS_ON,
+    ),
+    AuthProvider.KEYCLOAK: Section(
+        "keycloak",
+        "Keycloak",
+        "Override values for the keycloak Helm chart.",
+        generate_keycloak_section,
+        keycloak.DEPENDS_ON,
+    ),
+}
+
+
+def sections_for(config: PlatformConfig) -> list[Section]:
+    """The values.yaml sections for a configuration, in file order."""
+    sections = list(SECTIONS)
+    if config.enable_pgbouncer:
+        sections.append(PGBOUNCER_SECTION)
+    if config.auth_provider in AUTH_SECTIONS:
+        sections.append(AUTH_SECTIONS[config.auth_provider])
+    return sections
+
+
+# Rendered section fragments, keyed by section and the values of the fields
+# it depends on. Similar environments (e.g. fleet tenants that only differ in
+# domain) share most fragments, so they are only built, checked against the
+# chart and dumped once; the problems found are kept with the fragment.
+FRAGMENT_CACHE_SIZE = 1024
+
+_fragment_cache: OrderedDict[tuple[Any, ...], tuple[str, list[str]]] = OrderedDict()
+_fragment_cache_lock = threading.Lock()
+_fragment_cache_hits = 0
+_fragment_cache_misses = 0
+
+
+class FragmentCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+def fragment_cache_info() -> FragmentCacheInfo:
+    """Hit/miss statistics of the section fragment cache, like lru_cache's."""
+    with _fragment_cache_lock:
+        return FragmentCacheInfo(
+            _fragment_cache_hits,
+            _fragment_cache_misses,
+            FRAGMENT_CACHE_SIZE,
+            len(_fragment_cache),
+        )
+
+
+def fragment_cache_clear() -> None:
+    """Empty the section fragment cache and reset its statistics."""
+    global _fragment_cache_hits, _fragment_cache_misses
+    with _fragment_cache_lock:
+        _fragment_cache.clear()
+        _fragment_cache_hits = _fragment_cache_misses = 0
+
+
+def _render_section(section: Section, config: PlatformConfig) -> str:
+    """Render a section with its comment header, reusing a cached fragment."""
+    global _fragment_cache_hits, _fragment_cache_misses
+    cache_key = (
+        section.key,
+        *(attrgetter(name)(config) for name in section.depends_on),
+    )
+    with _fragment_cache_lock:
+        cached = _fragment_cache.get(cache_key)
+        if cached is None:
+            _fragment_cache_misses += 1
+        else:
+            _fragment_cache.move_to_end(cache_key)
+            _fragment_cache_hits += 1
+    if cached is not None:
+        fragment, problems = cached
+        report(problems)
+        return fragment
+
+    with phase(f"build {section.key}"):
+        data = section.generate(config)
+    with phase(f"check {section.key}"):
+        problems = validate(UMBRELLA_CHART, {section.key: data})
+    with phase(f"emit {section.key}"):
+        fragment = dump_yaml_section(
+            section.key, section.title, section.description, data
+        )
+
+    with _fragment_cache_lock:
+        _fragment_cache[cache_key] = (fragment, problems)
+        if len(_fragment_cache) > FRAGMENT_CACHE_SIZE:
+            _fragment_cache.popitem(last=False)
+    return fragment
@@ -0,0 +1,75 @@
+"""Compare values files on disk against what this govctl would generate."""
+
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Iterator
+
+import yaml
+
+from govctl.core.manifest import FleetEntry, config_from_dict
+from govctl.core.models import PlatformConfig
+from govctl.core.tree_diff import Change, diff_trees
+from govctl.generators.values import generate_values
+from govctl.utils.yaml import _FastLoader
+
+
+@dataclass
+class DiffResult:
+    """Structural differences between one values file and a fresh generation."""
+
+    name: str
+    path: Path
+    seconds: float = 0.0
+    changes: list[Change] = field(default_factory=list)
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def values_path(config: PlatformConfig, output_dir: Path) -> Path:
+    """Where `govctl init` writes the values file for a configuration."""
+    return output_dir / f"values-{config.environment}.yaml"
+
+
+def diff_values(config: PlatformConfig, path: Path, name: str = "") -> DiffResult:
+    """Diff a values file against the values generated for ``config``.
+
+    Regenerates in memory; nothing is written. A missing or unparseable file
+    is reported as the result's error.
+    """
+    start = time.perf_counter()
+    result = DiffResult(name=name or config.environment, path=path)
+    try:
+        with open(path) as f:
+            existing = yaml.load(f, Loader=_FastLoader)
+    except (OSError, yaml.YAMLError) as e:
+        result.error = f"Cannot read {path}: {e}"
+    else:
+        generated = yaml.load(generate_values(config), Loader=_FastLoader)
+        result.changes = diff_trees(existing, generated)
+    result.seconds = time.perf_counter() - start
+    return result
+
+
+def diff_fleet(entries: Iterable[FleetEntry], output_dir: Path) -> Iterator[DiffResult]:
+    """Diff every fleet environment's values file, in manifest order.
+
+    Files are read from ``<output_dir>/<name>/``, as written by `govctl
+    fleet`. Environments run one after another in this process: values
+    generation is cheap, and the section cache is then shared by the whole
+    fleet. Invalid entries are reported in their result rather than raised.
+    """
+    for entry in entries:
+        try:
+            config = config_from_dict(entry.data)
+        except ValueError as e:
+            yield DiffResult(
+                name=entry.name, path=output_dir / entry.name, error=str(e)
+            )
+            continue
+        yield diff_values(
+            config, values_path(config, output_dir / entry.name), entry.name
+        )
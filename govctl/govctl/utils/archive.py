@@ -0,0 +1,98 @@
+"""Reproducible tar and zip archives of generated files.
+
+Archives are written to a binary stream one file at a time, in the order the
+files are added, so they can go straight to stdout. Every entry gets the same
+fixed timestamp, owner and permissions, so the same files always produce a
+byte-identical archive. The timestamp is ``$SOURCE_DATE_EPOCH`` if set, as
+for other reproducible build tools, and otherwise the earliest one the format
+can hold.
+"""
+
+import io
+import os
+import tarfile
+import time
+import zipfile
+from typing import BinaryIO
+
+ARCHIVE_FORMATS = ("tar", "zip")
+
+# Permissions of every archived file
+FILE_MODE = 0o644
+
+# Zip timestamps are DOS dates, which start in 1980
+_ZIP_EPOCH = 315532800  # 1980-01-01T00:00:00Z
+
+
+def archive_mtime(format: str) -> int:
+    """The timestamp given to every entry of an archive, in Unix time."""
+    floor = _ZIP_EPOCH if format == "zip" else 0
+    epoch = os.environ.get("SOURCE_DATE_EPOCH")
+    if epoch:
+        try:
+            return max(int(epoch), floor)
+        except ValueError:
+            raise ValueError(
+                f"SOURCE_DATE_EPOCH must be an integer, not {epoch!r}"
+            ) from None
+    return floor
+
+
+class Archive:
+    """Writes files into a tar or zip archive on a binary stream.
+
+    Use as a context manager, or call ``close()`` to finish the archive; the
+    stream itself is left open.
+    """
+
+    def __init__(self, format: str, stream: BinaryIO):
+        if format not in ARCHIVE_FORMATS:
+            raise ValueError(f"Unknown archive format: {format}")
+        self.format = format
+        self.mtime = archive_mtime(format)
+        # Names of the files added so far, in order
+        self.names: list[str] = []
+        self._seen: set[str] = set()
+        if format == "tar":
+            # Stream mode: no seeking, so stdout and pipes work
+            self._tar = tarfile.open(
+                fileobj=stream, mode="w|", format=tarfile.PAX_FORMAT
+            )
+        else:
+            self._zip = zipfile.ZipFile(stream, "w", zipfile.ZIP_DEFLATED)
+
+    def add(self, name: str, content: str | bytes) -> None:
+        """Add a file with the given content (text is UTF-8 encoded).
+
+        Raises:
+            ValueError: If a file of that name was already added.
+        """
+        if name in self._seen:
+            raise ValueError(f"Duplicate archive entry: {name}")
+        self._seen.add(name)
+        self.names.append(name)
+        data = content.encode() if isinstance(content, str) else content
+        if self.format == "tar":
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            info.mtime = self.mtime
+            info.mode = FILE_MODE
+            self._tar.addfile(info, io.BytesIO(data))
+        else:
+            info = zipfile.ZipInfo(name, time.gmtime(self.mtime)[:6])
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.create_system = 3  # Unix, whatever platform wrote it
+            info.external_attr = (0o100000 | FILE_MODE) << 16
+            self._zip.writestr(info, data)
+
+    def close(self) -> None:
+        if self.format == "tar":
+            self._tar.close()
+        else:
+            self._zip.close()
+
+    def __enter__(self) -> "Archive":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
@@ -0,0 +1,32 @@
+"""On-disk cache locations for govctl."""
+
+import os
+from pathlib import Path
+
+
+def cache_dir(name: str) -> Path:
+    """Directory for one kind of cached data, created if needed.
+
+    Lives under ``$GOVCTL_CACHE_DIR`` if set, else ``$XDG_CACHE_HOME/govctl``
+    (``~/.cache/govctl`` by default).
+    """
+    root = os.environ.get("GOVCTL_CACHE_DIR")
+    if not root:
+        xdg = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+        root = Path(xdg) / "govctl"
+    path = Path(root) / name
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def write_atomic(path: Path, content: bytes) -> None:
+    """Write a cache file so that concurrent readers never see it half written.
+
+    Errors are ignored: the caches are an optimisation only.
+    """
+    tmp = path.with_name(f".{path.name}.{os.getpid()}")
+    try:
+        tmp.write_bytes(content)
+        os.replace(tmp, path)
+    except OSError:
+        tmp.unlink(missing_ok=True)
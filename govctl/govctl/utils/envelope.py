@@ -0,0 +1,271 @@
+"""Envelope encryption of generated secrets files.
+
+Files are encrypted with AES-256-GCM under a data key that is generated once
+per run (one ``govctl init`` or ``govctl fleet``) and wrapped with the
+recipient's RSA public key (RSA-OAEP with SHA-256). Wrapping is the only
+public-key operation, so encrypting a whole fleet costs one RSA operation
+plus AES over each file, and decrypting it one RSA operation plus AES, as
+every file of the run carries the same wrapped key.
+
+An encrypted file (``<name>.enc``) is laid out as::
+
+    MAGIC | key id (8) | wrapped key length (2) | wrapped key | nonce (12)
+    | ciphertext | tag (16)
+
+where the key id is the start of the SHA-256 of the recipient public key, so
+that decrypting with the wrong private key gives a clear error. Everything
+before the ciphertext is authenticated along with it. Each file has its own
+random nonce.
+"""
+
+import hashlib
+import io
+import os
+import struct
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, BinaryIO, TextIO
+
+MAGIC = b"govctl-envelope-v1\n"
+
+# Suffix of encrypted files
+ENCRYPTED_SUFFIX = ".enc"
+
+# Plaintext is encrypted in chunks of this size as it is written
+CHUNK_SIZE = 64 * 1024
+
+# Smallest RSA key accepted for wrapping data keys
+MIN_RSA_KEY_BITS = 2048
+
+_KEY_ID_SIZE = 8
+_NONCE_SIZE = 12
+_TAG_SIZE = 16
+
+
+class EnvelopeError(ValueError):
+    """An encrypted file or key could not be used."""
+
+
+def _oaep() -> Any:
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.asymmetric import padding
+
+    return padding.OAEP(
+        mgf=padding.MGF1(algorithm=hashes.SHA256()),
+        algorithm=hashes.SHA256(),
+        label=None,
+    )
+
+
+def _key_id(public_key: Any) -> bytes:
+    from cryptography.hazmat.primitives import serialization
+
+    der = public_key.public_bytes(
+        serialization.Encoding.DER,
+        serialization.PublicFormat.SubjectPublicKeyInfo,
+    )
+    return hashlib.sha256(der).digest()[:_KEY_ID_SIZE]
+
+
+def load_public_key(path: str | Path) -> Any:
+    """Load a recipient RSA public key (PEM), e.g. from ``openssl pkey -pubout``.
+
+    Raises:
+        EnvelopeError: If the file is not an RSA public key of at least 2048 bits.
+    """
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import rsa
+
+    try:
+        key = serialization.load_pem_public_key(Path(path).read_bytes())
+    except ValueError:
+        raise EnvelopeError(f"{path} is not a PEM public key") from None
+    if not isinstance(key, rsa.RSAPublicKey):
+        raise EnvelopeError(f"{path} is not an RSA public key")
+    if key.key_size < MIN_RSA_KEY_BITS:
+        raise EnvelopeError(
+            f"{path} is a {key.key_size}-bit key; use at least {MIN_RSA_KEY_BITS} bits"
+        )
+    return key
+
+
+def load_private_key(path: str | Path, password: bytes | None = None) -> Any:
+    """Load the recipient RSA private key (PEM).
+
+    Raises:
+        EnvelopeError: If the file is not an RSA private key, or the password
+            is missing or wrong.
+        TypeError: If the key is encrypted and no password was given.
+    """
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import rsa
+
+    try:
+        key = serialization.load_pem_private_key(
+            Path(path).read_bytes(), password=password
+        )
+    except ValueError:
+        raise EnvelopeError(
+            f"{path} is not a PEM private key, or the password is wrong"
+        ) from None
+    if not isinstance(key, rsa.RSAPrivateKey):
+        raise EnvelopeError(f"{path} is not an RSA private key")
+    return key
+
+
+@dataclass(frozen=True)
+class DataKey:
+    """An AES-256 data key and its wrapped form, shared by one run's files.
+
+    Plain bytes, so it can be handed to fleet worker processes. The key is
+    left out of the repr, so that tracebacks and logs do not carry it.
+    """
+
+    key: bytes = field(repr=False)
+    wrapped: bytes
+    key_id: bytes
+
+    @classmethod
+    def create(cls, recipient: Any) -> "DataKey":
+        """Generate a data key and wrap it for a recipient RSA public key."""
+        key = os.urandom(32)
+        return cls(key, recipient.encrypt(key, _oaep()), _key_id(recipient))
+
+    def writer(self, stream: BinaryIO) -> TextIO:
+        """Text stream that encrypts what is written to it into ``stream``.
+
+        The file is complete once the text stream is closed; ``stream`` itself
+        is left open. Used as a context manager, a block that raises leaves
+        the file without its tag, so that a partial file never decrypts.
+        """
+        envelope = EnvelopeWriter(self, stream)
+        return _EnvelopeTextWriter(
+            envelope, io.BufferedWriter(envelope, CHUNK_SIZE), encoding="utf-8"
+        )
+
+    def seal(self, content: str) -> bytes:
+        """Encrypt a whole text file in memory."""
+        stream = io.BytesIO()
+        with self.writer(stream) as f:
+            f.write(content)
+        return stream.getvalue()
+
+
+class EnvelopeWriter(io.RawIOBase):
+    """Binary stream that writes an encrypted file to an underlying stream."""
+
+    def __init__(self, data_key: DataKey, stream: BinaryIO):
+        from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+
+        self._stream = stream
+        self._aborted = False
+        nonce = os.urandom(_NONCE_SIZE)
+        header = b"".join(
+            [
+                MAGIC,
+                data_key.key_id,
+                struct.pack(">H", len(data_key.wrapped)),
+                data_key.wrapped,
+                nonce,
+            ]
+        )
+        self._encryptor = Cipher(
+            algorithms.AES(data_key.key), modes.GCM(nonce)
+        ).encryptor()
+        self._encryptor.authenticate_additional_data(header)
+        stream.write(header)
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        self._stream.write(self._encryptor.update(bytes(data)))
+        return len(data)
+
+    def abort(self) -> None:
+        """Close without writing the tag: the file will not authenticate."""
+        self._aborted = True
+
+    def close(self) -> None:
+        if not self.closed and not self._aborted:
+            self._stream.write(self._encryptor.finalize() + self._encryptor.tag)
+        super().close()
+
+
+class _EnvelopeTextWriter(io.TextIOWrapper):
+    """Text stream over an EnvelopeWriter that aborts it if its block raises."""
+
+    def __init__(self, envelope: EnvelopeWriter, buffer: BinaryIO, **kwargs: Any):
+        super().__init__(buffer, **kwargs)
+        self._envelope = envelope
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        if exc_type is not None:
+            self._envelope.abort()
+        super().__exit__(exc_type, exc, tb)
+
+
+class Decrypter:
+    """Decrypts envelope files for one private key.
+
+    Unwrapped data keys are remembered, so the files of one run (which share
+    a wrapped key) cost a single RSA operation in total.
+    """
+
+    def __init__(self, private_key: Any):
+        self._private_key = private_key
+        self._key_id = _key_id(private_key.public_key())
+        self._data_keys: dict[bytes, bytes] = {}
+
+    def decrypt(self, stream: BinaryIO) -> bytes:
+        """Decrypt an envelope file read from ``stream``.
+
+        The plaintext is only returned once the whole file is authenticated.
+
+        Raises:
+            EnvelopeError: If the file is not an envelope file, is for another
+                key, or was modified.
+        """
+        from cryptography.exceptions import InvalidTag
+        from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+
+        header = _read_exactly(stream, len(MAGIC) + _KEY_ID_SIZE + 2)
+        if not header.startswith(MAGIC):
+            raise EnvelopeError("Not a govctl encrypted file")
+        key_id = header[len(MAGIC) : len(MAGIC) + _KEY_ID_SIZE]
+        if key_id != self._key_id:
+            raise EnvelopeError("Encrypted for a different key")
+        (wrapped_size,) = struct.unpack(">H", header[-2:])
+        wrapped = _read_exactly(stream, wrapped_size)
+        nonce = _read_exactly(stream, _NONCE_SIZE)
+
+        key = self._data_keys.get(wrapped)
+        if key is None:
+            try:
+                key = self._private_key.decrypt(wrapped, _oaep())
+            except ValueError:
+                raise EnvelopeError("Could not unwrap the data key") from None
+            self._data_keys[wrapped] = key
+
+        decryptor = Cipher(algorithms.AES(key), modes.GCM(nonce)).decryptor()
+        decryptor.authenticate_additional_data(header + wrapped + nonce)
+        # Hold back the last bytes read, which may be the tag
+        plaintext, pending = [], b""
+        while chunk := stream.read(CHUNK_SIZE):
+            pending += chunk
+            plaintext.append(decryptor.update(pending[:-_TAG_SIZE]))
+            pending = pending[-_TAG_SIZE:]
+        if len(pending) < _TAG_SIZE:
+            raise EnvelopeError("Truncated encrypted file")
+        try:
+            plaintext.append(decryptor.finalize_with_tag(pending))
+        except InvalidTag:
+            raise EnvelopeError("Encrypted file was modified or corrupted") from None
+        return b"".join(plaintext)
+
+
+def _read_exactly(stream: BinaryIO, size: int) -> bytes:
+    data = stream.read(size)
+    if len(data) != size:
+        raise EnvelopeError("Truncated encrypted file")
+    return data
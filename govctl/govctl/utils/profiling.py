@@ -0,0 +1,119 @@
+"""Timing instrumentation for govctl runs.
+
+Generators wrap their sections and output phases in ``phase(name)``. Outside
+a ``profiling()`` block this returns a shared no-op context manager, so the
+instrumentation costs one global lookup per phase when disabled.
+"""
+
+import cProfile
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, ContextManager, Iterator
+
+_DISABLED = nullcontext()
+
+
+@dataclass
+class PhaseTiming:
+    """Accumulated timing of one phase, identified by its nesting path."""
+
+    path: tuple[str, ...]
+    calls: int = 0
+    seconds: float = 0.0
+
+    @property
+    def name(self) -> str:
+        return self.path[-1]
+
+    @property
+    def depth(self) -> int:
+        return len(self.path) - 1
+
+
+class Profiler:
+    """Collects nested phase timings from any thread."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.stopped: float | None = None
+        self._timings: dict[tuple[str, ...], PhaseTiming] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @property
+    def elapsed(self) -> float:
+        return (self.stopped or time.perf_counter()) - self.started
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the enclosed block, nested under any enclosing phase on this thread."""
+        parent = getattr(self._local, "path", ())
+        path = (*parent, name)
+        self._local.path = path
+        # Registered on entry so that phases are listed in the order first run
+        with self._lock:
+            timing = self._timings.setdefault(path, PhaseTiming(path))
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            self._local.path = parent
+            with self._lock:
+                timing.calls += 1
+                timing.seconds += seconds
+
+    def timings(self) -> list[PhaseTiming]:
+        """Phase timings in the order first run, each parent before its children."""
+        with self._lock:
+            return list(self._timings.values())
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "total_seconds": self.elapsed,
+            "phases": [
+                {
+                    "path": list(timing.path),
+                    "calls": timing.calls,
+                    "seconds": timing.seconds,
+                }
+                for timing in self.timings()
+            ],
+        }
+
+
+_profiler: Profiler | None = None
+
+
+def phase(name: str) -> ContextManager[None]:
+    """Time a block as a named phase when profiling is enabled."""
+    if _profiler is None:
+        return _DISABLED
+    return _profiler.phase(name)
+
+
+@contextmanager
+def profiling(pstats_path: Path | None = None) -> Iterator[Profiler]:
+    """Enable phase timing for the enclosed block.
+
+    Args:
+        pstats_path: If given, also run cProfile over the block and dump its
+            stats there, for analysis with ``python -m pstats``.
+    """
+    global _profiler
+    profiler = Profiler()
+    previous, _profiler = _profiler, profiler
+    cprofile = cProfile.Profile() if pstats_path else None
+    if cprofile:
+        cprofile.enable()
+    try:
+        yield profiler
+    finally:
+        if cprofile:
+            cprofile.disable()
+            cprofile.dump_stats(pstats_path)
+        profiler.stopped = time.perf_counter()
+        _profiler = previous
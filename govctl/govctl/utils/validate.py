@@ -83,3 +83,9 @@ def is_valid_gcp_key_ring_id(key_ring_id: str) -> bool:
 def is_valid_email(email: str) -> bool:
     """Check if a string is a basic valid email format."""
     return bool(re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$").match(email))
+
+
+# Fleet environment name: used as a directory name, so no path separators
+def is_valid_environment_name(name: str) -> bool:
+    """Check if a string is a valid fleet environment name."""
+    return bool(re.compile(r"^[a-zA-Z0-9][a-zA-Z0-9._-]*$").match(name))
@@ -1,28 +1,109 @@
 """YAML utilities for govctl."""
 
-from typing import Any
+import io
+from typing import Any, Iterable, TextIO
 
 import yaml
 
 from govctl.core.models import PlatformConfig
+from govctl.utils.profiling import phase
+
+# PlatformConfig fields read by the file headers (used to fingerprint outputs)
+HEADER_DEPENDS_ON: tuple[str, ...] = (
+    "cloud_provider",
+    "auth_provider",
+    "environment",
+    "domain",
+)
 
 
 class _LiteralStr(str):
     """String subclass that signals literal block style in YAML."""
 
 
+class _RequiredStr(str):
+    """String subclass for a value the user must fill in.
+
+    Emitted as an empty value followed by a ``# REQUIRED: <comment>`` line
+    comment, where the string itself is the comment. Only ``_CommentDumper``
+    can emit these.
+    """
+
+
+_REQUIRED_TAG = "tag:govctl,2025:required"
+
+
 def _literal_representer(dumper: yaml.Dumper, data: str) -> yaml.ScalarNode:
     """Represent multiline strings using literal block style (|)."""
-    return dumper.represent_scalar("tag:yaml.org,2002:str", data, style="|")
+    # The C emitter only accepts exact str instances
+    return dumper.represent_scalar("tag:yaml.org,2002:str", str(data), style="|")
 
 
-yaml.add_representer(_LiteralStr, _literal_representer)
+def _required_representer(dumper: yaml.Dumper, data: str) -> yaml.ScalarNode:
+    """Tag required values so the emitter can replace them with a comment."""
+    return dumper.represent_scalar(_REQUIRED_TAG, str(data))
 
 
-def dump_yaml(data: dict[str, Any], width: int = 120) -> str:
-    """Dump data to YAML string."""
-    return yaml.dump(
+# libyaml's C emitter when PyYAML was built against it; its output is
+# identical to the pure-Python emitter for everything govctl generates.
+_FastDumper = yaml.CDumper if yaml.__with_libyaml__ else yaml.Dumper
+_FastLoader = yaml.CSafeLoader if yaml.__with_libyaml__ else yaml.SafeLoader
+
+
+class _NoAliasDumper(_FastDumper):
+    """Fast dumper that writes shared objects out in full instead of as aliases.
+
+    Used for data merged from several sources, where the same dict can be
+    reachable from more than one place.
+    """
+
+    def ignore_aliases(self, data: Any) -> bool:
+        return True
+
+
+class _CommentDumper(yaml.Dumper):
+    """Pure-Python dumper that writes ``# REQUIRED:`` comments as it emits.
+
+    The C emitter has no hook for comments, so files containing required
+    values go through this dumper instead.
+    """
+
+    def process_tag(self) -> None:
+        if isinstance(self.event, yaml.ScalarEvent) and self.event.tag == _REQUIRED_TAG:
+            self.prepared_tag = None
+            return
+        super().process_tag()
+
+    def process_scalar(self) -> None:
+        if self.event.tag != _REQUIRED_TAG:
+            super().process_scalar()
+            return
+        self.write_indicator("''", True)
+        self.write_indicator(f"  # REQUIRED: {self.event.value}", False)
+        self.analysis = None
+        self.style = None
+
+
+for _dumper in {_FastDumper, _CommentDumper}:
+    _dumper.add_representer(_LiteralStr, _literal_representer)
+_CommentDumper.add_representer(_RequiredStr, _required_representer)
+
+
+def write_yaml(
+    data: dict[str, Any],
+    stream: TextIO,
+    width: int = 120,
+    dumper: type | None = None,
+) -> None:
+    """Dump data as YAML to a text stream.
+
+    Uses the fastest available dumper unless one is given; pass
+    ``dumper=_CommentDumper`` when the data contains ``_RequiredStr`` values.
+    """
+    yaml.dump(
         data,
+        stream,
+        Dumper=dumper or _FastDumper,
         default_flow_style=False,
         sort_keys=False,
         allow_unicode=True,
@@ -30,6 +111,17 @@ def dump_yaml(data: dict[str, Any], width: int = 120) -> str:
     )
 
 
+def dump_yaml(
+    data: dict[str, Any],
+    width: int = 120,
+    dumper: type | None = None,
+) -> str:
+    """Dump data to YAML string."""
+    stream = io.StringIO()
+    write_yaml(data, stream, width=width, dumper=dumper)
+    return stream.getvalue()
+
+
 def _section_header(title: str, description: str) -> str:
     """Generate a section header comment block."""
     return (
@@ -41,31 +133,56 @@ def _section_header(title: str, description: str) -> str:
     )
 
 
+def dump_yaml_section(key: str, title: str, description: str, data: Any) -> str:
+    """Dump one top-level key as YAML, preceded by a comment header."""
+    return _section_header(title, description) + dump_yaml({key: data})
+
+
+def write_yaml_sections(
+    sections: Iterable[tuple[str, str, str, dict[str, Any]]],
+    stream: TextIO,
+) -> None:
+    """Write multiple YAML sections to a text stream, each with a comment header.
+
+    Sections are written one at a time, so ``sections`` may be a generator
+    that only builds each section's data when it is reached.
+
+    Args:
+        sections: Iterable of (key, title, description, data) tuples.
+        stream: Text stream to write to.
+    """
+    for index, (key, title, description, data) in enumerate(sections):
+        with phase(f"emit {key}"):
+            if index:
+                stream.write("\n")
+            stream.write(_section_header(title, description))
+            write_yaml({key: data}, stream)
+
+
 def dump_yaml_sections(
-    sections: list[tuple[str, str, str, dict[str, Any]]],
+    sections: Iterable[tuple[str, str, str, dict[str, Any]]],
 ) -> str:
     """Dump multiple YAML sections, each with a comment header.
 
     Args:
-        sections: List of (key, title, description, data) tuples.
+        sections: Iterable of (key, title, description, data) tuples.
 
     Returns:
         YAML string with section headers between top-level keys.
     """
-    parts: list[str] = []
-    for key, title, description, data in sections:
-        header = _section_header(title, description)
-        yaml_str = dump_yaml({key: data})
-        parts.append(header + yaml_str)
-    return "\n".join(parts)
+    stream = io.StringIO()
+    write_yaml_sections(sections, stream)
+    return stream.getvalue()
 
 
-def dump_yaml_with_header(
+def write_yaml_with_header(
     data: dict[str, Any],
     file_type: str,
     config: PlatformConfig,
-) -> str:
-    """Dump YAML with a descriptive header."""
+    stream: TextIO,
+    dumper: type | None = None,
+) -> None:
+    """Write YAML with a descriptive header to a text stream."""
     header = f"""# =============================================================================
 # Governance Platform - {file_type.upper()} FILE
 # =============================================================================
@@ -92,4 +209,17 @@ def dump_yaml_with_header(
 
 """
 
-    return header + dump_yaml(data)
+    stream.write(header)
+    write_yaml(data, stream, dumper=dumper)
+
+
+def dump_yaml_with_header(
+    data: dict[str, Any],
+    file_type: str,
+    config: PlatformConfig,
+    dumper: type | None = None,
+) -> str:
+    """Dump YAML with a descriptive header."""
+    stream = io.StringIO()
+    write_yaml_with_header(data, file_type, config, stream, dumper=dumper)
+    return stream.getvalue()
@@ -0,0 +1,38 @@
+"""Envelope encryption: data keys and sealed files."""
+
+import io
+
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from govctl.utils.envelope import DataKey, Decrypter, EnvelopeError
+
+
+@pytest.fixture(scope="module")
+def private_key():
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+def test_data_key_repr_leaves_out_the_key(private_key):
+    data_key = DataKey.create(private_key.public_key())
+    text = repr(data_key)
+    assert data_key.key.hex() not in text
+    assert repr(data_key.key) not in text
+    assert "key_id=" in text
+
+
+def test_sealed_content_decrypts(private_key):
+    data_key = DataKey.create(private_key.public_key())
+    sealed = data_key.seal("apiVersion: v1\n")
+    assert Decrypter(private_key).decrypt(io.BytesIO(sealed)) == b"apiVersion: v1\n"
+
+
+def test_writer_that_raised_leaves_no_valid_envelope(private_key):
+    data_key = DataKey.create(private_key.public_key())
+    stream = io.BytesIO()
+    with pytest.raises(RuntimeError):
+        with data_key.writer(stream) as f:
+            f.write("partial")
+            raise RuntimeError("generator failed")
+    with pytest.raises(EnvelopeError):
+        Decrypter(private_key).decrypt(io.BytesIO(stream.getvalue()))
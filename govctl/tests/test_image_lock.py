@@ -0,0 +1,105 @@
+"""Image locks: every image a locked install deploys is pinned to a digest."""
+
+import dataclasses
+from typing import Any, Iterator
+
+import pytest
+import yaml
+
+from govctl.core.image_lock import LOCK_NAMES, load_image_lock
+from govctl.core.models import (
+    AuthProvider,
+    CloudProvider,
+    DatabaseMode,
+    PlatformConfig,
+)
+from govctl.generators.values import generate_values
+
+DIGEST = "sha256:" + "ab" * 32
+
+LOCK = {
+    name: f"ghcr.io/eqtylab/{name}:1.1.1@{DIGEST}"
+    for name in LOCK_NAMES
+    if name not in ("postgresql", "pgbouncer")
+}
+LOCK["postgresql"] = f"bitnamilegacy/postgresql:17-debian-12@{DIGEST}"
+LOCK["pgbouncer"] = f"docker.io/bitnamilegacy/pgbouncer:1-debian-12@{DIGEST}"
+
+BASE = PlatformConfig(
+    cloud_provider=CloudProvider.GCP,
+    domain="governance.example.com",
+    environment="staging",
+    auth_provider=AuthProvider.KEYCLOAK,
+    enable_pgbouncer=True,
+)
+
+
+def _lock(tmp_path, images: dict[str, str]):
+    path = tmp_path / "images.lock.yaml"
+    path.write_text(yaml.safe_dump({"images": images}))
+    return load_image_lock(path)
+
+
+def _images(values: Any) -> Iterator[dict[str, Any]]:
+    """Every ``image`` mapping in generated values."""
+    if isinstance(values, dict):
+        for key, value in values.items():
+            if key == "image" and isinstance(value, dict):
+                yield value
+            else:
+                yield from _images(value)
+    elif isinstance(values, list):
+        for value in values:
+            yield from _images(value)
+
+
+def test_locked_pgbouncer_install_pins_every_image(tmp_path):
+    config = dataclasses.replace(BASE, images=_lock(tmp_path, LOCK))
+    values = yaml.safe_load(generate_values(config))
+
+    assert values["pgbouncer"]["image"] == {
+        "registry": "docker.io",
+        "repository": "bitnamilegacy/pgbouncer",
+        "tag": f"1-debian-12@{DIGEST}",
+        "pullPolicy": "IfNotPresent",
+    }
+    assert values["postgresql"]["image"] == {
+        "registry": "docker.io",
+        "repository": "bitnamilegacy/postgresql",
+        "tag": f"17-debian-12@{DIGEST}",
+        "pullPolicy": "IfNotPresent",
+    }
+    images = list(_images(values))
+    assert images
+    for image in images:
+        assert image["tag"].endswith(f"@{DIGEST}"), image
+        assert image["pullPolicy"] == "IfNotPresent", image
+
+
+@pytest.mark.parametrize("name", ["pgbouncer", "postgresql"])
+def test_lock_without_a_deployed_database_image_is_rejected(tmp_path, name):
+    lock = _lock(tmp_path, {k: v for k, v in LOCK.items() if k != name})
+    with pytest.raises(ValueError, match=f"no entry for: {name}"):
+        dataclasses.replace(BASE, images=lock)
+
+
+def test_lock_needs_only_the_images_the_config_deploys(tmp_path):
+    lock = _lock(
+        tmp_path,
+        {k: v for k, v in LOCK.items() if k not in ("postgresql", "pgbouncer")},
+    )
+    config = dataclasses.replace(
+        BASE,
+        enable_pgbouncer=False,
+        database_mode=DatabaseMode.EXTERNAL,
+        images=lock,
+    )
+    values = yaml.safe_load(generate_values(config))
+    assert values["postgresql"] == {"enabled": False}
+    assert "pgbouncer" not in values
+
+
+def test_unlocked_install_keeps_the_charts_database_images():
+    values = yaml.safe_load(generate_values(BASE))
+    assert "image" not in values["postgresql"]
+    assert "image" not in values["pgbouncer"]
@@ -0,0 +1,84 @@
+"""Cold-start imports of `govctl --help` and each subcommand's help."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+GOVCTL_DIR = Path(__file__).resolve().parent.parent
+
+# Invocations that must stay cheap, as arguments to `govctl`
+INVOCATIONS = (
+    ["--help"],
+    ["--version"],
+    ["init", "--help"],
+    ["fleet", "--help"],
+    ["effective-values", "--help"],
+    ["render-secrets", "--help"],
+    ["diff", "--help"],
+    ["serve", "--help"],
+    ["decrypt", "--help"],
+)
+
+# Modules (and their submodules) that must not be imported just to show help
+DEFERRED = ("rich", "yaml", "cryptography", "govctl.generators", "govctl.core.manifest")
+
+# Import time govctl may add per invocation, best of RUNS; generous, as CI
+# machines are slower and noisier than a workstation (about 25 ms there)
+BUDGET_MS = 80.0
+RUNS = 5
+
+
+def _import_times(code: str) -> dict[str, int]:
+    """Self import time in microseconds per module for running ``code``.
+
+    The exit status is ignored: only the imports matter here (``--version``
+    fails when running from an uninstalled source tree).
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=GOVCTL_DIR,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = int(self_us)
+    return times
+
+
+def _govctl_code(args: list[str]) -> str:
+    return (
+        "from govctl.cli.main import cli\n"
+        f"try:\n    cli({args!r})\nexcept SystemExit:\n    pass\n"
+    )
+
+
+@pytest.fixture(scope="module")
+def interpreter_modules() -> set[str]:
+    return set(_import_times("pass"))
+
+
+@pytest.mark.parametrize("invocation", INVOCATIONS, ids=" ".join)
+def test_help_imports_stay_within_budget(invocation, interpreter_modules):
+    best_ms, added = None, {}
+    for _ in range(RUNS):
+        times = _import_times(_govctl_code(invocation))
+        added = {
+            name: us for name, us in times.items() if name not in interpreter_modules
+        }
+        ms = sum(added.values()) / 1000
+        best_ms = ms if best_ms is None else min(best_ms, ms)
+
+    deferred = sorted(
+        name
+        for name in added
+        if any(name == d or name.startswith(d + ".") for d in DEFERRED)
+    )
+    assert not deferred, f"imports {', '.join(deferred)}"
+    assert best_ms <= BUDGET_MS
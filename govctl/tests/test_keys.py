@@ -0,0 +1,56 @@
+"""Deterministic key derivation."""
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from govctl.core.models import KeyAlgorithm
+from govctl.generators.keys import (
+    _is_probable_prime,
+    _is_strong_lucas_probable_prime,
+    key_algorithm_of,
+    private_key_from_seed,
+)
+
+SEED = bytes(range(32))
+
+# Strong Lucas pseudoprimes (OEIS A217255) and strong pseudoprimes to base 2
+# (OEIS A001262): each passes one half of the test, and fails the other
+LUCAS_PSEUDOPRIMES = (5459, 5777, 10877, 16109, 18971)
+BASE_2_PSEUDOPRIMES = (2047, 3277, 4033, 4681, 8321)
+
+
+@pytest.mark.parametrize("algorithm", list(KeyAlgorithm))
+def test_derived_keys_are_deterministic(algorithm):
+    pem = private_key_from_seed(algorithm, SEED)
+    assert private_key_from_seed(algorithm, SEED) == pem
+    assert private_key_from_seed(algorithm, bytes(32)) != pem
+    assert key_algorithm_of(pem) == algorithm
+
+
+@pytest.mark.parametrize("algorithm", [KeyAlgorithm.RSA_2048, KeyAlgorithm.RSA_3072])
+def test_derived_rsa_keys_pass_validation(algorithm):
+    # Loading without unsafe_skip_rsa_key_validation runs OpenSSL's key check,
+    # which tests p and q for primality itself
+    key = serialization.load_pem_private_key(
+        private_key_from_seed(algorithm, SEED).encode(), password=None
+    )
+    assert isinstance(key, rsa.RSAPrivateKey)
+    numbers = key.private_numbers()
+    assert numbers.public_numbers.e == 65537
+    assert numbers.p.bit_length() == numbers.q.bit_length() == key.key_size // 2
+
+
+def test_strong_lucas_test():
+    primes = [n for n in range(5, 3000, 2) if all(n % k for k in range(3, n, 2))]
+    assert all(_is_strong_lucas_probable_prime(n) for n in primes)
+    assert not any(
+        _is_strong_lucas_probable_prime(n) for n in range(9, 3000, 2) if n not in primes
+    )
+    assert all(_is_strong_lucas_probable_prime(n) for n in LUCAS_PSEUDOPRIMES)
+    assert not any(_is_strong_lucas_probable_prime(n) for n in BASE_2_PSEUDOPRIMES)
+
+
+def test_miller_rabin_rejects_lucas_pseudoprimes():
+    randomness = bytes(range(1, 65))
+    assert not any(_is_probable_prime(n, randomness) for n in LUCAS_PSEUDOPRIMES)
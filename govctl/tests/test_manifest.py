@@ -0,0 +1,55 @@
+"""Fleet manifest entries: config_from_dict validation."""
+
+import pytest
+
+from govctl.core.manifest import config_from_dict
+from govctl.core.models import AuthProvider, KeyAlgorithm
+
+BASE = {
+    "cloud_provider": "gcp",
+    "domain": "governance.example.com",
+    "environment": "staging",
+}
+
+
+@pytest.mark.parametrize("auth_provider", ["auth0", "entra"])
+def test_key_algorithm_is_rejected_without_keycloak(auth_provider):
+    data = {
+        **BASE,
+        "auth_provider": auth_provider,
+        "token_exchange_key_algorithm": "ec-p256",
+    }
+    with pytest.raises(ValueError, match="token_exchange_key_algorithm"):
+        config_from_dict(data)
+
+
+def test_key_algorithm_is_accepted_with_keycloak():
+    config = config_from_dict(
+        {
+            **BASE,
+            "auth_provider": "keycloak",
+            "token_exchange_key_algorithm": "ec-p256",
+        }
+    )
+    assert config.auth_provider == AuthProvider.KEYCLOAK
+    assert config.keycloak.token_exchange_key_algorithm == KeyAlgorithm.EC_P256
+
+
+def test_null_key_algorithm_keeps_the_default_for_any_provider():
+    data = {**BASE, "auth_provider": "auth0", "token_exchange_key_algorithm": None}
+    assert config_from_dict(data).auth_provider == AuthProvider.AUTH0
+
+
+@pytest.mark.parametrize(
+    "field, value",
+    [
+        ("domain", ["governance.example.com"]),
+        ("enable_ingress", "yes"),
+        ("postgresql_read_replicas", 1.5),
+        ("postgresql_read_replicas", True),
+    ],
+)
+def test_mistyped_fields_name_the_field(field, value):
+    data = {**BASE, "auth_provider": "keycloak", field: value}
+    with pytest.raises(ValueError, match=field):
+        config_from_dict(data)
@@ -0,0 +1,24 @@
+"""Output cache: keys depend on what the generators read, not on the cwd."""
+
+from pathlib import Path
+
+from govctl.generators.output_cache import cache_key
+
+FINGERPRINTS = {"global": "a" * 64, "auth": "b" * 64}
+
+
+def test_cache_key_does_not_depend_on_the_working_directory(tmp_path, monkeypatch):
+    key = cache_key("values", FINGERPRINTS)
+    # A directory with charts of other versions, as a different checkout has
+    chart = tmp_path / "charts" / "governance-platform"
+    chart.mkdir(parents=True)
+    (chart / "Chart.yaml").write_text("name: governance-platform\nversion: 9.9.9\n")
+    for cwd in (tmp_path, chart, Path("/")):
+        monkeypatch.chdir(cwd)
+        assert cache_key("values", FINGERPRINTS) == key
+
+
+def test_cache_key_depends_on_kind_and_fingerprints():
+    key = cache_key("values", FINGERPRINTS)
+    assert cache_key("bootstrap", FINGERPRINTS) != key
+    assert cache_key("values", {**FINGERPRINTS, "auth": "c" * 64}) != key
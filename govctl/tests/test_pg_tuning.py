@@ -0,0 +1,159 @@
+"""PostgreSQL tuning: the derived settings per sizing tier."""
+
+import dataclasses
+
+import pytest
+
+from govctl.core.models import (
+    AuthProvider,
+    CloudProvider,
+    PlatformConfig,
+    SizingConfig,
+    SizingTier,
+)
+from govctl.core.pg_tuning import (
+    WORK_MEM_MIN_KB,
+    WORK_MEM_OPERATIONS,
+    PostgresqlTuning,
+    direct_connections,
+    memory_mb,
+    postgresql_tuning,
+    server_max_connections,
+)
+from govctl.core.pooling import POOLER_REPLICAS, pool_settings
+from govctl.core.sizing import POSTGRESQL_RESOURCES
+from govctl.generators.sections.postgresql import generate_postgresql_section
+
+BASE = PlatformConfig(
+    cloud_provider=CloudProvider.GCP,
+    domain="governance.example.com",
+    environment="staging",
+    auth_provider=AuthProvider.KEYCLOAK,
+)
+
+# Expected settings per tier (None: unsized), without and with PgBouncer, so
+# that a change to the formulas shows up as a deliberate edit here
+EXPECTED: dict[tuple[SizingTier | None, bool], dict[str, str]] = {
+    (None, False): {
+        "max_connections": "110",
+        "shared_buffers": "512MB",
+        "effective_cache_size": "1536MB",
+        "work_mem": "4369kB",
+        "maintenance_work_mem": "128MB",
+        "max_wal_size": "1024MB",
+        "max_parallel_workers_per_gather": "1",
+    },
+    (SizingTier.SMALL, True): {
+        "max_connections": "100",
+        "shared_buffers": "512MB",
+        "effective_cache_size": "1536MB",
+        "work_mem": "4805kB",
+        "maintenance_work_mem": "128MB",
+        "max_wal_size": "1024MB",
+        "max_parallel_workers_per_gather": "1",
+    },
+    (SizingTier.MEDIUM, True): {
+        "max_connections": "100",
+        "shared_buffers": "1024MB",
+        "effective_cache_size": "3072MB",
+        "work_mem": "9611kB",
+        "maintenance_work_mem": "256MB",
+        "max_wal_size": "5120MB",
+        "max_parallel_workers_per_gather": "1",
+    },
+    (SizingTier.LARGE, True): {
+        "max_connections": "200",
+        "shared_buffers": "2048MB",
+        "effective_cache_size": "6144MB",
+        "work_mem": "4805kB",
+        "maintenance_work_mem": "512MB",
+        "max_wal_size": "16384MB",
+        "max_parallel_workers_per_gather": "2",
+    },
+    (SizingTier.LARGE, False): {
+        "max_connections": "1020",
+        "work_mem": "942kB",
+    },
+}
+
+# Settings that must not shrink from one tier to the next
+MONOTONIC = (
+    "shared_buffers_mb",
+    "effective_cache_size_mb",
+    "maintenance_work_mem_mb",
+    "max_wal_size_mb",
+    "max_parallel_workers",
+)
+
+TIERS = [None, *SizingTier]
+
+
+def _tier_id(tier: SizingTier | None) -> str:
+    return tier.value if tier else "unsized"
+
+
+def _config(tier: SizingTier | None, pooled: bool) -> PlatformConfig:
+    return dataclasses.replace(
+        BASE, enable_pgbouncer=pooled, sizing=SizingConfig(tier=tier)
+    )
+
+
+def _tuning(config: PlatformConfig) -> PostgresqlTuning:
+    tuning = postgresql_tuning(config)
+    assert tuning is not None
+    return tuning
+
+
+@pytest.mark.parametrize(
+    "tier, pooled",
+    list(EXPECTED),
+    ids=[f"{_tier_id(tier)}-pooled={pooled}" for tier, pooled in EXPECTED],
+)
+def test_expected_settings(tier, pooled):
+    settings = _tuning(_config(tier, pooled)).settings()
+    expected = EXPECTED[tier, pooled]
+    assert {name: settings[name] for name in expected} == expected
+
+
+@pytest.mark.parametrize("pooled", [False, True])
+@pytest.mark.parametrize("tier", TIERS, ids=_tier_id)
+def test_memory_and_connection_budget(tier, pooled):
+    config = dataclasses.replace(_config(tier, pooled), postgresql_read_replicas=2)
+    tuning = _tuning(config)
+    resources = POSTGRESQL_RESOURCES[tier or SizingTier.SMALL]
+    ram_kb = memory_mb(resources.memory_limit) * 1024
+    used_kb = (
+        tuning.shared_buffers_mb * 1024
+        + tuning.maintenance_work_mem_mb * 1024
+        + tuning.max_connections
+        * WORK_MEM_OPERATIONS
+        * tuning.max_parallel_workers_per_gather
+        * tuning.work_mem_kb
+    )
+    if tuning.work_mem_kb > WORK_MEM_MIN_KB:
+        assert used_kb <= ram_kb
+    assert tuning.min_wal_size_mb <= tuning.max_wal_size_mb
+
+    if pooled:
+        pools = pool_settings(config, server_max_connections(config))
+        used = pools.default_pool_size * len(pools.client_demand) * POOLER_REPLICAS
+        assert used <= pools.server_budget
+    else:
+        assert tuning.max_connections >= direct_connections(config)
+
+
+@pytest.mark.parametrize("pooled", [False, True])
+def test_larger_tiers_never_get_smaller_settings(pooled):
+    tunings = [_tuning(_config(tier, pooled)) for tier in SizingTier]
+    for smaller, larger in zip(tunings, tunings[1:]):
+        for name in MONOTONIC:
+            assert getattr(larger, name) >= getattr(smaller, name), name
+
+
+@pytest.mark.parametrize("tier", TIERS, ids=_tier_id)
+def test_section_carries_the_tuning(tier):
+    config = dataclasses.replace(_config(tier, False), postgresql_read_replicas=2)
+    section = generate_postgresql_section(config)
+    conf = _tuning(config).to_conf()
+    assert section["primary"]["extendedConfiguration"] == conf
+    assert section["readReplicas"]["extendedConfiguration"] == conf
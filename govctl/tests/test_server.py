@@ -0,0 +1,77 @@
+"""govctl serve: request framing on keep-alive connections."""
+
+import socket
+import threading
+
+import pytest
+
+from govctl.cli.server import GenerationServer, GenerationService
+
+SMUGGLED = b"GET /healthz HTTP/1.1\r\nHost: localhost\r\n\r\n"
+
+
+@pytest.fixture(scope="module")
+def address():
+    service = GenerationService(workers=1)
+    server = GenerationServer(("127.0.0.1", 0), service)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server.server_address
+    server.shutdown()
+    server.server_close()
+    service.shutdown()
+
+
+def _exchange(address, request: bytes) -> bytes:
+    """Send raw bytes and read until the server closes or goes quiet."""
+    with socket.create_connection(address, timeout=5) as sock:
+        sock.sendall(request)
+        sock.settimeout(1)
+        response = b""
+        try:
+            while chunk := sock.recv(65536):
+                response += chunk
+        except TimeoutError:
+            pass
+    return response
+
+
+def _chunked(body: bytes) -> bytes:
+    return b"%x\r\n%s\r\n0\r\n\r\n" % (len(body), body)
+
+
+@pytest.mark.parametrize(
+    "headers",
+    [
+        b"Transfer-Encoding: chunked\r\n",
+        b"Content-Length: 0\r\nTransfer-Encoding: chunked\r\n",
+        b"Transfer-Encoding: chunked\r\nContent-Length: 0\r\n",
+    ],
+)
+def test_unread_chunked_body_is_not_parsed_as_a_request(address, headers):
+    request = (
+        b"POST /generate HTTP/1.1\r\nHost: localhost\r\n"
+        + headers
+        + b"\r\n"
+        + _chunked(SMUGGLED)
+    )
+    response = _exchange(address, request)
+    assert response.startswith(b"HTTP/1.1 411 ")
+    assert b"Connection: close" in response
+    assert response.count(b"HTTP/1.1 ") == 1
+
+
+def test_conflicting_content_lengths_are_rejected(address):
+    request = (
+        b"POST /generate HTTP/1.1\r\nHost: localhost\r\n"
+        b"Content-Length: 0\r\nContent-Length: %d\r\n\r\n" % len(SMUGGLED) + SMUGGLED
+    )
+    response = _exchange(address, request)
+    assert response.startswith(b"HTTP/1.1 400 ")
+    assert response.count(b"HTTP/1.1 ") == 1
+
+
+def test_bodyless_requests_keep_the_connection_alive(address):
+    response = _exchange(address, SMUGGLED * 2)
+    assert response.count(b"HTTP/1.1 200 ") == 2
+    assert b"Connection: close" not in response
@@ -0,0 +1,149 @@
+"""Capacity sizing: the derived table per tier and its invariants."""
+
+import dataclasses
+import itertools
+
+import pytest
+
+from govctl.core.chart_index import check_values as check_chart_keys
+from govctl.core.models import (
+    AuthProvider,
+    CloudProvider,
+    PlatformConfig,
+    SizingConfig,
+    SizingTier,
+)
+from govctl.core.sizing import (
+    MAX_REPLICAS_CAP,
+    SERVICE_RULES,
+    TIER_LOADS,
+    Load,
+    Resources,
+    load_tier,
+    postgresql_storage_gb,
+    size_service,
+)
+from govctl.generators.values import UMBRELLA_CHART, sections_for
+
+# Expected replica counts per tier's reference load, so that a change to the
+# rules shows up as a deliberate edit here
+EXPECTED_REPLICAS: dict[SizingTier, dict[str, int]] = {
+    SizingTier.SMALL: {
+        "auth-service": 2,
+        "governance-service": 2,
+        "governance-studio": 1,
+        "integrity-service": 2,
+        "eqty-pdfgen": 1,
+    },
+    SizingTier.MEDIUM: {
+        "auth-service": 2,
+        "governance-service": 2,
+        "governance-studio": 1,
+        "integrity-service": 2,
+        "eqty-pdfgen": 1,
+    },
+    SizingTier.LARGE: {
+        "auth-service": 3,
+        "governance-service": 10,
+        "governance-studio": 3,
+        "integrity-service": 10,
+        "eqty-pdfgen": 3,
+    },
+}
+
+# Load figures swept for the invariant and monotonicity checks
+SWEEP = (0, 1, 10, 50, 100, 250, 500, 1000, 5000, 20000)
+LOADS = [Load(*figures) for figures in itertools.product(SWEEP, repeat=3)]
+
+BASE = PlatformConfig(
+    cloud_provider=CloudProvider.GCP,
+    domain="governance.example.com",
+    environment="staging",
+    auth_provider=AuthProvider.KEYCLOAK,
+)
+
+_UNITS = {"m": 0.001, "Ki": 2**10, "Mi": 2**20, "Gi": 2**30}
+
+
+def _quantity(value: str) -> float:
+    """A Kubernetes CPU or memory quantity as a number."""
+    for suffix, scale in _UNITS.items():
+        if value.endswith(suffix):
+            return float(value[: -len(suffix)]) * scale
+    return float(value)
+
+
+def _amounts(resources: Resources) -> tuple[float, ...]:
+    return tuple(
+        _quantity(v)
+        for v in (
+            resources.cpu_request,
+            resources.memory_request,
+            resources.cpu_limit,
+            resources.memory_limit,
+        )
+    )
+
+
+def _measures(load: Load) -> tuple[float, ...]:
+    values: list[float] = [postgresql_storage_gb(load)]
+    for service in SERVICE_RULES:
+        sizing = size_service(service, load)
+        values += [sizing.replicas, sizing.max_replicas]
+        values += _amounts(sizing.resources)
+    return tuple(values)
+
+
+def _sections(config: PlatformConfig) -> dict[str, dict]:
+    return {section.key: section.generate(config) for section in sections_for(config)}
+
+
+@pytest.mark.parametrize("tier", list(SizingTier), ids=lambda tier: tier.value)
+def test_tier_replicas(tier):
+    actual = {
+        service: size_service(service, TIER_LOADS[tier]).replicas
+        for service in EXPECTED_REPLICAS[tier]
+    }
+    assert actual == EXPECTED_REPLICAS[tier]
+    assert load_tier(TIER_LOADS[tier]) == tier
+
+
+@pytest.mark.parametrize("service", list(SERVICE_RULES))
+def test_service_invariants(service):
+    rule = SERVICE_RULES[service]
+    for load in LOADS:
+        sizing = size_service(service, load)
+        assert rule.min_replicas <= sizing.replicas <= sizing.max_replicas, load
+        # Room to scale out, unless at the cap
+        assert sizing.replicas < sizing.max_replicas or (
+            sizing.max_replicas == MAX_REPLICAS_CAP
+        ), load
+        assert sizing.max_replicas <= MAX_REPLICAS_CAP, load
+        cpu_req, mem_req, cpu_lim, mem_lim = _amounts(sizing.resources)
+        assert cpu_req <= cpu_lim and mem_req <= mem_lim, load
+        if sizing.replicas < MAX_REPLICAS_CAP:
+            capacity = sizing.replicas * rule.rps_per_replica
+            assert capacity >= load.rps * rule.rps_share, load
+
+
+@pytest.mark.parametrize("field", ["rps", "users", "artifact_gb"])
+def test_growing_load_never_shrinks_sizing(field):
+    for load in LOADS:
+        grown = dataclasses.replace(load, **{field: getattr(load, field) * 2 + 1})
+        base, larger = _measures(load), _measures(grown)
+        assert all(a <= b for a, b in zip(base, larger)), load
+
+
+def test_unsized_config_keeps_fixed_sizing():
+    sections = _sections(BASE)
+    for service in SERVICE_RULES:
+        assert "autoscaling" not in sections[service], service
+
+
+@pytest.mark.parametrize("tier", list(SizingTier), ids=lambda tier: tier.value)
+def test_sized_values(tier):
+    values = _sections(dataclasses.replace(BASE, sizing=SizingConfig(tier=tier)))
+    assert check_chart_keys(UMBRELLA_CHART, values) == []
+    for service in SERVICE_RULES:
+        section = values[service]
+        assert section["replicaCount"] == section["autoscaling"]["minReplicas"]
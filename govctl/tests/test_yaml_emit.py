@@ -0,0 +1,89 @@
+"""YAML emission: libyaml output and emitter-written REQUIRED comments."""
+
+import itertools
+import re
+from typing import Any
+
+import pytest
+
+from govctl.core.models import (
+    AuthProvider,
+    CloudProvider,
+    DatabaseMode,
+    KeyManagementProvider,
+    PlatformConfig,
+)
+from govctl.generators.outputs import generate_bootstrap
+from govctl.generators.secrets import _generate_secrets_section
+from govctl.generators.values import fragment_cache_clear, generate_values
+from govctl.utils import yaml as yaml_utils
+
+CONFIGS = [
+    PlatformConfig(
+        cloud_provider=cloud,
+        domain="governance.example.com",
+        environment="staging",
+        auth_provider=auth,
+        database_mode=database,
+        key_management_provider=key_management,
+    )
+    for cloud, auth, database, key_management in itertools.product(
+        CloudProvider, AuthProvider, DatabaseMode, KeyManagementProvider
+    )
+]
+
+
+def _id(config: PlatformConfig) -> str:
+    return (
+        f"{config.cloud_provider.value}-{config.auth_provider.value}-"
+        f"{config.database_mode.value}-{config.key_management_provider.value}"
+    )
+
+
+def _render_with(dumper: type, config: PlatformConfig) -> list[str]:
+    """Render values and bootstrap files with the given default dumper."""
+    fast_dumper = yaml_utils._FastDumper
+    yaml_utils._FastDumper = dumper
+    # Cached fragments would have been emitted by the other dumper
+    fragment_cache_clear()
+    try:
+        return [generate_values(config), generate_bootstrap(config) or ""]
+    finally:
+        yaml_utils._FastDumper = fast_dumper
+        fragment_cache_clear()
+
+
+def _to_legacy_markers(data: Any) -> Any:
+    if isinstance(data, dict):
+        return {key: _to_legacy_markers(value) for key, value in data.items()}
+    if isinstance(data, yaml_utils._RequiredStr):
+        return f"__REQUIRED__{data}"
+    return data
+
+
+def _legacy_secrets(data: dict[str, Any]) -> str:
+    """Secrets emission as done before: dump marker strings, then regex them."""
+    yaml_str = yaml_utils.dump_yaml(
+        _to_legacy_markers(data), dumper=yaml_utils._CommentDumper
+    )
+    return re.sub(
+        r"(?<=: )'?__REQUIRED__(.+?)'?$",
+        r"''  # REQUIRED: \1",
+        yaml_str,
+        flags=re.M,
+    )
+
+
+@pytest.mark.parametrize("config", CONFIGS, ids=_id)
+def test_fast_dumper_matches_python_dumper(config):
+    assert _render_with(yaml_utils._FastDumper, config) == _render_with(
+        yaml_utils._CommentDumper, config
+    )
+
+
+@pytest.mark.parametrize("config", CONFIGS, ids=_id)
+def test_required_comments_match_regex_pass(config):
+    data = {"global": {"secrets": _generate_secrets_section(config)}}
+    emitted = yaml_utils.dump_yaml(data, dumper=yaml_utils._CommentDumper)
+    assert emitted == _legacy_secrets(data)
+    assert "# REQUIRED:" in emitted